@@ -1,2 +1,89 @@
-from .jsonpath import *  # noqa: F403
-from .parser import parse  # noqa: F401
+import importlib
+
+from .jsonpath import (
+    LIST_KEY,
+    NOT_SET,
+    PATH_CACHE_SIZE,
+    ROOT,
+    THIS,
+    AutoIdForDatum,
+    Child,
+    Contains,
+    DatumInContext,
+    Descendants,
+    Fields,
+    FlatUnion,
+    Index,
+    Intersect,
+    JSONPath,
+    Parent,
+    Root,
+    Slice,
+    StaticPath,
+    This,
+    Union,
+    Where,
+    auto_id_field,
+    field_path,
+    index_path,
+)
+
+# Not imported from `typing`, see `jsonpath`
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .bulk import parse_many
+    from .parser import parse
+
+__all__ = [
+    "LIST_KEY",
+    "NOT_SET",
+    "PATH_CACHE_SIZE",
+    "ROOT",
+    "THIS",
+    "AutoIdForDatum",
+    "Child",
+    "Contains",
+    "DatumInContext",
+    "Descendants",
+    "Fields",
+    "FlatUnion",
+    "Index",
+    "Intersect",
+    "JSONPath",
+    "Parent",
+    "Root",
+    "Slice",
+    "StaticPath",
+    "This",
+    "Union",
+    "Where",
+    "auto_id_field",
+    "field_path",
+    "index_path",
+    "parse",
+    "parse_many",
+]
+
+# Submodules also reachable as attributes of the package, imported on first access
+_SUBMODULES = ("exceptions", "jsonpath", "lexer", "parser")
+
+
+def __getattr__(name):
+    # The parser pulls in the parsing machinery, it is only imported when `parse` is first used
+    if name == "parse":
+        from .parser import parse
+
+        globals()["parse"] = parse
+        return parse
+    if name == "parse_many":
+        from .bulk import parse_many
+
+        globals()["parse_many"] = parse_many
+        return parse_many
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), "parse", "parse_many", *_SUBMODULES})
@@ -15,7 +15,8 @@ import json
 import sys
 
 # JsonPath-RW imports
-from bc_jsonpath_ng import parse
+from bc_jsonpath_ng import parse, stream
+from bc_jsonpath_ng.exceptions import JsonPathStreamError
 
 
 def find_matches_for_file(expr, f):
@@ -26,6 +27,12 @@ def print_matches(matches):
     print("\n".join([f"{match.value}" for match in matches]))  # noqa: T201
 
 
+def print_stream_matches(expr, f):
+    # Each match as soon as it is read
+    for value in stream.find_values(expr, f):
+        print(f"{value}")  # noqa: T201
+
+
 def main(*argv):
     parser = argparse.ArgumentParser(
         description="Search JSON files (or stdin) according to a JSONPath expression.",
@@ -52,13 +59,29 @@ def main(*argv):
 
     parser.add_argument("expression", help="A JSONPath expression.")
     parser.add_argument("files", metavar="file", nargs="*", help="Files to search (if none, searches stdin)")
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Print the matches while reading, without loading the whole file\n"
+        "(only $, fields, indices, slices and .. can be streamed).",
+    )
 
     args = parser.parse_args(argv[1:])
 
     expr = parse(args.expression)
     glob_patterns = args.files
 
-    if len(glob_patterns) == 0:
+    if args.stream:
+        try:
+            if len(glob_patterns) == 0:
+                print_stream_matches(expr, sys.stdin)
+            for pattern in glob_patterns:
+                for filename in glob.glob(pattern):
+                    with open(filename, "rb") as f:
+                        print_stream_matches(expr, f)
+        except JsonPathStreamError as e:
+            parser.error(str(e))
+    elif len(glob_patterns) == 0:
         # stdin mode
         print_matches(find_matches_for_file(expr, sys.stdin))
     else:
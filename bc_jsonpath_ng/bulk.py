@@ -0,0 +1,136 @@
+"""
+Parsing of many expressions at once, e.g. all the expressions of a policy pack.
+
+`parse_many` compiles every distinct expression once, reuses the ASTs of the
+expression cache and can fan the cache misses out to a pool of processes.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Iterable, NamedTuple
+
+from bc_jsonpath_ng.cache import expression_cache, parser_for_thread
+from bc_jsonpath_ng.descent import JsonPathDescentParser
+from bc_jsonpath_ng.ext.descent import ExtendedJsonPathDescentParser
+from bc_jsonpath_ng.ext.parser import ExtentedJsonPathParser
+from bc_jsonpath_ng.parser import JsonPathParser, resolve_backend
+
+if TYPE_CHECKING:
+    from bc_jsonpath_ng.jsonpath import JSONPath
+
+# Quoted strings (possibly unterminated) are kept as they are, runs of the whitespace
+# the lexer skips between tokens are collapsed to a single space or dropped at both ends.
+_WHITESPACE = re.compile(r"""('(?:[^'\\]|\\.)*'?|"(?:[^"\\]|\\.)*"?|`(?:[^`\\]|\\.)*`?)|[ \t\n]+""", re.DOTALL)
+
+# The misses are split into this many chunks per process
+CHUNKS_PER_PROCESS = 4
+
+
+class ParseResult(NamedTuple):
+    """
+    The outcome of parsing one of the strings given to `parse_many`: either
+    the AST or the exception raised by the parser.
+    """
+
+    expression: JSONPath | None
+    error: Exception | None
+
+
+def normalize(string: str) -> str:
+    """
+    Returns `string` with the whitespace between tokens normalized, so that
+    expressions which only differ by their spacing share the same cache entry.
+    """
+
+    def replace(match: re.Match[str]) -> str:
+        if match.group(1):
+            return match.group(1)
+        return "" if match.start() == 0 or match.end() == len(string) else " "
+
+    return _WHITESPACE.sub(replace, string)
+
+
+def grammar_for(extended: bool = True, backend: str | None = None) -> type:
+    """
+    The parser class used by `parse` (`extended=False`) or `ext.parse` (`extended=True`) for `backend`.
+    """
+    if resolve_backend(backend) == "descent":
+        return ExtendedJsonPathDescentParser if extended else JsonPathDescentParser
+    return ExtentedJsonPathParser if extended else JsonPathParser
+
+
+def parse_many(
+    strings: Iterable[str],
+    extended: bool = True,
+    backend: str | None = None,
+    processes: int | None = None,
+) -> list[ParseResult]:
+    """
+    Parses all of `strings` and returns their results in the same order.
+
+    The strings are deduplicated after normalizing their whitespace, and the expressions
+    found in the expression cache are not compiled again. With `processes`, the remaining
+    ones are compiled by a pool of that many processes, otherwise in the calling thread.
+    All compiled expressions are added to the expression cache.
+
+    A string which fails to parse gets the exception in its `ParseResult`, the other
+    strings are not affected. The error is the one `parse` raises for the original string.
+    """
+    grammar = grammar_for(extended, backend)
+    strings = list(strings)
+    keys = [normalize(string) for string in strings]
+
+    expressions: dict[str, JSONPath] = {}
+    misses = []
+    for key in dict.fromkeys(keys):
+        expression = expression_cache.get(grammar, key)
+        if expression is None:
+            misses.append(key)
+        else:
+            expressions[key] = expression
+
+    errors: dict[str, Exception] = {}
+    for key, (expression, error, compile_time) in zip(misses, _compile_misses(grammar, misses, processes)):
+        if error is None:
+            expressions[key] = expression_cache.put(grammar, key, expression, compile_time)
+        else:
+            errors[key] = error
+
+    results = []
+    for string, key in zip(strings, keys):
+        if key not in errors:
+            results.append(ParseResult(expressions[key], None))
+            continue
+        if string not in errors:
+            # Report the error at its position in the original string
+            errors[string] = _compile(grammar, string)[1]
+        results.append(ParseResult(None, errors[string]))
+    return results
+
+
+def _compile_misses(grammar: type, strings: list[str], processes: int | None) -> list[tuple[Any, Any, float]]:
+    if not processes or len(strings) < 2:
+        return _compile_chunk(grammar, strings)
+
+    size = -(-len(strings) // (processes * CHUNKS_PER_PROCESS))
+    chunks = [strings[i : i + size] for i in range(0, len(strings), size)]
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [executor.submit(_compile_chunk, grammar, chunk) for chunk in chunks]
+        return [result for future in futures for result in future.result()]
+
+
+def _compile_chunk(grammar: type, strings: list[str]) -> list[tuple[Any, Any, float]]:
+    # Runs in the worker processes, so it must be a module level function
+    return [_compile(grammar, string) for string in strings]
+
+
+def _compile(grammar: type, string: str) -> tuple[JSONPath | None, Exception | None, float]:
+    start = time.perf_counter()
+    try:
+        expression = parser_for_thread(grammar).parse(string)
+    except Exception as e:
+        return None, e, 0.0
+    return expression, None, time.perf_counter() - start
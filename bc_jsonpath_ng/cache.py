@@ -0,0 +1,194 @@
+"""
+A process-wide cache of compiled JSONPath expressions.
+
+`parse()` and `ext.parse()` look expressions up here before building a new AST,
+so the cost of lexing and parsing a given string is paid once per grammar.
+The cached ASTs are shared between all callers and must be treated as immutable.
+
+On a miss, the expression is compiled by the parser instance of the calling thread
+(see `parser_for_thread`), so concurrent `parse()` calls neither share parse state
+nor set up a new parser every time.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from bc_jsonpath_ng.jsonpath import JSONPath
+
+DEFAULT_MAXSIZE = 4096
+
+_thread_parsers = threading.local()
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int | None
+    currsize: int
+    compile_time_saved: float
+
+
+class ExpressionCache:
+    """
+    A bounded, thread-safe LRU mapping of (grammar, expression string) to the parsed `JSONPath`.
+
+    The grammar is the parser class used to compile the expression, so the base and the
+    extended grammar (and any user subclass) never share entries.
+
+    `maxsize=None` makes the cache unbounded, `maxsize=0` disables it.
+    """
+
+    def __init__(self, maxsize: int | None = DEFAULT_MAXSIZE) -> None:
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[type, str], tuple[JSONPath, float]] = OrderedDict()
+        self._maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._compile_time_saved = 0.0
+
+    @property
+    def maxsize(self) -> int | None:
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int | None) -> None:
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def parse(self, grammar: Any, string: str) -> JSONPath:
+        """
+        Returns the cached AST of `string` for the parser class `grammar`,
+        compiling it with `parser_for_thread(grammar).parse(string)` on a miss.
+
+        Parse errors are raised to the caller and never cached.
+        """
+        expression = self.get(grammar, string)
+        if expression is None:
+            # Compile outside of the lock, concurrent misses on different strings should not serialize
+            start = time.perf_counter()
+            expression = parser_for_thread(grammar).parse(string)
+            expression = self.put(grammar, string, expression, time.perf_counter() - start)
+        return expression
+
+    def get(self, grammar: Any, string: str) -> JSONPath | None:
+        """
+        Returns the cached AST of `string` for the parser class `grammar`, or None.
+        """
+        key = (grammar, string)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            self._compile_time_saved += entry[1]
+            return entry[0]
+
+    def put(self, grammar: Any, string: str, expression: JSONPath, compile_time: float = 0.0) -> JSONPath:
+        """
+        Caches `expression`, compiled from `string` with the parser class `grammar` in `compile_time` seconds.
+
+        Returns the cached AST, which is an earlier one if another thread cached the same string in the meantime.
+        """
+        if self._maxsize == 0:
+            return expression
+
+        key = (grammar, string)
+        with self._lock:
+            entry = self._entries.setdefault(key, (expression, compile_time))
+            self._entries.move_to_end(key)
+            self._evict()
+        return entry[0]
+
+    def invalidate(self, string: str | None = None, grammar: Any = None) -> int:
+        """
+        Drops the entries matching `string` and/or `grammar` (all entries if neither is given)
+        and returns how many were removed.
+        """
+        with self._lock:
+            keys = [
+                key
+                for key in self._entries
+                if (grammar is None or key[0] is grammar) and (string is None or key[1] == string)
+            ]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        """
+        Drops every entry and resets the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+            self._compile_time_saved = 0.0
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                maxsize=self._maxsize,
+                currsize=len(self._entries),
+                compile_time_saved=self._compile_time_saved,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self) -> None:
+        # Must be called with the lock held
+        if self._maxsize is None:
+            return
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+
+expression_cache = ExpressionCache()
+
+
+def parser_for_thread(grammar: Any) -> Any:
+    """
+    Returns the instance of the parser class `grammar` reserved to the calling thread,
+    creating it on first use.
+
+    Parser instances keep the state of the expression being parsed, so an instance must
+    not be shared between threads; reusing one per thread saves setting up a new parser
+    for every expression.
+    """
+    try:
+        parsers = _thread_parsers.parsers
+    except AttributeError:
+        parsers = _thread_parsers.parsers = {}
+    parser = parsers.get(grammar)
+    if parser is None:
+        parser = parsers[grammar] = grammar()
+    return parser
+
+
+def cache_info() -> CacheInfo:
+    return expression_cache.cache_info()
+
+
+def cache_clear() -> None:
+    expression_cache.clear()
+
+
+def set_cache_size(maxsize: int | None) -> None:
+    expression_cache.maxsize = maxsize
+
+
+def invalidate(string: str | None = None, grammar: Any = None) -> int:
+    return expression_cache.invalidate(string, grammar)
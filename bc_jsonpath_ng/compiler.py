@@ -0,0 +1,618 @@
+"""
+Compiles an expression into a Python function equivalent to its `find()`.
+
+Each node becomes a closure taking the list of matches of the previous step and
+returning the list of its own matches, so a chain such as `$.a[*].b` runs one loop
+per step instead of a `find()` call, a `DatumInContext.wrap()` and a list per match.
+Matches are `[value, context, path]` lists; the paths are only built when asked for,
+in which case the matches are turned into `DatumInContext`s at the end.
+
+The closures follow the interpreter step by step, quirks included (e.g. a filter on
+a dict wraps it into a list, `[*]` on a string matches the string), so that the
+compiled function returns the same values, paths and contexts as `find()`. Nodes
+the compiler does not know about make the whole expression fall back to `find()`,
+as do auto ids and the few cases the closures leave to the interpreter at runtime.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, Iterator
+
+from bc_jsonpath_ng import jsonpath
+from bc_jsonpath_ng.ext.arithmetic import Constant, Operation
+from bc_jsonpath_ng.ext.columnar import apply
+from bc_jsonpath_ng.ext.filter import (
+    OPERATOR_MAP,
+    Expression,
+    Filter,
+    Negate,
+    _all_predicate,
+    _columnar_rows,
+    value_matcher,
+)
+from bc_jsonpath_ng.ext.iterable import Len
+from bc_jsonpath_ng.ext.string import Split, Str, Sub
+from bc_jsonpath_ng.jsonpath import (
+    NOT_SET,
+    ROOT,
+    THIS,
+    Child,
+    Contains,
+    DatumInContext,
+    Descendants,
+    Fields,
+    FlatUnion,
+    Index,
+    Intersect,
+    JSONPath,
+    Parent,
+    Root,
+    Slice,
+    StaticPath,
+    This,
+    Union,
+    Where,
+    _document_indexes,
+    _preorder,
+    field_path,
+    index_path,
+)
+
+# A match: [value, context match or None, path or None]
+Match = list
+Step = Callable[[list], list]
+
+LEN = Len()
+
+
+class _UnsupportedError(Exception):
+    """The expression has a node the compiler does not handle."""
+
+
+class _FallbackError(Exception):
+    """The data hits a case left to the interpreter."""
+
+
+def compile_expression(expression: JSONPath, paths: bool = False) -> Callable[[Any], list]:
+    """
+    Returns a function taking a document and returning the values `expression.find()`
+    matches in it, or the `DatumInContext`s themselves if `paths` is set.
+    """
+    if paths:
+        return _build(expression, True, _datums, list)
+    return _build(expression, False, _values, _datum_values)
+
+
+def compile_keys(expression: JSONPath) -> Callable[[Any], list[tuple]]:
+    """
+    Returns a function taking a document and returning the `full_path` of each match of
+    `expression.find()` as a tuple of field names and indices from the document root.
+    """
+    return _build(expression, True, _match_keys, _datum_keys)
+
+
+def _build(
+    expression: JSONPath,
+    paths: bool,
+    from_matches: Callable[[list], list],
+    from_datums: Callable[[list[DatumInContext]], list],
+) -> Callable[[Any], list]:
+    def interpreted(data: Any) -> list:
+        return from_datums(expression.find(data))
+
+    try:
+        step = _Compiler(paths).compile(expression, top=True)
+    except _UnsupportedError:
+        return interpreted
+
+    def compiled(data: Any) -> list:
+        if jsonpath.auto_id_field is not None or isinstance(data, DatumInContext):
+            return interpreted(data)
+        try:
+            found = step([data])
+        except _FallbackError:
+            # Nothing was changed in `data`, the matches only wrap it
+            return interpreted(data)
+        return from_matches(found)
+
+    return compiled
+
+
+def _indexed(match: Match, fields: tuple) -> Iterator[Match] | None:
+    # The matches of `..<fields>` from the index of the document, if it has one
+    from bc_jsonpath_ng.index import descendants
+
+    root = match
+    while root[1] is not None:
+        root = root[1]
+    return descendants(root[0], match, match[0], fields, _match)
+
+
+def _match(value: Any, path: Any, context: Match) -> Match:
+    return [value, context, path]
+
+
+def _values(found: list[Match]) -> list:
+    return [match[0] for match in found]
+
+
+def _datum_values(found: list[DatumInContext]) -> list:
+    return [datum.value for datum in found]
+
+
+def _datums(found: list[Match]) -> list[DatumInContext]:
+    datums: dict[int, DatumInContext] = {}
+    return [_datum(match, datums) for match in found]
+
+
+def _datum(match: Match, datums: dict[int, DatumInContext]) -> DatumInContext:
+    # Matches sharing a context share its `DatumInContext`, as they do with `find()`
+    datum = datums.get(id(match))
+    if datum is None:
+        value, context, path = match
+        context = None if context is None else _datum(context, datums)
+        datum = datums[id(match)] = DatumInContext(value, path=path, context=context)
+    return datum
+
+
+def _match_keys(found: list[Match]) -> list[tuple]:
+    keys = []
+    for match in found:
+        path = []
+        while match is not None:
+            path.append(match[2])
+            match = match[1]
+        keys.append(_keys(reversed(path)))
+    return keys
+
+
+def _datum_keys(found: list[DatumInContext]) -> list[tuple]:
+    keys = []
+    for datum in found:
+        path = []
+        while datum is not None:
+            path.append(datum.path)
+            datum = datum.context
+        keys.append(_keys(reversed(path)))
+    return keys
+
+
+def _keys(steps: Iterable) -> tuple:
+    keys: list = []
+    for step in steps:
+        cls = type(step)
+        if cls is Fields:
+            keys.append(step.fields[0])
+        elif cls is Index:
+            keys.append(step.index)
+        elif cls is str:
+            # The id field of an `AutoIdForDatum`
+            keys.append(step)
+        elif cls is Root:
+            # Only ever first, `full_path` starts over from it
+            keys.clear()
+    return tuple(keys)
+
+
+def _wrap(step: Step) -> Step:
+    # `find()` on a plain value first wraps it into a `DatumInContext` of its own
+    return lambda matches: step([[data, None, THIS] for data in matches])
+
+
+class _Compiler:
+    def __init__(self, paths: bool) -> None:
+        self.paths = paths
+        self.compilers: dict[type, Callable[[Any, bool], Step]] = {
+            Root: self.root,
+            This: self.this,
+            Parent: self.parent,
+            Child: self.child,
+            StaticPath: self.static_path,
+            Where: self.where,
+            Descendants: self.descendants,
+            Union: self.union,
+            FlatUnion: self.union,
+            Intersect: self.union,
+            Contains: self.contains,
+            Fields: self.fields,
+            Index: self.index,
+            Slice: self.slice,
+            Filter: self.filter,
+            Negate: self.filter,
+            Expression: self.expression,
+            Operation: self.operation,
+            Constant: self.constant,
+            Len: self.len,
+            Sub: self.sub,
+            Split: self.split,
+            Str: self.str,
+        }
+
+    def compile(self, node: JSONPath, top: bool = False) -> Step:  # noqa: A003
+        """
+        `top` tells whether the step is given the plain document rather than matches.
+        """
+        compiler = self.compilers.get(type(node))
+        if compiler is None:
+            raise _UnsupportedError(node)
+        return compiler(node, top)
+
+    def root(self, node: Root, top: bool) -> Step:
+        if top:
+            return lambda matches: [[data, None, ROOT] for data in matches]
+
+        def root(matches: list) -> list:
+            found = []
+            for match in matches:
+                while match[1] is not None:
+                    match = match[1]
+                found.append([match[0], None, ROOT])
+            return found
+
+        return root
+
+    def this(self, node: This, top: bool) -> Step:
+        return _wrap(list) if top else list
+
+    def parent(self, node: Parent, top: bool) -> Step:
+        def parent(matches: list) -> list:
+            found = []
+            for match in matches:
+                if match[1] is None:
+                    # `find()` returns None itself
+                    raise _FallbackError
+                found.append(match[1])
+            return found
+
+        return _wrap(parent) if top else parent
+
+    def child(self, node: Child, top: bool) -> Step:
+        left = self.compile(node.left, top)
+        right = self.compile(node.right)
+
+        def child(matches: list) -> list:
+            if len(matches) == 1:
+                return right(left(matches))
+            # `find()` finishes the left and right matches of one datum before the next one
+            found = []
+            for match in matches:
+                found.extend(right(left([match])))
+            return found
+
+        return child
+
+    def static_path(self, node: StaticPath, top: bool) -> Step:
+        keys = [(is_index, key, step) for (is_index, key), step in zip(node._keys, node.steps)]
+
+        def static_path(matches: list) -> list:
+            found = []
+            for match in matches:
+                for is_index, key, step in keys:
+                    value = match[0]
+                    if is_index:
+                        if not value or len(value) <= key:
+                            break
+                        match = [value[key], match, step]
+                    else:
+                        try:
+                            field_value = value.get(key, NOT_SET)
+                        except (TypeError, AttributeError):
+                            break
+                        if field_value is NOT_SET:
+                            break
+                        match = [field_value, match, step]
+                else:
+                    found.append(match)
+            return found
+
+        return _wrap(static_path) if top else static_path
+
+    def where(self, node: Where, top: bool) -> Step:
+        left = self.compile(node.left, top)
+        # `Where.find()` stops at the first match of the right side, later ones may raise:
+        # the interpreter tests it the same way
+        exists = node.right.exists
+
+        def where(matches: list) -> list:
+            found = []
+            datums: dict[int, DatumInContext] = {}
+            for match in matches:
+                found.extend(submatch for submatch in left([match]) if exists(_datum(submatch, datums)))
+            return found
+
+        return where
+
+    def contains(self, node: Contains, top: bool) -> Step:
+        left = self.compile(node.left, top)
+        try:
+            field = node.right.fields[0]
+        except (AttributeError, IndexError, TypeError):
+            raise _UnsupportedError(node) from None
+
+        def contains(matches: list) -> list:
+            found = []
+            for match in matches:
+                found.extend(submatch for submatch in left([match]) if field in submatch[0])
+            return found
+
+        return contains
+
+    def descendants(self, node: Descendants, top: bool) -> Step:
+        left = self.compile(node.left, top)
+        right = self.compile(node.right)
+        paths = self.paths
+
+        def children(match: Match) -> Iterator[Match]:
+            # Read after the right side, which may have wrapped a dict into a list
+            value = match[0]
+            if isinstance(value, list):
+                for i in range(len(value)):
+                    yield [value[i], match, index_path(i) if paths else None]
+            elif isinstance(value, dict):
+                for field in value:
+                    yield [value[field], match, field_path(field) if paths else None]
+
+        by_key = type(node.right) is Fields and "*" not in node.right.fields
+
+        def descendants(matches: list) -> list:
+            found: list = []
+            for match in matches:
+                for left_match in left([match]):
+                    if by_key and _document_indexes:
+                        indexed = _indexed(left_match, node.right.fields)
+                        if indexed is not None:
+                            found.extend(indexed)
+                            continue
+                    for descendant in _preorder(left_match, children):
+                        found.extend(right([descendant]))
+            return found
+
+        return descendants
+
+    def union(self, node: Union | FlatUnion | Intersect, top: bool) -> Step:
+        if type(node) is Union:
+            branches = [node.left, node.right]
+        elif type(node) is FlatUnion:
+            branches = list(node.paths)
+        elif isinstance(node.left, list) and isinstance(node.right, list):
+            branches = [*node.left, *node.right]
+        else:
+            # `find()` fails iterating over them, but only once it gets data
+            raise _UnsupportedError(node)
+        steps = [self.compile(branch, top) for branch in branches]
+
+        def union(matches: list) -> list:
+            found = []
+            for match in matches:
+                for step in steps:
+                    found.extend(step([match]))
+            return found
+
+        return union
+
+    def fields(self, node: Fields, top: bool) -> Step:
+        paths = self.paths
+        if "*" in node.fields:
+
+            def fields(matches: list) -> list:
+                found = []
+                for match in matches:
+                    value = match[0]
+                    try:
+                        keys = tuple(value.keys())
+                    except AttributeError:
+                        continue
+                    for key in keys:
+                        field_value = value.get(key, NOT_SET)
+                        if field_value is not NOT_SET:
+                            found.append([field_value, match, field_path(key) if paths else None])
+                return found
+
+        elif len(node.fields) == 1:
+            field, path = node.fields[0], Fields(node.fields[0])
+
+            def fields(matches: list) -> list:
+                found = []
+                for match in matches:
+                    try:
+                        field_value = match[0].get(field, NOT_SET)
+                    except (TypeError, AttributeError):
+                        continue
+                    if field_value is not NOT_SET:
+                        found.append([field_value, match, path])
+                return found
+
+        else:
+            named = [(field, Fields(field)) for field in node.fields]
+
+            def fields(matches: list) -> list:
+                found = []
+                for match in matches:
+                    value = match[0]
+                    for field, path in named:
+                        try:
+                            field_value = value.get(field, NOT_SET)
+                        except (TypeError, AttributeError):
+                            continue
+                        if field_value is not NOT_SET:
+                            found.append([field_value, match, path])
+                return found
+
+        return _wrap(fields) if top else fields
+
+    def index(self, node: Index, top: bool) -> Step:
+        index = node.index
+
+        def index_(matches: list) -> list:
+            found = []
+            for match in matches:
+                value = match[0]
+                if value and len(value) > index:
+                    found.append([value[index], match, node])
+            return found
+
+        return _wrap(index_) if top else index_
+
+    def slice(self, node: Slice, top: bool) -> Step:  # noqa: A003
+        paths = self.paths
+        start, end, step = node.start, node.end, node.step
+        whole = start is None and end is None and step is None
+
+        def slice_(matches: list) -> list:
+            found = []
+            for match in matches:
+                value = match[0]
+                if not value:
+                    continue
+                if isinstance(value, (int, str, dict)):
+                    # Single values are matched as one element lists
+                    value = [value]
+                    match = [value, match[1], match[2]]
+                indices = range(len(value)) if whole else range(len(value))[start:end:step]
+                found.extend([value[i], match, index_path(i) if paths else None] for i in indices)
+            return found
+
+        return _wrap(slice_) if top else slice_
+
+    def filter(self, node: Filter | Negate, top: bool) -> Step:  # noqa: A003
+        if not node.expressions:
+            # `find()` returns its input as is rather than a list
+            raise _UnsupportedError(node)
+        paths = self.paths
+        # The predicate of `find()`, which stops at the first match of each expression: testing
+        # all of them may raise where `find()` does not
+        test = _all_predicate(node)
+        negate = type(node) is Negate
+
+        def filter_(matches: list) -> list:
+            found = []
+            for match in matches:
+                value = match[0]
+                if isinstance(value, dict):
+                    value = match[0] = [value]
+                if not isinstance(value, list):
+                    continue
+                rows = _columnar_rows(node, value)
+                if rows is not None:
+                    if negate:
+                        rows = set(rows)
+                        rows = [i for i in range(len(value)) if i not in rows]
+                    found.extend([value[i], match, index_path(i) if paths else None] for i in rows)
+                    continue
+                for i in range(len(value)):
+                    # Stops at the first expression without matches, as `find()` does
+                    if test(value[i]) is not negate:
+                        found.append([value[i], match, index_path(i) if paths else None])
+            return found
+
+        return _wrap(filter_) if top else filter_
+
+    def expression(self, node: Expression, top: bool) -> Step:
+        target = self.compile(node.target)
+        if node.op is not None and node.op not in OPERATOR_MAP:
+            raise _UnsupportedError(node)
+        test = None if node.op is None else value_matcher(node.op, node.value)
+
+        def expression(matches: list) -> list:
+            found = []
+            for match in matches:
+                submatches = target([match])
+                if not submatches:
+                    continue
+                if test is None:
+                    found.extend(submatches)
+                    continue
+                found.extend(submatch for submatch in submatches if test(submatch[0]))
+            return found
+
+        return _wrap(expression) if top else expression
+
+    def operation(self, node: Operation, top: bool) -> Step:
+        op = node.op
+        left = self.compile(node.left, top) if isinstance(node.left, JSONPath) else None
+        right = self.compile(node.right, top) if isinstance(node.right, JSONPath) else None
+        left_value, right_value = node.left, node.right
+
+        def values(match: Match) -> list:
+            # Same as `Operation.find()`
+            if left is not None and right is not None:
+                left_results = left([match])
+                right_results = right([match])
+                if not (left_results and right_results and len(left_results) == len(right_results)):
+                    return []
+                left_column = [left_result[0] for left_result in left_results]
+                right_column = [right_result[0] for right_result in right_results]
+            elif left is not None:
+                left_column = [left_result[0] for left_result in left([match])]
+                right_column = [right_value] * len(left_column)
+            elif right is not None:
+                right_column = [right_result[0] for right_result in right([match])]
+                left_column = [left_value] * len(right_column)
+            else:
+                left_column, right_column = [left_value], [right_value]
+            try:
+                return apply(op, left_column, right_column)
+            except TypeError:
+                return []
+
+        def operation(matches: list) -> list:
+            found = []
+            for match in matches:
+                found.extend([value, None, THIS] for value in values(match))
+            return found
+
+        return operation
+
+    def constant(self, node: Constant, top: bool) -> Step:
+        constants = node.values
+
+        def constant(matches: list) -> list:
+            return [[value, None, THIS] for _ in matches for value in constants]
+
+        return constant
+
+    def len(self, node: Len, top: bool) -> Step:  # noqa: A003
+        def len_(matches: list) -> list:
+            found = []
+            for match in matches:
+                try:
+                    found.append([len(match[0]), None, LEN])
+                except TypeError:
+                    continue
+            return found
+
+        return _wrap(len_) if top else len_
+
+    def sub(self, node: Sub, top: bool) -> Step:
+        regex, repl = node.regex, node.repl
+
+        def sub(matches: list) -> list:
+            found = []
+            for match in matches:
+                value = regex.sub(repl, match[0])
+                if value != match[0]:
+                    found.append([value, None, THIS])
+            return found
+
+        return _wrap(sub) if top else sub
+
+    def split(self, node: Split, top: bool) -> Step:
+        char, segment, max_split = node.char, node.segment, node.max_split
+
+        def split(matches: list) -> list:
+            found = []
+            for match in matches:
+                try:
+                    value = match[0].split(char, max_split)[segment]
+                except Exception:  # noqa: S112
+                    continue
+                found.append([value, None, THIS])
+            return found
+
+        return _wrap(split) if top else split
+
+    def str(self, node: Str, top: bool) -> Step:  # noqa: A003
+        def str_(matches: list) -> list:
+            return [[str(match[0]), None, THIS] for match in matches]
+
+        return _wrap(str_) if top else str_
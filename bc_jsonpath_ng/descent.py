@@ -0,0 +1,321 @@
+"""
+A hand-written parser backend for JsonPath that does not need PLY.
+
+`JsonPathScanner` splits a string into the same tokens as `JsonPathLexer` and
+`JsonPathDescentParser` is a Pratt (top down operator precedence) parser for the
+grammar of `JsonPathParser`. Both accept the same language and build the same AST,
+including the way the LALR parser resolves its shift/reduce conflicts, so they can
+be swapped freely; see `bc_jsonpath_ng.parser.set_default_backend`.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any, Callable, Tuple
+
+from bc_jsonpath_ng.exceptions import JsonPathLexerError, JsonPathParserError
+from bc_jsonpath_ng.jsonpath import (
+    Child,
+    Contains,
+    Descendants,
+    Fields,
+    Index,
+    Intersect,
+    Parent,
+    Root,
+    Slice,
+    This,
+    Union,
+    Where,
+)
+
+if TYPE_CHECKING:
+    from bc_jsonpath_ng.jsonpath import JSONPath
+
+# (type, value, lexpos, lineno, col), the fields of a PLY token that the parser uses.
+# The token list always ends with an "$end" token, or with an "$error" token holding the
+# lexer error, so that errors surface when the parser reaches them, just like with PLY.
+Token = Tuple[str, Any, int, int, int]
+
+ESCAPE = re.compile(r"\\(.)")
+
+
+def compile_rules(rules: list[tuple[str, str]], ignore: str, literals: str) -> re.Pattern[str]:
+    """
+    Builds a single pattern the way PLY scans: ignored characters first, then the token rules
+    in order, then the literal characters.
+    """
+    patterns = [("IGNORE", f"[{re.escape(ignore)}]+"), *rules, ("LITERAL", f"[{re.escape(literals)}]")]
+    return re.compile("|".join(f"(?P<{name}>{pattern})" for name, pattern in patterns))
+
+
+class JsonPathScanner:
+    """
+    A lexical analyzer for JsonPath, following the rules of `JsonPathLexer`.
+    """
+
+    literals = "*.[]()$,:|&~"
+
+    ignore = " \t"
+
+    reserved_words = {"where": "WHERE", "contains": "CONTAINS"}
+
+    # Tried in order, like the master regular expression PLY builds from `JsonPathLexer`
+    token_rules = [
+        ("ID", r"[a-zA-Z_@][a-zA-Z0-9_@\-]*"),
+        ("NUMBER", r"-?\d+"),
+        ("QUOTE", r"['\"`]"),
+        ("NEWLINE", r"\n"),
+        ("DOUBLEDOT", r"\.\."),
+        ("DOUBLE_OR", r"\|\|"),
+        ("DOUBLE_AND", r"&&"),
+    ]
+    token_re = compile_rules(token_rules, ignore, literals)
+
+    converters: dict[str, Callable[[str], Any]] = {"NUMBER": int}
+
+    # The quoted token type, a pattern for the whole quoted string and the name used in errors
+    quotes = {
+        "'": ("ID", re.compile(r"'((?:[^'\\]|\\.)*)'"), "singlequoted field"),
+        '"': ("ID", re.compile(r'"((?:[^"\\]|\\.)*)"'), "doublequoted field"),
+        "`": ("NAMED_OPERATOR", re.compile(r"`((?:[^`\\]|\\.)*)`"), "backquoted operator"),
+    }
+
+    def tokenize(self, string: str) -> list[Token]:
+        """
+        Maps a string to a list of tokens terminated by an "$end" or "$error" token.
+        """
+        tokens: list[Token] = []
+        append = tokens.append
+        match = self.token_re.match
+        reserved_words = self.reserved_words
+        converters = self.converters
+        lineno = 1
+        latest_newline = 0
+        pos = 0
+        end = len(string)
+
+        while pos < end:
+            m = match(string, pos)
+            if m is None:
+                error = JsonPathLexerError(
+                    f"Error on line {lineno}, col {pos - latest_newline}: Unexpected character: {string[pos]} "
+                )
+                append(("$error", error, pos, lineno, pos - latest_newline))
+                return tokens
+
+            kind = m.lastgroup
+            if kind == "LITERAL":
+                value = m.group()
+                append((value, value, pos, lineno, pos - latest_newline))
+            elif kind == "ID":
+                value = m.group()
+                append((reserved_words.get(value, "ID"), value, pos, lineno, pos - latest_newline))
+            elif kind == "IGNORE":
+                pass
+            elif kind == "QUOTE":
+                token = self.scan_quoted(string, pos, lineno, latest_newline)
+                append(token)
+                if token[0] == "$error":
+                    return tokens
+                pos = token[2] + 1
+                continue
+            elif kind == "NEWLINE":
+                lineno += 1
+                latest_newline = pos
+            else:
+                value = m.group()
+                converter = converters.get(kind)
+                append((kind, value if converter is None else converter(value), pos, lineno, pos - latest_newline))
+            pos = m.end()
+
+        append(("$end", None, pos, lineno, pos - latest_newline))
+        return tokens
+
+    def scan_quoted(self, string: str, start: int, lineno: int, latest_newline: int) -> Token:
+        """
+        Scans the quoted string starting at `start`. Like PLY, the token is positioned at the closing quote.
+        """
+        kind, pattern, description = self.quotes[string[start]]
+        m = pattern.match(string, start)
+        if m is not None:
+            value = m.group(1)
+            if "\\" in value:
+                value = ESCAPE.sub(r"\1", value)
+            pos = m.end() - 1
+            return (kind, value, pos, lineno, pos - latest_newline)
+
+        # Either the string is not terminated or a backslash escapes a newline (or nothing)
+        pos = start + 1
+        while pos < len(string):
+            char = string[pos]
+            if char == "\\":
+                if pos + 1 == len(string) or string[pos + 1] == "\n":
+                    return (
+                        "$error",
+                        JsonPathLexerError(
+                            f"Error on line {lineno}, col {pos - latest_newline} while lexing {description}: "
+                            f"Unexpected character: {char} "
+                        ),
+                        pos,
+                        lineno,
+                        pos - latest_newline,
+                    )
+                pos += 1
+            pos += 1
+        return ("$error", JsonPathLexerError("Unexpected EOF in string literal or identifier"), pos, lineno, pos)
+
+
+class JsonPathDescentParser:
+    """
+    A recursive descent parser for JsonPath
+    """
+
+    scanner_class = JsonPathScanner
+
+    # Binding power and node class of the infix operators, in the order of `JsonPathParser.precedence`.
+    # They are all left associative. The postfix `[...]` has no precedence, the LALR parser reduces
+    # any binary operator before shifting it, so it only applies to a whole (sub)expression.
+    binary_operators: dict[str, tuple[int, type[JSONPath]]] = {
+        "DOUBLEDOT": (2, Descendants),
+        ".": (3, Child),
+        "DOUBLE_OR": (4, Union),
+        "|": (5, Union),
+        "DOUBLE_AND": (6, Intersect),
+        "&": (7, Intersect),
+        "WHERE": (8, Where),
+        "CONTAINS": (9, Contains),
+    }
+
+    # The tokens that can follow a complete jsonpath. PLY only builds a named operator once it
+    # has read the next token, and fails on that token first when it is not one of these.
+    following_tokens = frozenset(["$end", ")", "]", "[", *binary_operators])
+
+    def __init__(self, scanner: JsonPathScanner | None = None) -> None:
+        self.scanner = scanner or self.scanner_class()
+        self.tokens: list[Token] = []
+        self.pos = 0
+
+    def parse(self, string: str) -> JSONPath:
+        self.tokens = self.scanner.tokenize(string)
+        self.pos = 0
+        jsonpath = self.parse_jsonpath(0)
+        self.expect("$end")
+        return jsonpath
+
+    def parse_jsonpath(self, rbp: int) -> JSONPath:
+        """
+        Parses a jsonpath whose operators bind tighter than `rbp`.
+        """
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return self.parse_infix(self.parse_prefix(token), rbp)
+
+    def parse_infix(self, left: JSONPath, rbp: int) -> JSONPath:
+        tokens = self.tokens
+        binary_operators = self.binary_operators
+        while True:
+            token = tokens[self.pos]
+            operator = binary_operators.get(token[0])
+            if operator is not None:
+                level, node_class = operator
+                if level <= rbp:
+                    return left
+                self.pos += 1
+                left = node_class(left, self.parse_jsonpath(level))
+            elif rbp == 0:
+                jsonpath = self.parse_postfix(left, token)
+                if jsonpath is None:
+                    return left
+                left = jsonpath
+            else:
+                return left
+
+    def parse_prefix(self, token: Token) -> JSONPath:
+        kind = token[0]
+        if kind == "ID":
+            return Fields(*self.parse_fields(token))
+        elif kind == "*":
+            return Fields("*")
+        elif kind == "$":
+            return Root()
+        elif kind == "NAMED_OPERATOR":
+            following = self.tokens[self.pos]
+            if following[0] not in self.following_tokens:
+                self.error(following)
+            return self.parse_named_operator(token)
+        elif kind == "[":
+            return self.parse_selector()
+        elif kind == "(":
+            jsonpath = self.parse_jsonpath(0)
+            self.expect(")")
+            return jsonpath
+        self.error(token)
+
+    def parse_postfix(self, left: JSONPath, token: Token) -> JSONPath | None:
+        """
+        Parses the operators without precedence that follow a complete jsonpath,
+        returns None when `token` is not one of them.
+        """
+        if token[0] == "[":
+            self.pos += 1
+            return Child(left, self.parse_selector())
+        return None
+
+    def parse_named_operator(self, token: Token) -> JSONPath:
+        name = token[1]
+        if name == "this":
+            return This()
+        elif name == "parent":
+            return Parent()
+        raise JsonPathParserError(f"Unknown named operator `{name}` at {token[3]}:{token[2]}")
+
+    def parse_fields(self, token: Token) -> list[str]:
+        fields = [token[1]]
+        tokens = self.tokens
+        while tokens[self.pos][0] == ",":
+            self.pos += 1
+            fields.append(self.expect("ID")[1])
+        return fields
+
+    def parse_selector(self) -> JSONPath:
+        """
+        Parses the fields, index or slice between brackets, after the opening bracket.
+        """
+        token = self.tokens[self.pos]
+        self.pos += 1
+        kind = token[0]
+        if kind == "ID":
+            selector = Fields(*self.parse_fields(token))
+        elif kind == "*":
+            selector = Slice()
+        elif kind == "NUMBER" and self.tokens[self.pos][0] != ":":
+            selector = Index(token[1])
+        elif kind == "NUMBER" or kind == ":":
+            start = None
+            if kind == "NUMBER":
+                start = token[1]
+                self.pos += 1
+            end = None
+            if self.tokens[self.pos][0] == "NUMBER":
+                end = self.tokens[self.pos][1]
+                self.pos += 1
+            selector = Slice(start=start, end=end)
+        else:
+            self.error(token)
+        self.expect("]")
+        return selector
+
+    def expect(self, kind: str) -> Token:
+        token = self.tokens[self.pos]
+        if token[0] != kind:
+            self.error(token)
+        self.pos += 1
+        return token
+
+    def error(self, token: Token) -> None:
+        if token[0] == "$error":
+            raise token[1]
+        if token[0] == "$end":
+            raise JsonPathParserError("Parse error at end of input")
+        raise JsonPathParserError(f"Parse error at {token[3]}:{token[4]} near token {token[1]} ({token[0]})")
@@ -0,0 +1,170 @@
+"""
+Evaluation of an expression matching every node of the document at most once.
+
+`find()` returns a node once per way of reaching it: `$..a..b` walks the subtree of
+each `a` match, so a `b` below nested `a`s is found once per `a` above it, and the
+steps after it run again for each copy. `find_distinct()` returns the same matches
+without the repeats, keeping the first one, and drops them where they are produced,
+by `..` and unions, so the steps after them never see them.
+
+A match is the same node as another when both are the same object or list, or the
+same key or index of the same object or list. Values built by the expression, such
+as `len` or arithmetic results, are never repeats.
+
+The right hand side of `..` only walks from the left matches which are not inside
+another left match: the walk from the outer one already covers the inner one.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from bc_jsonpath_ng.jsonpath import (
+    AutoIdForDatum,
+    Child,
+    DatumInContext,
+    Descendants,
+    Fields,
+    FlatUnion,
+    Index,
+    Intersect,
+    JSONPath,
+    Parent,
+    Root,
+    Slice,
+    StaticPath,
+    This,
+    Union,
+    _child_datums,
+    _preorder,
+)
+
+if TYPE_CHECKING:
+    from typing import Hashable
+
+# Steps whose `find()` never modifies the datum it is given, see `expression_set.PURE_STEPS`
+PURE_STEPS = (Root, This, Parent, Fields, Index, Slice, StaticPath)
+
+
+def find_distinct(expression: JSONPath, data: Any) -> list[DatumInContext]:
+    """
+    Returns the matches of `expression.find(data)`, each node of `data` only once.
+    """
+    if type(expression) not in _STEPS:
+        return expression.find(data)
+    return _find(expression, [data])
+
+
+def node_key(datum: DatumInContext | None) -> Hashable | None:
+    """
+    A key equal for the matches of the same node of the document, None for values
+    which are not a node of the document, such as the None `parent` of the document.
+    """
+    if not isinstance(datum, DatumInContext):
+        return None
+    value = datum.value
+    if isinstance(value, (dict, list)):
+        return id(value)
+    context, path = datum.context, datum.path
+    if context is None:
+        return None
+    if type(path) is Fields and len(path.fields) == 1:
+        return id(context.value), path.fields[0]
+    if type(path) is Index:
+        return id(context.value), path.index
+    return None
+
+
+def _find(node: JSONPath, matches: list) -> list:
+    step = _STEPS.get(type(node))
+    if step is not None:
+        return step(node, matches)
+    found = []
+    for match in matches:
+        found.extend(node.find(match))
+    return found
+
+
+def _child(node: Child, matches: list) -> list:
+    # `Child` does not look for children of auto ids
+    left = [match for match in _find(node.left, matches) if not isinstance(match, AutoIdForDatum)]
+    return _find(node.right, left)
+
+
+def _union(node: Union | FlatUnion | Intersect, matches: list) -> list:
+    if type(node) is Union:
+        branches = [node.left, node.right]
+    elif type(node) is FlatUnion:
+        branches = node.paths
+    else:
+        branches = [*node.left, *node.right]
+    found = []
+    for match in matches:
+        for branch in branches:
+            found.extend(_find(branch, [match]))
+    return _distinct(found)
+
+
+def _descendants(node: Descendants, matches: list) -> list:
+    left_matches = []
+    for match in matches:
+        # Same as `Descendants.find()`, the left side may not return a list
+        found = _find(node.left, [match]) if type(node.left) in _STEPS else node.left.find(match)
+        left_matches.extend(found if isinstance(found, list) else [found])
+    if _is_pure(node.right):
+        left_matches = _outermost(_distinct(left_matches))
+
+    found = []
+    for left_match in left_matches:
+        for descendant in _preorder(left_match, _child_datums):
+            found.extend(_find(node.right, [descendant]))
+    return _distinct(found)
+
+
+def _distinct(matches: list) -> list:
+    seen = set()
+    distinct = []
+    for match in matches:
+        key = node_key(match)
+        if key is None:
+            distinct.append(match)
+        elif key not in seen:
+            seen.add(key)
+            distinct.append(match)
+    return distinct
+
+
+def _outermost(matches: list) -> list:
+    # Drops the matches below an earlier one, whose walk covers theirs
+    walked: set[int] = set()
+    outermost = []
+    for match in matches:
+        if not isinstance(match, DatumInContext):
+            outermost.append(match)
+            continue
+        context = match.context
+        while context is not None and id(context.value) not in walked:
+            context = context.context
+        if context is None:
+            outermost.append(match)
+            if isinstance(match.value, (dict, list)):
+                walked.add(id(match.value))
+    return outermost
+
+
+def _is_pure(node: JSONPath) -> bool:
+    cls = type(node)
+    if cls is Child or cls is Descendants or cls is Union:
+        return _is_pure(node.left) and _is_pure(node.right)
+    if cls is FlatUnion:
+        return all(_is_pure(path) for path in node.paths)
+    return cls in PURE_STEPS
+
+
+_STEPS = {
+    Child: _child,
+    Descendants: _descendants,
+    Union: _union,
+    FlatUnion: _union,
+    Intersect: _union,
+}
@@ -8,3 +8,11 @@ class JsonPathLexerError(JSONPathError):
 
 class JsonPathParserError(JSONPathError):
     pass
+
+
+class JsonPathSerializationError(JSONPathError):
+    pass
+
+
+class JsonPathStreamError(JSONPathError):
+    pass
@@ -0,0 +1,180 @@
+"""
+Evaluation of many expressions against the same document at once.
+
+`ExpressionSet` merges the expressions into a trie of their steps: a chain of `Child`
+nodes such as `$.a.b[0]` is the sequence of steps `$`, `a`, `b`, `[0]`, and the
+expressions sharing a prefix of steps share the matches of that prefix, which are
+computed once. A `Descendants` step (`..`) is a state of the trie as well: the
+subtrees below its matches are walked once, and the right hand sides of all the
+expressions descending from that state are matched at every node of the walk.
+
+`ExpressionSet.find()` returns, for each expression, the same matches as its own
+`find()`: same values, paths and contexts, in the same order.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import TYPE_CHECKING, Any, Iterable
+
+from bc_jsonpath_ng.exceptions import JsonPathSerializationError
+from bc_jsonpath_ng.jsonpath import (
+    AutoIdForDatum,
+    Child,
+    DatumInContext,
+    Descendants,
+    Fields,
+    Index,
+    JSONPath,
+    Parent,
+    Root,
+    Slice,
+    StaticPath,
+    This,
+    _child_datums,
+    _preorder,
+)
+
+if TYPE_CHECKING:
+    from typing import Hashable
+
+# Steps whose `find()` never modifies the datum it is given, so their input can be shared
+PURE_STEPS = (Root, This, Parent, Fields, Index, Slice)
+
+
+class ExpressionSet:
+    """
+    A set of expressions evaluated in a single traversal of the document.
+    """
+
+    def __init__(self, expressions: Iterable[JSONPath]) -> None:
+        self.expressions: list[JSONPath] = []
+        self._root = _TrieNode()
+        for expression in expressions:
+            self.add(expression)
+
+    def add(self, expression: JSONPath) -> None:
+        """
+        Adds `expression` to the set, its matches come last in the results of `find()`.
+        """
+        node = self._root
+        for kind, step, after_child in _steps(expression):
+            node = node.add_descendants(step) if kind == "descendants" else node.add_child(step, after_child)
+        node.terminals.append(len(self.expressions))
+        self.expressions.append(expression)
+
+    def __len__(self) -> int:
+        return len(self.expressions)
+
+    def find(self, data: Any) -> list[list[DatumInContext]]:
+        """
+        Returns the matches of every expression in `data`, in the order of `expressions`.
+        An exception raised by one of the expressions is raised by this method.
+        """
+        results: list[list[DatumInContext]] = [[] for _ in self.expressions]
+        self._root.evaluate([data], results)
+        return results
+
+
+class _TrieNode:
+    def __init__(self) -> None:
+        # The expressions ending here
+        self.terminals: list[int] = []
+        # Step key -> [step, after_child, copy_input, next node]
+        self.children: dict[Hashable, list] = {}
+        # The right hand sides of the `Descendants` steps leaving this node, and their next nodes
+        self.descendants: ExpressionSet | None = None
+        self.descendant_keys: dict[Hashable, int] = {}
+        self.descendant_nodes: list[_TrieNode] = []
+
+    def add_child(self, step: JSONPath, after_child: bool) -> _TrieNode:
+        key = (_key(step), after_child)
+        edge = self.children.get(key)
+        if edge is None:
+            edge = self.children[key] = [step, after_child, type(step) not in PURE_STEPS, _TrieNode()]
+        return edge[3]
+
+    def add_descendants(self, right: JSONPath) -> _TrieNode:
+        key = _key(right)
+        index = self.descendant_keys.get(key)
+        if index is None:
+            if self.descendants is None:
+                self.descendants = ExpressionSet([])
+            index = self.descendant_keys[key] = len(self.descendant_nodes)
+            self.descendants.add(right)
+            self.descendant_nodes.append(_TrieNode())
+        return self.descendant_nodes[index]
+
+    def evaluate(self, matches: list, results: list[list[DatumInContext]]) -> None:
+        for index in self.terminals:
+            results[index] = list(matches)
+
+        for step, after_child, copy_input, node in self.children.values():
+            found = []
+            for match in matches:
+                if after_child and isinstance(match, AutoIdForDatum):
+                    # `Child` does not look for children of auto ids
+                    continue
+                if copy_input and isinstance(match, DatumInContext):
+                    # The step may change its input (e.g. a filter wraps a dict into a list),
+                    # the other expressions must not see that
+                    match = copy.copy(match)
+                found.extend(step.find(match))
+            if found:
+                node.evaluate(found, results)
+
+        if self.descendants is not None:
+            descendant_matches: list[list[DatumInContext]] = [[] for _ in self.descendant_nodes]
+            for match in matches:
+                _walk(self.descendants, match, descendant_matches)
+            for node, found in zip(self.descendant_nodes, descendant_matches):
+                if found:
+                    node.evaluate(found, results)
+
+
+def _walk(rights: ExpressionSet, datum: DatumInContext, matches: list[list[DatumInContext]]) -> None:
+    # `Descendants.find()` for all the right hand sides at once: their matches at `datum`,
+    # then at its descendants, in document order
+    for descendant in _preorder(datum, _child_datums):
+        for found, right_matches in zip(matches, rights.find(descendant)):
+            found.extend(right_matches)
+
+
+def _steps(node: JSONPath, after_child: bool = False) -> list[tuple[str, JSONPath, bool]]:
+    """
+    Flattens `node` into `(kind, step, after_child)` triples, `after_child` telling
+    whether the step follows a `Child` (which skips `AutoIdForDatum` matches).
+    """
+    cls = type(node)
+    if cls is Child:
+        return [*_steps(node.left, after_child), *_steps(node.right, True)]
+    if cls is StaticPath:
+        return [("step", step, after_child or i > 0) for i, step in enumerate(node.steps)]
+    if cls is Descendants and _is_pure(node.right):
+        # `Descendants` matches the right side from all the left matches, auto ids included
+        return [*_steps(node.left, after_child), ("descendants", node.right, False)]
+    return [("step", node, after_child)]
+
+
+def _is_pure(node: JSONPath) -> bool:
+    """
+    Whether `node` never modifies the data it is given, so that the walk of its
+    descendants can be shared with other expressions.
+    """
+    cls = type(node)
+    if cls is Child or cls is Descendants:
+        return _is_pure(node.left) and _is_pure(node.right)
+    return cls is StaticPath or cls in PURE_STEPS
+
+
+def _key(node: JSONPath) -> Hashable:
+    """
+    A key equal for structurally equal steps, so that they share one edge of the trie.
+    """
+    from bc_jsonpath_ng.serialization import to_bytes
+
+    try:
+        return to_bytes(node)
+    except JsonPathSerializationError:
+        # Unknown nodes are only shared with themselves
+        return id(node)
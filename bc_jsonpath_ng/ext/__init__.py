@@ -10,4 +10,30 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from .parser import parse  # noqa: F401
+import importlib
+
+# Not imported from `typing`, see `bc_jsonpath_ng.jsonpath`
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .parser import parse
+
+__all__ = ["parse"]
+
+# Submodules also reachable as attributes of the package, imported on first access
+_SUBMODULES = ("arithmetic", "filter", "iterable", "parser", "string")
+
+
+def __getattr__(name):
+    # The extension modules are only imported when `parse` is first used
+    if name == "parse":
+        from .parser import parse
+
+        globals()["parse"] = parse
+        return parse
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), "parse", *_SUBMODULES})
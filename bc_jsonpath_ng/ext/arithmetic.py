@@ -14,6 +14,7 @@
 import operator
 
 from .. import DatumInContext, JSONPath
+from .columnar import apply
 
 OPERATOR_MAP = {
     "+": operator.add,
@@ -30,41 +31,64 @@ class Operation(JSONPath):
         self.right = right
 
     def find(self, datum):
-        result = []
+        return list(map(DatumInContext.wrap, self._values(datum)))
+
+    def ifind(self, datum):
+        # The values are computed at once, their matches as they are asked for
+        for value in self._values(datum):
+            yield DatumInContext.wrap(value)
+
+    def _values(self, datum):
+        # Computed a column at a time, no values if one of them is a `TypeError`
         if isinstance(self.left, JSONPath) and isinstance(self.right, JSONPath):
-            left_results = self.left.find(datum)
-            right_results = self.right.find(datum)
-            if left_results and right_results and len(left_results) == len(right_results):
-                for left, right in zip(left_results, right_results):
-                    try:
-                        result.append(self.op(left.value, right.value))
-                    except TypeError:
-                        return []
-            else:
+            left = _path_values(self.left, datum)
+            right = _path_values(self.right, datum)
+            if not (left and right and len(left) == len(right)):
                 return []
         elif isinstance(self.left, JSONPath):
-            left_results = self.left.find(datum)
-            for left in left_results:
-                try:
-                    result.append(self.op(left.value, self.right))
-                except TypeError:
-                    return []
+            left = _path_values(self.left, datum)
+            right = [self.right] * len(left)
         elif isinstance(self.right, JSONPath):
-            right_results = self.right.find(datum)
-            for right in right_results:
-                try:
-                    result.append(self.op(self.left, right.value))
-                except TypeError:
-                    return []
+            right = _path_values(self.right, datum)
+            left = [self.left] * len(right)
         else:
-            try:
-                result.append(self.op(self.left, self.right))
-            except TypeError:
-                return []
-        return [DatumInContext.wrap(r) for r in result]
+            left, right = [self.left], [self.right]
+        try:
+            return apply(self.op, left, right)
+        except TypeError:
+            return []
 
     def __repr__(self):
         return f"{self.__class__.__name__}({self.left!r}{self.op}{self.right!r})"
 
     def __str__(self):
         return f"{self.left}{self.op}{self.right}"
+
+
+def _path_values(path, datum):
+    # The values of `path.find(datum)`, without building their matches for a document
+    if isinstance(datum, DatumInContext):
+        return [match.value for match in path.find(datum)]
+    return path.find_values(datum)
+
+
+class Constant(JSONPath):
+    """
+    The values of an `Operation` on literals, computed once by `bc_jsonpath_ng.optimizer`.
+    An operation that fails on its literals (e.g. `'a' - 1`) has no values.
+    """
+
+    def __init__(self, *values):
+        self.values = values
+
+    def find(self, datum):
+        return [DatumInContext(value) for value in self.values]
+
+    def __eq__(self, other):
+        return isinstance(other, Constant) and self.values == other.values
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, ", ".join(map(repr, self.values)))
+
+    def __str__(self):
+        return ",".join(map(str, self.values))
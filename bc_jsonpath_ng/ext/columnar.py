@@ -0,0 +1,148 @@
+"""
+Evaluation of filters and arithmetic on large lists a column at a time, from
+`filter.COLUMNAR_MIN_ITEMS` items.
+
+`[?(@.price > 10)]` tests each item with a Python function. When the expressions
+of the filter all compare a fixed path of the item, such as `@.price` or
+`@.tags[0].key`, with a constant, the values at that path are read into a column
+and compared all at once: with NumPy when it is installed and the column holds
+only ints or only floats, otherwise by mapping the operator of `OPERATOR_MAP` over
+the column. Each expression only reads the rows matching the ones before it.
+
+The matches are the same as testing the items one by one, in the same order, and
+so are the errors raised, though possibly for another item.
+
+`apply()` computes the operators of `arithmetic.OPERATOR_MAP` over two columns.
+"""
+
+from __future__ import annotations
+
+import operator
+from itertools import compress, repeat
+from typing import Any
+
+from .. import NOT_SET
+from .. import jsonpath as _jsonpath
+from ..jsonpath import static_value
+from . import filter as _filter
+from .filter import OPERATOR_MAP, Expression, _compiled, static_keys, value_matcher
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+INT64_MIN, INT64_MAX = -(2**63), 2**63 - 1
+
+
+def matching_rows(node, items: list) -> list[int] | None:
+    """
+    Returns the indices of `items` matching all the expressions of a `Filter` or a
+    `Negate` (ignoring the negation), or None when they cannot be tested on columns.
+    """
+    columns = _compiled(node, "columns", lambda: _columns(node.expressions))
+    if not columns or _jsonpath.auto_id_field is not None:
+        return None
+    rows = None
+    for keys, op, expected, test in columns:
+        rows = _test(items, rows, keys, op, expected, test)
+        if not rows:
+            return []
+    return list(range(len(items))) if rows is None else rows
+
+
+def column(items: list, keys: list, rows: list[int] | None = None) -> tuple[list[int], list]:
+    """
+    Returns the rows of `items` (all of them, or those of `rows`) having a value at
+    `keys`, see `static_keys()`, and those values.
+    """
+    if rows is None:
+        rows = range(len(items))
+    else:
+        items = [items[i] for i in rows]
+    values = values_at(items, keys)
+    present = list(map(operator.is_not, values, repeat(NOT_SET)))
+    if all(present):
+        return list(rows), values
+    return list(compress(rows, present)), list(compress(values, present))
+
+
+def apply(op, left: list, right: list) -> list:
+    """
+    Returns `[op(l, r) for l, r in zip(left, right)]`, an operator of `arithmetic.OPERATOR_MAP`
+    applied to two columns of the same length, raising the error of the first pair which
+    fails as that loop does. Long columns of numbers are computed by NumPy when it gives
+    exactly the values of Python.
+    """
+    if numpy is not None and left and len(left) >= _filter.COLUMNAR_MIN_ITEMS:
+        dtype = _numpy_type(op, left, right)
+        if dtype is not None:
+            with numpy.errstate(all="ignore"):
+                return op(numpy.array(left, dtype=dtype), numpy.array(right, dtype=dtype)).tolist()
+    return list(map(op, left, right))
+
+
+def _numpy_type(op, left, right):
+    # int64 without overflow or float64 without division by zero, None otherwise; no bools,
+    # added as logical or by NumPy, no mix of ints and floats
+    types = set(map(type, left)) | set(map(type, right))
+    if types == {float}:
+        if op is operator.truediv and 0.0 in right:
+            return None
+        return numpy.float64
+    if types != {int}:
+        return None
+    largest = max(map(abs, left)), max(map(abs, right))
+    if op is operator.truediv:
+        # Converted to floats exactly, then divided as Python does
+        return numpy.int64 if max(largest) <= 2**53 and 0 not in right else None
+    result = largest[0] * largest[1] if op is operator.mul else largest[0] + largest[1]
+    return numpy.int64 if result <= INT64_MAX else None
+
+
+def values_at(items: list, keys: list) -> list:
+    """
+    Returns the value at `keys` of each item, NOT_SET for those without one.
+    """
+    if len(keys) == 1 and not keys[0][0] and set(map(type, items)) == {dict}:
+        return list(map(dict.get, items, repeat(keys[0][1]), repeat(NOT_SET)))
+    return [static_value(item, keys) for item in items]
+
+
+def _columns(expressions) -> list | bool:
+    # The `(keys, op, expected, test)` of each expression, False if one is not a comparison
+    # of a fixed path
+    columns = []
+    for expression in expressions:
+        if type(expression) is not Expression:
+            return False
+        keys = static_keys(expression.target)
+        if keys is None or (expression.op is not None and expression.op not in OPERATOR_MAP):
+            return False
+        test = None if expression.op is None else value_matcher(expression.op, expression.value)
+        columns.append((keys, expression.op, expression.value, test))
+    return columns
+
+
+def _test(items, rows, keys, op, expected, test) -> list[int]:
+    rows, values = column(items, keys, rows)
+    if op is None or not rows:
+        return rows
+    if op != "=~":
+        types = set(map(type, values))
+        compare = OPERATOR_MAP[op]
+        # Ints and bools are their own `int()`, the coercion of `value_matcher()` is not needed
+        if not isinstance(expected, int) or types <= {int, bool}:
+            if numpy is not None and _is_numeric(types, expected):
+                array = numpy.array(values)
+                if array.dtype.kind in "if":
+                    return list(compress(rows, compare(array, expected).tolist()))
+            return list(compress(rows, map(compare, values, repeat(expected))))
+    return list(compress(rows, map(test, values)))
+
+
+def _is_numeric(types: set, expected: Any) -> bool:
+    # Compared by NumPy as Python would: no mix of ints and floats, no int out of int64
+    if types == {int} and isinstance(expected, int) and not isinstance(expected, bool):
+        return INT64_MIN <= expected <= INT64_MAX
+    return types == {float} and isinstance(expected, float)
@@ -0,0 +1,202 @@
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from .. import Child, Fields, Intersect, This
+from ..descent import JsonPathDescentParser, JsonPathScanner, Token, compile_rules
+from . import arithmetic as _arithmetic
+from . import filter as _filter
+from . import iterable as _iterable
+from . import string as _string
+
+if TYPE_CHECKING:
+    from bc_jsonpath_ng import JSONPath
+
+ARITHMETIC_OPERATORS = frozenset(["+", "-", "*", "/"])
+
+FILTER_VALUES = frozenset(["ID", "FLOAT", "NUMBER", "BOOL"])
+
+# Binding power of the operators combining filter expressions, the same as between jsonpaths.
+# `&` concatenates the expressions, `|` wraps them in an `Intersect`.
+EXPRESSION_OPERATORS = {
+    "DOUBLE_OR": (JsonPathDescentParser.binary_operators["DOUBLE_OR"][0], False),
+    "|": (JsonPathDescentParser.binary_operators["|"][0], False),
+    "DOUBLE_AND": (JsonPathDescentParser.binary_operators["DOUBLE_AND"][0], True),
+    "&": (JsonPathDescentParser.binary_operators["&"][0], True),
+}
+
+
+class ExtendedJsonPathScanner(JsonPathScanner):
+    """Scanner following the rules of `ExtendedJsonPathLexer`"""
+
+    literals = JsonPathScanner.literals + "?@+*/-!"
+
+    token_rules = [
+        ("BOOL", r"true|false"),
+        ("SORT_DIRECTION", r",?\s*(?:/|\\)"),
+        ("ID", r"@?[a-zA-Z_][a-zA-Z0-9_@\-]*"),
+        ("FLOAT", r"-?\d+\.\d+"),
+        ("NUMBER", r"-?\d+"),
+        ("QUOTE", r"['\"`]"),
+        ("NEWLINE", r"\n"),
+        ("FILTER_OP", r"=~|==?|<=|>=|!=|<|>"),
+        ("DOUBLEDOT", r"\.\."),
+        ("DOUBLE_OR", r"\|\|"),
+        ("DOUBLE_AND", r"&&"),
+    ]
+    token_re = compile_rules(token_rules, JsonPathScanner.ignore, literals)
+
+    converters = {
+        **JsonPathScanner.converters,
+        "FLOAT": float,
+        "BOOL": lambda value: value == "true",
+        "SORT_DIRECTION": lambda value: value[-1],
+    }
+
+
+class ExtendedJsonPathDescentParser(JsonPathDescentParser):
+    """Recursive descent parser for the extended JsonPath grammar"""
+
+    scanner_class = ExtendedJsonPathScanner
+
+    following_tokens = JsonPathDescentParser.following_tokens | ARITHMETIC_OPERATORS | {"FILTER_OP", "SORT_DIRECTION"}
+
+    def parse_prefix(self, token: Token) -> JSONPath:
+        kind = token[0]
+        if kind == "@":
+            return This()
+        elif kind == "!":
+            return _filter.Negate(self.parse_expressions(0))
+        elif kind == "NUMBER" or kind == "FLOAT":
+            # Only valid as the left operand of an operation
+            operator = self.tokens[self.pos]
+            if operator[0] not in ARITHMETIC_OPERATORS:
+                self.error(operator)
+            self.pos += 1
+            return self.operation(token[1], operator[1], self.parse_operand(kind))
+        return super().parse_prefix(token)
+
+    def parse_postfix(self, left: JSONPath, token: Token) -> JSONPath | None:
+        # Arithmetic has the lowest precedence on its left and, as the LALR parser shifts
+        # rather than reduce an operation, takes everything that follows as its right operand.
+        kind = token[0]
+        if kind in ARITHMETIC_OPERATORS:
+            self.pos += 1
+            return self.operation(left, token[1], self.parse_operand(None))
+        elif kind == "[":
+            following = self.tokens[self.pos + 1][0]
+            if following == "?":
+                self.pos += 2
+                jsonpath = _filter.Filter(self.parse_expressions(0))
+                self.expect("]")
+                return Child(left, jsonpath)
+            elif following == "SORT_DIRECTION":
+                self.pos += 1
+                sorts = []
+                while self.tokens[self.pos][0] == "SORT_DIRECTION":
+                    direction = self.tokens[self.pos][1]
+                    self.pos += 1
+                    sorts.append((self.parse_jsonpath(0), direction != "/"))
+                self.expect("]")
+                return Child(left, _iterable.SortedThis(sorts))
+        return super().parse_postfix(left, token)
+
+    def parse_named_operator(self, token: Token) -> JSONPath:
+        name = token[1]
+        if name == "len":
+            return _iterable.Len()
+        elif name == "sorted":
+            return _iterable.SortedThis()
+        elif name.startswith("split("):
+            return _string.Split(name)
+        elif name.startswith("sub("):
+            return _string.Sub(name)
+        elif name.startswith("str("):
+            return _string.Str(name)
+        return super().parse_named_operator(token)
+
+    def parse_operand(self, left_kind: str | None) -> Any:
+        """
+        Parses the right operand of an arithmetic operator, `left_kind` is the
+        token type of the left operand if it is a number literal.
+        """
+        token = self.tokens[self.pos]
+        kind = token[0]
+        if (kind == "NUMBER" or kind == "FLOAT") and self.tokens[self.pos + 1][0] not in ARITHMETIC_OPERATORS:
+            # There is no `NUMBER operator FLOAT` production and vice versa
+            if left_kind is not None and left_kind != kind:
+                self.error(self.tokens[self.pos + 1])
+            self.pos += 1
+            return token[1]
+        return self.parse_jsonpath(0)
+
+    @staticmethod
+    def operation(left: Any, op: str, right: Any) -> JSONPath:
+        # NOTE(sileht): If we have choice between a field or a string we
+        # always choice string, because field can be full qualified
+        # like $.foo == foo and where string can't.
+        if isinstance(left, Fields) and len(left.fields) == 1:
+            left = left.fields[0]
+        if isinstance(right, Fields) and len(right.fields) == 1:
+            right = right.fields[0]
+        return _arithmetic.Operation(left, op, right)
+
+    # Filter expressions. A jsonpath can start a filter expression, so an opening parenthesis
+    # is ambiguous there: `(@.a)` is a parenthesized jsonpath, `(@.a > 1)` a group of expressions.
+
+    def parse_expressions(self, rbp: int) -> list[JSONPath]:
+        is_jsonpath, expressions = self.parse_expression()
+        if is_jsonpath:
+            expressions = [_filter.Expression(expressions, None, None)]
+        return self.parse_expressions_infix(expressions, rbp)
+
+    def parse_expressions_infix(self, left: list[JSONPath], rbp: int) -> list[JSONPath]:
+        tokens = self.tokens
+        while True:
+            operator = EXPRESSION_OPERATORS.get(tokens[self.pos][0])
+            if operator is None or operator[0] <= rbp:
+                return left
+            self.pos += 1
+            level, conjunction = operator
+            right = self.parse_expressions(level)
+            left = left + right if conjunction else [Intersect(left, right)]
+
+    def parse_expression(self) -> tuple[bool, Any]:
+        """
+        Parses a single filter expression, returns (True, jsonpath) when it is a bare
+        jsonpath that may still be the content of parentheses, (False, expressions) otherwise.
+        """
+        token = self.tokens[self.pos]
+        if token[0] == "(":
+            self.pos += 1
+            is_jsonpath, content = self.parse_expression()
+            if not is_jsonpath:
+                content = self.parse_expressions_infix(content, 0)
+            self.expect(")")
+            if not is_jsonpath:
+                return False, content
+            # The jsonpath can go on after the closing parenthesis
+            jsonpath = self.parse_infix(content, 0)
+        else:
+            jsonpath = self.parse_jsonpath(0)
+
+        if self.tokens[self.pos][0] != "FILTER_OP":
+            return True, jsonpath
+        op = self.tokens[self.pos][1]
+        value = self.tokens[self.pos + 1]
+        if value[0] not in FILTER_VALUES:
+            self.error(value)
+        self.pos += 2
+        return False, [_filter.Expression(jsonpath, op, value[1])]
@@ -11,10 +11,16 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import itertools
 import operator
 import re
+import threading
+import time
+from typing import NamedTuple
 
-from .. import DatumInContext, Index, JSONPath
+from .. import NOT_SET, Child, DatumInContext, Fields, Index, Intersect, JSONPath, Root, StaticPath, This, index_path
+from .. import jsonpath as _jsonpath
+from ..jsonpath import static_value
 
 OPERATOR_MAP = {  # pragma: no cover
     "!=": operator.ne,
@@ -47,23 +53,53 @@ class Filter(JSONPath):
         if not isinstance(datum.value, list):
             return []
 
+        rows = _columnar_rows(self, datum.value)
+        if rows is not None:
+            return [DatumInContext(datum.value[i], path=index_path(i), context=datum) for i in rows]
+
+        matches = _all_predicate(self)
         return [
-            DatumInContext(datum.value[i], path=Index(i), context=datum)
+            DatumInContext(datum.value[i], path=index_path(i), context=datum)
             for i in range(len(datum.value))
-            if (len(self.expressions) == len(list(filter(lambda x: x.find(datum.value[i]), self.expressions))))
+            if matches(datum.value[i])
         ]
 
+    def ifind(self, datum):
+        if not self.expressions:
+            yield from self.find(datum)
+            return
+
+        datum = DatumInContext.wrap(datum)
+
+        if isinstance(datum.value, dict):
+            # needed to use filter on normal dicts
+            datum.value = [datum.value]
+
+        if not isinstance(datum.value, list):
+            return
+
+        matches = _all_predicate(self)
+        for i in range(len(datum.value)):
+            if matches(datum.value[i]):
+                yield DatumInContext(datum.value[i], path=index_path(i), context=datum)
+
     def update(self, data, val):
         if isinstance(data, list):
+            matches = _all_predicate(self)
             for index, item in enumerate(data):
-                should_update = len(self.expressions) == len(list(filter(lambda x: x.find(item), self.expressions)))
-                if should_update:
+                if matches(item):
                     if callable(val):
                         val(data[index], data, index)
                     else:
                         data[index] = val
         return data
 
+    def statistics(self):
+        """
+        Returns the `PredicateStatistics` of each expression, see `statistics()`.
+        """
+        return statistics(self)
+
     def __repr__(self):
         return f"{self.__class__.__name__}({self.expressions!r})"
 
@@ -93,12 +129,47 @@ class Negate(JSONPath):
         if not isinstance(datum.value, list):
             return []
 
+        rows = _columnar_rows(self, datum.value)
+        if rows is not None:
+            rows = set(rows)
+            return [
+                DatumInContext(datum.value[i], path=index_path(i), context=datum)
+                for i in range(len(datum.value))
+                if i not in rows
+            ]
+
+        matches = _all_predicate(self)
         return [
-            DatumInContext(datum.value[i], path=Index(i), context=datum)
+            DatumInContext(datum.value[i], path=index_path(i), context=datum)
             for i in range(len(datum.value))
-            if (len(self.expressions) != len(list(filter(lambda x: x.find(datum.value[i]), self.expressions))))
+            if not matches(datum.value[i])
         ]
 
+    def ifind(self, datum):
+        if not self.expressions:
+            yield from self.find(datum)
+            return
+
+        datum = DatumInContext.wrap(datum)
+
+        if isinstance(datum.value, dict):
+            # needed to use filter on normal dicts
+            datum.value = [datum.value]
+
+        if not isinstance(datum.value, list):
+            return
+
+        matches = _all_predicate(self)
+        for i in range(len(datum.value)):
+            if not matches(datum.value[i]):
+                yield DatumInContext(datum.value[i], path=index_path(i), context=datum)
+
+    def statistics(self):
+        """
+        Returns the `PredicateStatistics` of each expression, see `statistics()`.
+        """
+        return statistics(self)
+
 
 class Expression(JSONPath):
     """The JSONQuery expression"""
@@ -116,24 +187,15 @@ class Expression(JSONPath):
         if self.op is None:
             return datum
 
-        found = []
-        for data in datum:
-            value = data.value
-            if isinstance(self.value, int):
-                try:
-                    value = int(value)
-                except ValueError:
-                    continue
-            elif isinstance(self.value, bool):
-                try:
-                    value = bool(value)
-                except ValueError:
-                    continue
-
-            if OPERATOR_MAP[self.op](value, self.value):
-                found.append(data)
-
-        return found
+        return [data for data in datum if self._matches(data)]
+
+    def ifind(self, datum):
+        for data in self.target.ifind(DatumInContext.wrap(datum)):
+            if self.op is None or self._matches(data):
+                yield data
+
+    def _matches(self, data):
+        return _compiled(self, "matcher", lambda: value_matcher(self.op, self.value))(data.value)
 
     def __eq__(self, other):
         return (
@@ -154,3 +216,298 @@ class Expression(JSONPath):
             return "%s" % self.target
         else:
             return f"{self.target} {self.op} {self.value}"
+
+
+def value_matcher(op, expected):
+    """
+    Returns a function telling whether `value <op> expected`, after the coercion of `value`
+    to `int` when `expected` is a number. The operator, the coercion and the regex of `=~`
+    are looked up once rather than for every value.
+    """
+    compare = OPERATOR_MAP.get(op)
+    if compare is None:
+        # Raises the `KeyError` of an unknown operator when used, as `Expression` does
+        return lambda value: OPERATOR_MAP[op](value, expected)
+    if op == "=~" and isinstance(expected, str):
+        try:
+            search = re.compile(expected).search
+        except re.error:
+            # Raised when used
+            pass
+        else:
+            return lambda value: search(value) is not None
+
+    # Booleans are numbers too
+    if isinstance(expected, int):
+
+        def matches(value):
+            try:
+                value = int(value)
+            except ValueError:
+                return False
+            return compare(value, expected)
+
+        return matches
+    return lambda value: compare(value, expected)
+
+
+# Operators comparing any two values without raising
+EQUALITY_OPERATORS = ("==", "=", "!=")
+
+# Every this many items, the expressions tested are timed and counted
+SAMPLE_EVERY = 16
+# Items always sampled at first, to find a good order early
+WARMUP = 64
+# Samples between two reorderings
+REORDER_EVERY = 16
+# Lists from this many items are filtered a column at a time when they can, see `columnar`
+COLUMNAR_MIN_ITEMS = 1000
+
+
+class PredicateStatistics(NamedTuple):
+    expression: JSONPath
+    # Position of the expression in the order they are tried, 0 first
+    position: int
+    # Out of the sampled items, those the expression was tested on and those it matched
+    evaluations: int
+    passes: int
+    # Mean seconds per test
+    cost: float
+
+    @property
+    def pass_rate(self):
+        return self.passes / self.evaluations if self.evaluations else None
+
+
+class AdaptivePredicate:
+    """
+    Whether an item matches all of `predicates` (any of them if `any_` is set), trying
+    them in the order expected to be the cheapest.
+
+    A sample of the items records the time each predicate takes and how often it
+    passes. From those, the predicates are tried by increasing `cost / (1 - pass rate)`
+    for all, which puts first the cheap ones most likely to fail, or `cost / pass rate`
+    for any. Only runs of adjacent `movable` predicates, which never raise, are
+    reordered: a predicate which may raise stays where it is, so that the predicates
+    tried before it, and whether it is tried at all, do not depend on the timings.
+
+    The expressions, and so their predicates, are shared between threads by the
+    expression cache; the statistics are updated under a lock.
+    """
+
+    def __init__(self, predicates, any_=False, movable=()):
+        self.predicates = predicates
+        self.any = any_
+        self.order = tuple(range(len(predicates)))
+        # The slices of `order` which may be sorted
+        self.runs = list(_runs(movable))
+        self.calls = itertools.count(1)
+        self.evaluations = [0] * len(predicates)
+        self.passes = [0] * len(predicates)
+        self.time = [0.0] * len(predicates)
+        self._lock = threading.Lock()
+
+    def __call__(self, item):
+        calls = next(self.calls)
+        if calls > WARMUP and calls % SAMPLE_EVERY:
+            predicates = self.predicates
+            if self.any:
+                return any(predicates[i](item) for i in self.order)
+            return all(predicates[i](item) for i in self.order)
+        return self._sample(item, calls)
+
+    def _sample(self, item, calls):
+        result = not self.any
+        tested = []
+        for i in self.order:
+            start = time.perf_counter()
+            passed = self.predicates[i](item)
+            tested.append((i, time.perf_counter() - start, passed))
+            if bool(passed) is not result:
+                result = not result
+                break
+        with self._lock:
+            for i, elapsed, passed in tested:
+                self.time[i] += elapsed
+                self.evaluations[i] += 1
+                if passed:
+                    self.passes[i] += 1
+        samples = calls if calls <= WARMUP else WARMUP + calls // SAMPLE_EVERY
+        if samples % REORDER_EVERY == 0:
+            self.reorder()
+        return result
+
+    def reorder(self):
+        """
+        Sorts the runs of movable predicates by the expected cost of trying them from the
+        statistics so far.
+        """
+
+        def rank(i):
+            evaluations = self.evaluations[i]
+            if not evaluations:
+                # Never reached yet, worth measuring
+                return 0.0
+            cost = self.time[i] / evaluations
+            # Smoothed, a predicate never seen failing may still fail
+            pass_rate = (self.passes[i] + 1) / (evaluations + 2)
+            return cost / (pass_rate if self.any else 1 - pass_rate)
+
+        with self._lock:
+            order = list(self.order)
+            for start, end in self.runs:
+                order[start:end] = sorted(order[start:end], key=rank)
+            self.order = tuple(order)
+
+
+def _runs(movable):
+    # The (start, end) slices of the runs of at least two adjacent movable predicates
+    start = 0
+    for is_movable, group in itertools.groupby(movable):
+        end = start + len(list(group))
+        if is_movable and end - start > 1:
+            yield start, end
+        start = end
+
+
+def statistics(node):
+    """
+    Returns the `PredicateStatistics` of the expressions of a `Filter` or a `Negate`, or of
+    the branches of a `|` in a filter, in their original order. `find()` and the compiled
+    expressions share them; there are none before the first test.
+    """
+    expressions = node.expressions if isinstance(node, (Filter, Negate)) else _branches(node)
+    compiled = node.__dict__.get("_compiled", {})
+    predicates = [
+        compiled[name] for name in ("items", "predicate") if isinstance(compiled.get(name), AdaptivePredicate)
+    ]
+    found = []
+    for i, expression in enumerate(expressions):
+        evaluations = sum(adaptive.evaluations[i] for adaptive in predicates)
+        total = sum(adaptive.time[i] for adaptive in predicates)
+        found.append(
+            PredicateStatistics(
+                expression=expression,
+                position=predicates[0].order.index(i) if predicates else i,
+                evaluations=evaluations,
+                passes=sum(adaptive.passes[i] for adaptive in predicates),
+                cost=total / evaluations if evaluations else 0.0,
+            )
+        )
+    return found
+
+
+def predicate(expression):
+    """
+    Returns a function of an item equivalent to `expression.exists(item)`, built on first
+    use and kept with the expression. `Expression`s looking up a fixed path such as
+    `@.Properties.Type` read it from the item directly, and the branches of `|` stop at
+    the first one matching.
+    """
+    return _compiled(expression, "predicate", lambda: _predicate(expression))
+
+
+def never_raises(expression):
+    """
+    Whether the `predicate()` of `expression` returns for any item, e.g. `@.Type == 'x'`
+    does, but `@.size > 1` raises on a string, `@.a =~ 'x'` on a number and `@.a[0]`
+    on a number too. `AdaptivePredicate` only reorders those.
+    """
+    if type(expression) is Intersect and isinstance(expression.left, list) and isinstance(expression.right, list):
+        return all(never_raises(branch) for branch in _branches(expression))
+    if type(expression) is not Expression:
+        return False
+    keys = static_keys(expression.target)
+    if keys is None or any(is_index for is_index, _ in keys):
+        return False
+    if expression.op is None:
+        return True
+    # A number coerces the value with `int()`, which raises on lists and objects
+    return expression.op in EQUALITY_OPERATORS and not isinstance(expression.value, int)
+
+
+def _compiled(expression, name, build):
+    # Kept with the other compiled functions of the expression, see `JSONPath._compile_once()`
+    compiled = expression.__dict__.setdefault("_compiled", {})
+    function = compiled.get(name)
+    if function is None:
+        # The first one built wins when threads race, so they share its statistics
+        function = compiled.setdefault(name, build())
+    return function
+
+
+def _all_predicate(node):
+    # Whether an item matches all the expressions of a `Filter` or `Negate`
+    return _compiled(node, "items", lambda: _adaptive(node.expressions))
+
+
+def _adaptive(expressions, any_=False):
+    return AdaptivePredicate(
+        [predicate(e) for e in expressions], any_=any_, movable=[never_raises(e) for e in expressions]
+    )
+
+
+def _columnar_rows(node, items):
+    # The indices of the items matching all the expressions, None to test them one by one
+    if len(items) < COLUMNAR_MIN_ITEMS:
+        return None
+    from .columnar import matching_rows
+
+    return matching_rows(node, items)
+
+
+def _predicate(expression):
+    if type(expression) is Intersect and isinstance(expression.left, list) and isinstance(expression.right, list):
+        return _adaptive(_branches(expression), any_=True)
+    if type(expression) is not Expression:
+        return expression.exists
+
+    target = expression.target
+    matches = None if expression.op is None else value_matcher(expression.op, expression.value)
+    keys = static_keys(target)
+    if keys is None:
+
+        def lookup(item):
+            return any(matches is None or matches(data.value) for data in target.ifind(DatumInContext.wrap(item)))
+
+        return lookup
+
+    def get(item):
+        if _jsonpath.auto_id_field is not None:
+            return expression.exists(item)
+        value = static_value(item, keys)
+        if value is NOT_SET:
+            return False
+        return matches is None or matches(value)
+
+    return get
+
+
+def _branches(node):
+    return [*node.left, *node.right]
+
+
+def static_keys(target):
+    """
+    Returns the fields and indices `target` looks up from the item as `(is_index, key)`
+    pairs, or None when it is not such a fixed path, e.g. `@.Tags[0].Key`.
+    """
+    cls = type(target)
+    if cls is This or cls is Root:
+        # The item is given without context, `$` is the item as well
+        return []
+    if cls is Fields:
+        if len(target.fields) != 1 or target.fields[0] == "*":
+            return None
+        return [(False, target.fields[0])]
+    if cls is Index:
+        return [(True, target.index)] if target.index >= 0 else None
+    if cls is StaticPath:
+        target = target.path
+        cls = Child
+    if cls is Child:
+        left, right = static_keys(target.left), static_keys(target.right)
+        if left is None or right is None or type(target.right) is Root:
+            return None
+        return left + right
+    return None
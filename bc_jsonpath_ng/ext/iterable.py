@@ -12,8 +12,15 @@
 # under the License.
 
 import functools
+import heapq
 
-from .. import DatumInContext, JSONPath, This
+from .. import NOT_SET, AutoIdForDatum, DatumInContext, JSONPath, This
+from .. import jsonpath as _jsonpath
+from .columnar import values_at
+from .filter import static_keys
+
+# Lists sorted for their first items only when at least this many times longer
+TOP_RATIO = 32
 
 
 class SortedThis(This):
@@ -25,40 +32,112 @@ class SortedThis(This):
     def __init__(self, expressions=None):
         self.expressions = expressions
 
-    def _compare(self, left, right):
-        left = DatumInContext.wrap(left)
-        right = DatumInContext.wrap(right)
-
-        for expr in self.expressions:
-            field, reverse = expr
-            l_datum = field.find(left)
-            r_datum = field.find(right)
-            if (
-                not l_datum
-                or not r_datum
-                or len(l_datum) > 1
-                or len(r_datum) > 1
-                or l_datum[0].value == r_datum[0].value
-            ):
-                # NOTE(sileht): should we do something if the expression
-                # match multiple fields, for now ignore them
+    def _sort_keys(self, items):
+        # The value of each field for each item, found once rather than at every comparison,
+        # NOT_SET when it has none or several
+        columns = []
+        for field, _ in self.expressions:
+            keys = static_keys(field) if _jsonpath.auto_id_field is None else None
+            if keys:
+                # A fixed path such as `created` is read from the items directly
+                columns.append(values_at(items, keys))
                 continue
-            elif l_datum[0].value < r_datum[0].value:
-                return 1 if reverse else -1
-            else:
-                return -1 if reverse else 1
-        return 0
+            column = []
+            for item in items:
+                found = field.find(DatumInContext.wrap(item))
+                column.append(found[0].value if len(found) == 1 else NOT_SET)
+            columns.append(column)
+        return columns
+
+    def _compare(self, columns):
+        reverses = [reverse for _, reverse in self.expressions]
+
+        def compare(left, right):
+            for column, reverse in zip(columns, reverses):
+                l_value = column[left]
+                r_value = column[right]
+                if l_value is NOT_SET or r_value is NOT_SET or l_value == r_value:
+                    # NOTE(sileht): should we do something if the expression
+                    # match multiple fields, for now ignore them
+                    continue
+                elif l_value < r_value:
+                    return 1 if reverse else -1
+                else:
+                    return -1 if reverse else 1
+            return 0
+
+        return compare
+
+    def _sorted(self, items, count=None):
+        # The first `count` items of the sorted list, all of them if None
+        columns = self._sort_keys(items)
+        if all(_is_totally_ordered(column) for column in columns):
+            order = self._order(columns) if count is None else self._smallest(columns, count)
+        else:
+            # Missing values compare equal to any other, not a total order: the same
+            # comparisons as before give the same order
+            order = sorted(range(len(items)), key=functools.cmp_to_key(self._compare(columns)))
+        return [items[i] for i in order]
+
+    def _order(self, columns):
+        # One stable sort per field from the last one gives the same order as comparing
+        # the fields in turn, without a Python call per comparison
+        order = list(range(len(columns[0])))
+        for column, (_, reverse) in zip(reversed(columns), reversed(self.expressions)):
+            order.sort(key=column.__getitem__, reverse=reverse)
+        return order
+
+    def _smallest(self, columns, count):
+        # `heapq` selects the same rows as a stable sort would put first
+        rows = range(len(columns[0]))
+        reverses = {reverse for _, reverse in self.expressions}
+        if len(reverses) > 1:
+            # Sorting by each field in turn is cheaper than comparing a pair at a time
+            return self._order(columns)[:count]
+        key = columns[0].__getitem__ if len(columns) == 1 else list(zip(*columns)).__getitem__
+        select = heapq.nlargest if reverses.pop() else heapq.nsmallest
+        return select(count, rows, key=key)
 
     def find(self, datum):
         """Return sorted value of This if list or dict."""
         if isinstance(datum.value, dict) and self.expressions:
             return datum
 
+        if isinstance(datum.value, list) and self.expressions:
+            return [DatumInContext.wrap(self._sorted(datum.value))]
         if isinstance(datum.value, (dict, list)):
-            key = functools.cmp_to_key(self._compare) if self.expressions else None
-            return [DatumInContext.wrap(sorted(datum.value, key=key))]
+            return [DatumInContext.wrap(sorted(datum.value))]
         return datum
 
+    def find_top(self, datum, step, count):
+        """
+        Returns the matches of `step`, an index or a slice reading the first `count` items
+        only, on `find(datum)`. When the list is much longer, those items are selected in
+        O(n log count) rather than sorting it all, and the list the matches refer to as their
+        context is only sorted when read. `Child` uses this for `[\\created][0:10]`.
+        """
+        datum = DatumInContext.wrap(datum)
+        items = datum.value
+        top = None
+        if isinstance(items, list) and count * TOP_RATIO < len(items):
+            if self.expressions:
+                top = self._sorted(items, count)
+            elif _is_totally_ordered(items):
+                top = heapq.nsmallest(count, items)
+        if top is None:
+            return [
+                match
+                for sorted_data in self.find(datum)
+                if not isinstance(sorted_data, AutoIdForDatum)
+                for match in step.find(sorted_data)
+            ]
+
+        matches = step.find(DatumInContext(top))
+        context = _SortedList(lambda: self.find(datum)[0].value)
+        for match in matches:
+            match.context = context
+        return matches
+
     def __eq__(self, other):
         return isinstance(other, Len)
 
@@ -69,6 +148,43 @@ class SortedThis(This):
         return "[?%s]" % self.expressions
 
 
+class _SortedList(DatumInContext):
+    # The sorted list of `find_top()`, sorted when its value is first read
+    __slots__ = ("_sort",)
+
+    def __init__(self, sort):
+        super().__init__(None)
+        self._sort = sort
+
+    @property
+    def value(self):
+        if self._sort is not None:
+            _value.__set__(self, self._sort())
+            self._sort = None
+        return _value.__get__(self)
+
+    @value.setter
+    def value(self, value):
+        self._sort = None
+        _value.__set__(self, value)
+
+    def __reduce__(self):
+        # Copied and pickled as the sorted list itself
+        return DatumInContext, (self.value, self.path, self.context)
+
+
+_value = DatumInContext.value
+
+
+def _is_totally_ordered(values):
+    # Whether sorting `values` by `<` is the same as comparing them with `==` then `<`:
+    # all strings, or all numbers without NaN
+    types = set(map(type, values))
+    if types == {str}:
+        return True
+    return types <= {int, float, bool} and all(value == value for value in values)
+
+
 class Len(JSONPath):
     """The JSONPath referring to the len of the current object.
 
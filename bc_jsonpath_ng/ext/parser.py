@@ -15,10 +15,12 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from .. import Child, Fields, Intersect, This, lexer, parser
+from ..cache import expression_cache
 from . import arithmetic as _arithmetic
 from . import filter as _filter
 from . import iterable as _iterable
 from . import string as _string
+from .descent import ExtendedJsonPathDescentParser
 
 if TYPE_CHECKING:
     from bc_jsonpath_ng import JSONPath
@@ -176,5 +178,9 @@ class ExtentedJsonPathParser(parser.JsonPathParser):
     precedence = [("left", "+", "-"), ("left", "*", "/"), *parser.JsonPathParser.precedence, ("nonassoc", "ID")]
 
 
-def parse(path: str, debug: bool = False) -> JSONPath:
-    return ExtentedJsonPathParser(debug=debug).parse(path)
+def parse(path: str, debug: bool = False, backend: str | None = None) -> JSONPath:
+    if parser.resolve_backend(backend) == "descent":
+        return expression_cache.parse(ExtendedJsonPathDescentParser, path)
+    if debug:
+        return ExtentedJsonPathParser(debug=debug).parse(path)
+    return expression_cache.parse(ExtentedJsonPathParser, path)
@@ -0,0 +1,89 @@
+
+# parser_extentedjsonpathparser_jsonpath_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "jsonpathleft+-left*/left,leftDOUBLEDOTleft.leftDOUBLE_ORleft|leftDOUBLE_ANDleft&leftWHEREleftCONTAINSnonassocIDBOOL CONTAINS DOUBLEDOT DOUBLE_AND DOUBLE_OR FILTER_OP FLOAT ID NAMED_OPERATOR NUMBER SORT_DIRECTION WHEREjsonpath : NUMBER operator NUMBER\n        | FLOAT operator FLOAT\n        | ID operator ID\n        | NUMBER operator jsonpath\n        | FLOAT operator jsonpath\n        | jsonpath operator NUMBER\n        | jsonpath operator FLOAT\n        | jsonpath operator jsonpath\n        operator : '+'\n        | '-'\n        | '*'\n        | '/'\n        jsonpath : NAMED_OPERATORexpression : jsonpath\n        | jsonpath FILTER_OP ID\n        | jsonpath FILTER_OP FLOAT\n        | jsonpath FILTER_OP NUMBER\n        | jsonpath FILTER_OP BOOL\n        expressions : expressionexpressions : expressions '&' expressions\n        | expressions DOUBLE_AND expressions\n        expressions : expressions '|' expressions\n        | expressions DOUBLE_OR expressions\n        expressions : '(' expressions ')'filter : '?' expressionsjsonpath : jsonpath '[' filter ']'sort : SORT_DIRECTION jsonpathsorts : sortsorts : sorts sortsjsonpath : jsonpath '[' sorts ']'jsonpath : '@'jsonpath : '!' expressionsjsonpath : jsonpath '.' jsonpath\n        | jsonpath DOUBLEDOT jsonpath\n        | jsonpath WHERE jsonpath\n        | jsonpath '|' jsonpath\n        | jsonpath DOUBLE_OR jsonpath\n        | jsonpath '&' jsonpath\n        | jsonpath DOUBLE_AND jsonpath\n        | jsonpath CONTAINS jsonpath\n        jsonpath : fields_or_anyjsonpath : '$'jsonpath : '[' idx ']'jsonpath : '[' slice ']'jsonpath : '[' fields ']'jsonpath : jsonpath '[' fields ']'jsonpath : jsonpath '[' idx ']'jsonpath : jsonpath '[' slice ']'jsonpath : '(' jsonpath ')'fields_or_any : fields\n        | '*'fields : IDfields : fields ',' fieldsidx : NUMBERslice : '*'slice : maybe_int ':' maybe_intmaybe_int : NUMBER\n        | emptyempty :"
+    
+_lr_action_items = {'NUMBER':([0,6,8,12,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,41,53,55,72,73,74,75,76,79,],[2,34,2,2,46,34,2,2,2,2,2,2,2,2,-9,-10,-11,-12,64,2,2,2,2,91,2,2,2,2,99,]),'FLOAT':([0,8,12,14,16,17,18,19,20,21,22,23,24,25,26,27,28,29,41,53,55,73,74,75,76,79,],[3,3,3,47,3,3,3,3,3,3,3,3,-9,-10,-11,-12,3,66,3,3,3,3,3,3,3,98,]),'ID':([0,6,8,12,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,41,43,53,55,73,74,75,76,79,],[4,37,4,4,4,37,4,4,4,4,4,4,4,4,-9,-10,-11,-12,4,4,68,4,37,4,4,4,4,4,4,97,]),'NAMED_OPERATOR':([0,8,12,14,16,17,18,19,20,21,22,23,24,25,26,27,28,29,41,53,55,73,74,75,76,],[5,5,5,5,5,5,5,5,5,5,5,5,-9,-10,-11,-12,5,5,5,5,5,5,5,5,5,]),'@':([0,8,12,14,16,17,18,19,20,21,22,23,24,25,26,27,28,29,41,53,55,73,74,75,76,],[7,7,7,7,7,7,7,7,7,7,7,7,-9,-10,-11,-12,7,7,7,7,7,7,7,7,7,]),'!':([0,8,12,14,16,17,18,19,20,21,22,23,24,25,26,27,28,29,41,53,55,73,74,75,76,],[8,8,8,8,8,8,8,8,8,8,8,8,-9,-10,-11,-12,8,8,8,8,8,8,8,8,8,]),'$':([0,8,12,14,16,17,18,19,20,21,22,23,24,25,26,27,28,29,41,53,55,73,74,75,76,],[10,10,10,10,10,10,10,10,10,10,10,10,-9,-10,-11,-12,10,10,10,10,10,10,10,10,10,]),'[':([0,1,4,5,7,8,9,10,11,12,13,14,16,17,18,19,20,21,22,23,24,25,26,27,28,29,37,39,40,41,42,44,45,46,47,53,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,78,80,81,82,84,85,86,87,89,92,93,94,95,96,97,98,99,100,],[6,15,-52,-13,-31,6,-41,-42,-50,6,-51,6,6,6,6,6,6,6,6,6,-9,-10,-11,-12,6,6,-52,-32,-19,6,15,15,15,-6,-7,6,6,-33,-34,-35,-36,-37,-38,-39,-40,-1,15,-2,15,-3,-43,-44,-45,6,6,6,6,15,-53,-49,-26,-30,-46,-47,-48,15,-20,-21,-22,-23,-24,-15,-16,-17,-18,]),'(':([0,8,12,14,16,17,18,19,20,21,22,23,24,25,26,27,28,29,41,53,55,73,74,75,76,],[12,41,12,12,12,12,12,12,12,12,12,12,-9,-10,-11,-12,12,12,41,41,12,41,41,41,41,]),'*':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,37,39,40,41,42,44,45,46,47,53,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,78,80,81,82,84,85,86,87,89,92,93,94,95,96,97,98,99,100,],[13,26,26,26,-52,-13,35,-31,13,-41,-42,-50,13,-51,13,35,13,13,13,13,13,13,13,13,-9,-10,-11,-12,13,13,-52,-32,-19,13,26,26,26,26,26,13,13,-33,-34,-35,-36,-37,-38,-39,-40,26,26,26,26,-3,-43,-44,-45,13,13,13,13,26,-53,-49,-26,-30,-46,-47,-48,26,-20,-21,-22,-23,-24,-15,-16,-17,-18,]),'$end':([1,4,5,7,9,10,11,13,37,39,40,42,45,46,47,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,80,81,82,84,85,86,87,92,93,94,95,96,97,98,99,100,],[0,-52,-13,-31,-41,-42,-50,-51,-52,-32,-19,-14,-8,-6,-7,-33,-34,-35,-36,-37,-38,-39,-40,-1,-4,-2,-5,-3,-43,-44,-45,-53,-49,-26,-30,-46,-47,-48,-20,-21,-22,-23,-24,-15,-16,-17,-18,]),'.':([1,4,5,7,9,10,11,13,37,39,40,42,44,45,46,47,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,78,80,81,82,84,85,86,87,89,92,93,94,95,96,97,98,99,100,],[16,-52,-13,-31,-41,-42,-50,-51,-52,-32,-19,16,16,16,-6,-7,-33,16,-35,-36,-37,-38,-39,-40,-1,16,-2,16,-3,-43,-44,-45,16,-53,-49,-26,-30,-46,-47,-48,16,-20,-21,-22,-23,-24,-15,-16,-17,-18,]),'DOUBLEDOT':([1,4,5,7,9,10,11,13,37,39,40,42,44,45,46,47,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,78,80,81,82,84,85,86,87,89,92,93,94,95,96,97,98,99,100,],[17,-52,-13,-31,-41,-42,-50,-51,-52,-32,-19,17,17,17,-6,-7,-33,-34,-35,-36,-37,-38,-39,-40,-1,17,-2,17,-3,-43,-44,-45,17,-53,-49,-26,-30,-46,-47,-48,17,-20,-21,-22,-23,-24,-15,-16,-17,-18,]),'WHERE':([1,4,5,7,9,10,11,13,37,39,40,42,44,45,46,47,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,78,80,81,82,84,85,86,87,89,92,93,94,95,96,97,98,99,100,],[18,-52,-13,-31,-41,-42,-50,-51,-52,-32,-19,18,18,18,-6,-7,18,18,-35,18,18,18,18,-40,-1,18,-2,18,-3,-43,-44,-45,18,-53,-49,-26,-30,-46,-47,-48,18,-20,-21,-22,-23,-24,-15,-16,-17,-18,]),'|':([1,4,5,7,9,10,11,13,37,39,40,42,44,45,46,47,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,77,78,80,81,82,84,85,86,87,88,89,92,93,94,95,96,97,98,99,100,],[19,-52,-13,-31,-41,-42,-50,-51,-52,75,-19,19,19,19,-6,-7,19,19,-35,-36,19,-38,-39,-40,-1,19,-2,19,-3,-43,-44,-45,75,19,-53,-49,-26,-30,-46,-47,-48,75,19,-20,-21,-22,75,-24,-15,-16,-17,-18,]),'DOUBLE_OR':([1,4,5,7,9,10,11,13,37,39,40,42,44,45,46,47,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,77,78,80,81,82,84,85,86,87,88,89,92,93,94,95,96,97,98,99,100,],[20,-52,-13,-31,-41,-42,-50,-51,-52,76,-19,20,20,20,-6,-7,20,20,-35,-36,-37,-38,-39,-40,-1,20,-2,20,-3,-43,-44,-45,76,20,-53,-49,-26,-30,-46,-47,-48,76,20,-20,-21,-22,-23,-24,-15,-16,-17,-18,]),'&':([1,4,5,7,9,10,11,13,37,39,40,42,44,45,46,47,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,77,78,80,81,82,84,85,86,87,88,89,92,93,94,95,96,97,98,99,100,],[21,-52,-13,-31,-41,-42,-50,-51,-52,73,-19,21,21,21,-6,-7,21,21,-35,21,21,-38,21,-40,-1,21,-2,21,-3,-43,-44,-45,73,21,-53,-49,-26,-30,-46,-47,-48,73,21,-20,73,73,73,-24,-15,-16,-17,-18,]),'DOUBLE_AND':([1,4,5,7,9,10,11,13,37,39,40,42,44,45,46,47,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,77,78,80,81,82,84,85,86,87,88,89,92,93,94,95,96,97,98,99,100,],[22,-52,-13,-31,-41,-42,-50,-51,-52,74,-19,22,22,22,-6,-7,22,22,-35,22,22,-38,-39,-40,-1,22,-2,22,-3,-43,-44,-45,74,22,-53,-49,-26,-30,-46,-47,-48,74,22,-20,-21,74,74,-24,-15,-16,-17,-18,]),'CONTAINS':([1,4,5,7,9,10,11,13,37,39,40,42,44,45,46,47,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,78,80,81,82,84,85,86,87,89,92,93,94,95,96,97,98,99,100,],[23,-52,-13,-31,-41,-42,-50,-51,-52,-32,-19,23,23,23,-6,-7,23,23,23,23,23,23,23,-40,-1,23,-2,23,-3,-43,-44,-45,23,-53,-49,-26,-30,-46,-47,-48,23,-20,-21,-22,-23,-24,-15,-16,-17,-18,]),'+':([1,2,3,4,5,7,9,10,11,13,37,39,40,42,44,45,46,47,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,78,80,81,82,84,85,86,87,89,92,93,94,95,96,97,98,99,100,],[24,24,24,-52,-13,-31,-41,-42,-50,-51,-52,-32,-19,24,24,24,24,24,-33,-34,-35,-36,-37,-38,-39,-40,24,24,24,24,-3,-43,-44,-45,24,-53,-49,-26,-30,-46,-47,-48,24,-20,-21,-22,-23,-24,-15,-16,-17,-18,]),'-':([1,2,3,4,5,7,9,10,11,13,37,39,40,42,44,45,46,47,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,78,80,81,82,84,85,86,87,89,92,93,94,95,96,97,98,99,100,],[25,25,25,-52,-13,-31,-41,-42,-50,-51,-52,-32,-19,25,25,25,25,25,-33,-34,-35,-36,-37,-38,-39,-40,25,25,25,25,-3,-43,-44,-45,25,-53,-49,-26,-30,-46,-47,-48,25,-20,-21,-22,-23,-24,-15,-16,-17,-18,]),'/':([1,2,3,4,5,7,9,10,11,13,37,39,40,42,44,45,46,47,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,78,80,81,82,84,85,86,87,89,92,93,94,95,96,97,98,99,100,],[27,27,27,-52,-13,-31,-41,-42,-50,-51,-52,-32,-19,27,27,27,27,27,-33,-34,-35,-36,-37,-38,-39,-40,27,27,27,27,-3,-43,-44,-45,27,-53,-49,-26,-30,-46,-47,-48,27,-20,-21,-22,-23,-24,-15,-16,-17,-18,]),',':([4,11,33,37,50,80,],[-52,43,43,-52,43,-53,]),'FILTER_OP':([4,5,7,9,10,11,13,37,39,40,42,45,46,47,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,78,80,81,82,84,85,86,87,92,93,94,95,96,97,98,99,100,],[-52,-13,-31,-41,-42,-50,-51,-52,-32,-19,79,-8,-6,-7,-33,-34,-35,-36,-37,-38,-39,-40,-1,-4,-2,-5,-3,-43,-44,-45,79,-53,-49,-26,-30,-46,-47,-48,-20,-21,-22,-23,-24,-15,-16,-17,-18,]),')':([4,5,7,9,10,11,13,37,39,40,42,44,45,46,47,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,77,78,80,81,82,84,85,86,87,92,93,94,95,96,97,98,99,100,],[-52,-13,-31,-41,-42,-50,-51,-52,-32,-19,-14,81,-8,-6,-7,-33,-34,-35,-36,-37,-38,-39,-40,-1,-4,-2,-5,-3,-43,-44,-45,96,81,-53,-49,-26,-30,-46,-47,-48,-20,-21,-22,-23,-24,-15,-16,-17,-18,]),']':([4,5,7,9,10,11,13,31,32,33,34,35,37,38,39,40,42,45,46,47,48,49,50,51,52,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,],[-52,-13,-31,-41,-42,-50,-51,69,70,71,-54,-55,-52,-58,-32,-19,-14,-8,-6,-7,82,84,85,86,87,-28,-33,-34,-35,-36,-37,-38,-39,-40,-1,-4,-2,-5,-3,-43,-44,-45,-59,-53,-49,-26,-29,-30,-46,-47,-48,-25,-27,-56,-57,-20,-21,-22,-23,-24,-15,-16,-17,-18,]),'SORT_DIRECTION':([4,5,7,9,10,11,13,15,37,39,40,42,45,46,47,49,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,80,81,82,83,84,85,86,87,89,92,93,94,95,96,97,98,99,100,],[-52,-13,-31,-41,-42,-50,-51,55,-52,-32,-19,-14,-8,-6,-7,55,-28,-33,-34,-35,-36,-37,-38,-39,-40,-1,-4,-2,-5,-3,-43,-44,-45,-53,-49,-26,55,-30,-46,-47,-48,-27,-20,-21,-22,-23,-24,-15,-16,-17,-18,]),':':([6,15,34,36,38,],[-59,-59,-57,72,-58,]),'?':([15,],[53,]),'BOOL':([79,],[100,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'jsonpath':([0,8,12,14,16,17,18,19,20,21,22,23,28,29,41,53,55,73,74,75,76,],[1,42,44,45,56,57,58,59,60,61,62,63,65,67,78,42,89,42,42,42,42,]),'fields_or_any':([0,8,12,14,16,17,18,19,20,21,22,23,28,29,41,53,55,73,74,75,76,],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'fields':([0,6,8,12,14,15,16,17,18,19,20,21,22,23,28,29,41,43,53,55,73,74,75,76,],[11,33,11,11,11,50,11,11,11,11,11,11,11,11,11,11,11,80,11,11,11,11,11,11,]),'operator':([1,2,3,4,42,44,45,46,47,56,57,58,59,60,61,62,63,64,65,66,67,78,89,],[14,28,29,30,14,14,14,28,29,14,14,14,14,14,14,14,14,28,14,29,14,14,14,]),'idx':([6,15,],[31,51,]),'slice':([6,15,],[32,52,]),'maybe_int':([6,15,72,],[36,36,90,]),'empty':([6,15,72,],[38,38,38,]),'expressions':([8,41,53,73,74,75,76,],[39,77,88,92,93,94,95,]),'expression':([8,41,53,73,74,75,76,],[40,40,40,40,40,40,40,]),'filter':([15,],[48,]),'sorts':([15,49,83,],[49,83,83,]),'sort':([15,49,83,],[54,54,54,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> jsonpath","S'",1,None,None,None),
+  ('jsonpath -> NUMBER operator NUMBER','jsonpath',3,'p_jsonpath_operator_jsonpath','parser.py',70),
+  ('jsonpath -> FLOAT operator FLOAT','jsonpath',3,'p_jsonpath_operator_jsonpath','parser.py',71),
+  ('jsonpath -> ID operator ID','jsonpath',3,'p_jsonpath_operator_jsonpath','parser.py',72),
+  ('jsonpath -> NUMBER operator jsonpath','jsonpath',3,'p_jsonpath_operator_jsonpath','parser.py',73),
+  ('jsonpath -> FLOAT operator jsonpath','jsonpath',3,'p_jsonpath_operator_jsonpath','parser.py',74),
+  ('jsonpath -> jsonpath operator NUMBER','jsonpath',3,'p_jsonpath_operator_jsonpath','parser.py',75),
+  ('jsonpath -> jsonpath operator FLOAT','jsonpath',3,'p_jsonpath_operator_jsonpath','parser.py',76),
+  ('jsonpath -> jsonpath operator jsonpath','jsonpath',3,'p_jsonpath_operator_jsonpath','parser.py',77),
+  ('operator -> +','operator',1,'p_operator','parser.py',90),
+  ('operator -> -','operator',1,'p_operator','parser.py',91),
+  ('operator -> *','operator',1,'p_operator','parser.py',92),
+  ('operator -> /','operator',1,'p_operator','parser.py',93),
+  ('jsonpath -> NAMED_OPERATOR','jsonpath',1,'p_jsonpath_named_operator','parser.py',98),
+  ('expression -> jsonpath','expression',1,'p_expression','parser.py',113),
+  ('expression -> jsonpath FILTER_OP ID','expression',3,'p_expression','parser.py',114),
+  ('expression -> jsonpath FILTER_OP FLOAT','expression',3,'p_expression','parser.py',115),
+  ('expression -> jsonpath FILTER_OP NUMBER','expression',3,'p_expression','parser.py',116),
+  ('expression -> jsonpath FILTER_OP BOOL','expression',3,'p_expression','parser.py',117),
+  ('expressions -> expression','expressions',1,'p_expressions_expression','parser.py',126),
+  ('expressions -> expressions & expressions','expressions',3,'p_expressions_and','parser.py',130),
+  ('expressions -> expressions DOUBLE_AND expressions','expressions',3,'p_expressions_and','parser.py',131),
+  ('expressions -> expressions | expressions','expressions',3,'p_expressions_or','parser.py',136),
+  ('expressions -> expressions DOUBLE_OR expressions','expressions',3,'p_expressions_or','parser.py',137),
+  ('expressions -> ( expressions )','expressions',3,'p_expressions_parens','parser.py',142),
+  ('filter -> ? expressions','filter',2,'p_filter','parser.py',146),
+  ('jsonpath -> jsonpath [ filter ]','jsonpath',4,'p_jsonpath_filter','parser.py',150),
+  ('sort -> SORT_DIRECTION jsonpath','sort',2,'p_sort','parser.py',154),
+  ('sorts -> sort','sorts',1,'p_sorts_sort','parser.py',158),
+  ('sorts -> sorts sorts','sorts',2,'p_sorts_comma','parser.py',162),
+  ('jsonpath -> jsonpath [ sorts ]','jsonpath',4,'p_jsonpath_sort','parser.py',166),
+  ('jsonpath -> @','jsonpath',1,'p_jsonpath_this','parser.py',171),
+  ('jsonpath -> ! expressions','jsonpath',2,'p_jsonpath_negate','parser.py',175),
+  ('jsonpath -> jsonpath . jsonpath','jsonpath',3,'p_jsonpath_binop','parser.py',178),
+  ('jsonpath -> jsonpath DOUBLEDOT jsonpath','jsonpath',3,'p_jsonpath_binop','parser.py',179),
+  ('jsonpath -> jsonpath WHERE jsonpath','jsonpath',3,'p_jsonpath_binop','parser.py',180),
+  ('jsonpath -> jsonpath | jsonpath','jsonpath',3,'p_jsonpath_binop','parser.py',181),
+  ('jsonpath -> jsonpath DOUBLE_OR jsonpath','jsonpath',3,'p_jsonpath_binop','parser.py',182),
+  ('jsonpath -> jsonpath & jsonpath','jsonpath',3,'p_jsonpath_binop','parser.py',183),
+  ('jsonpath -> jsonpath DOUBLE_AND jsonpath','jsonpath',3,'p_jsonpath_binop','parser.py',184),
+  ('jsonpath -> jsonpath CONTAINS jsonpath','jsonpath',3,'p_jsonpath_binop','parser.py',185),
+  ('jsonpath -> fields_or_any','jsonpath',1,'p_jsonpath_fields','parser.py',203),
+  ('jsonpath -> $','jsonpath',1,'p_jsonpath_root','parser.py',216),
+  ('jsonpath -> [ idx ]','jsonpath',3,'p_jsonpath_idx','parser.py',220),
+  ('jsonpath -> [ slice ]','jsonpath',3,'p_jsonpath_slice','parser.py',224),
+  ('jsonpath -> [ fields ]','jsonpath',3,'p_jsonpath_fieldbrackets','parser.py',228),
+  ('jsonpath -> jsonpath [ fields ]','jsonpath',4,'p_jsonpath_child_fieldbrackets','parser.py',232),
+  ('jsonpath -> jsonpath [ idx ]','jsonpath',4,'p_jsonpath_child_idxbrackets','parser.py',236),
+  ('jsonpath -> jsonpath [ slice ]','jsonpath',4,'p_jsonpath_child_slicebrackets','parser.py',240),
+  ('jsonpath -> ( jsonpath )','jsonpath',3,'p_jsonpath_parens','parser.py',244),
+  ('fields_or_any -> fields','fields_or_any',1,'p_fields_or_any','parser.py',249),
+  ('fields_or_any -> *','fields_or_any',1,'p_fields_or_any','parser.py',250),
+  ('fields -> ID','fields',1,'p_fields_id','parser.py',257),
+  ('fields -> fields , fields','fields',3,'p_fields_comma','parser.py',261),
+  ('idx -> NUMBER','idx',1,'p_idx','parser.py',265),
+  ('slice -> *','slice',1,'p_slice_any','parser.py',269),
+  ('slice -> maybe_int : maybe_int','slice',3,'p_slice','parser.py',273),
+  ('maybe_int -> NUMBER','maybe_int',1,'p_maybe_int','parser.py',277),
+  ('maybe_int -> empty','maybe_int',1,'p_maybe_int','parser.py',278),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',282),
+]
@@ -0,0 +1,189 @@
+"""
+An index of the keys of a document, to answer `..key` without walking the document.
+
+`index_document(document)` walks the document once and records, for each key, the
+objects holding it. While the index is registered, `Descendants` with a right hand
+side of plain field names (`$..name`, `$.Resources..Type`, `$..Key,Value`) looks the
+keys up instead of walking every node below its left matches, both in `find()` and
+in compiled expressions, so it takes time in the number of matches rather than the
+size of the document. The matches are the same, in the same order.
+
+Indexes are registered by identity of the document. The index only records the
+structure of the document: changing the value of a key is seen by later queries,
+but adding or removing keys, or replacing an object or a list, is not, and the
+document must then be indexed again or `invalidate()`d.
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Any, Callable
+
+from bc_jsonpath_ng.jsonpath import NOT_SET, ROOT, DatumInContext, _document_indexes, field_path, index_path
+
+if TYPE_CHECKING:
+    from typing import Hashable, Iterator
+
+# Registered indexes beyond this drop the oldest one, rather than keeping every document ever indexed alive
+MAX_INDEXES = 64
+
+_lock = threading.Lock()
+
+
+class DocumentIndex:
+    """
+    The objects and lists of a document in pre-order, and for each key the objects holding it.
+    """
+
+    def __init__(self, document: Any) -> None:
+        self.document = document
+        # One node per object or list: its value, parent node, path from the parent, and one
+        # past its last descendant, so the nodes below a node are a range of node numbers
+        self._values: list[Any] = [document]
+        self._parents: list[int] = [-1]
+        self._paths: list[Any] = [None]
+        self._ends: list[int] = [1]
+        # Key -> nodes of the objects holding it, in increasing order
+        self._keys: dict[Hashable, list[int]] = {}
+        # id() of a value -> its first node
+        self._nodes: dict[int, int] = {id(document): 0}
+        self._build()
+
+    def _build(self) -> None:
+        values, parents, paths, ends, keys, nodes = (
+            self._values,
+            self._parents,
+            self._paths,
+            self._ends,
+            self._keys,
+            self._nodes,
+        )
+        stack = [(0, _children(self.document))]
+        if isinstance(self.document, dict):
+            for key in self.document:
+                keys.setdefault(key, []).append(0)
+        while stack:
+            parent, children = stack[-1]
+            for path, value in children:
+                if isinstance(value, (list, dict)):
+                    node = len(values)
+                    values.append(value)
+                    parents.append(parent)
+                    paths.append(path)
+                    ends.append(node + 1)
+                    nodes.setdefault(id(value), node)
+                    if isinstance(value, dict):
+                        for key in value:
+                            keys.setdefault(key, []).append(node)
+                    stack.append((node, _children(value)))
+                    break
+            else:
+                stack.pop()
+                ends[parent] = len(values)
+
+    def find(self, *fields: Hashable) -> list[DatumInContext]:
+        """
+        Returns the matches of `$..<fields>` in the document.
+        """
+        return list(self._descendants(DatumInContext(self.document, path=ROOT), self.document, fields, DatumInContext))
+
+    def _descendants(
+        self, top: Any, value: Any, fields: tuple, make: Callable[[Any, Any, Any], Any]
+    ) -> Iterator[Any] | None:
+        """
+        Yields the matches of `Fields(*fields)` at `value` and below it, built with
+        `make(value, path, context)` from `top`, the match of `value`. Returns None when
+        `value` is not an object or list of the document.
+        """
+        node = self._nodes.get(id(value))
+        if node is None or self._values[node] is not value:
+            return None
+        end = self._ends[node]
+        holders = []
+        for field in fields:
+            found = self._keys.get(field, ())
+            holders.append(found[bisect_left(found, node) : bisect_left(found, end)])
+        if len(holders) == 1:
+            return self._matches(top, node, holders[0], fields, make)
+        return self._matches(top, node, sorted(set().union(*holders)), fields, make)
+
+    def _matches(self, top: Any, node: int, holders: list[int], fields: tuple, make: Callable) -> Iterator[Any]:
+        values, parents, paths = self._values, self._parents, self._paths
+        # The matches of the nodes on the way, shared between their descendants as with `find()`
+        built = {node: top}
+        for holder in holders:
+            chain = []
+            ancestor = holder
+            while ancestor not in built:
+                chain.append(ancestor)
+                ancestor = parents[ancestor]
+            context = built[ancestor]
+            for ancestor in reversed(chain):
+                context = built[ancestor] = make(values[ancestor], paths[ancestor], context)
+            value = values[holder]
+            for field in fields:
+                field_value = value.get(field, NOT_SET)
+                if field_value is not NOT_SET:
+                    yield make(field_value, field_path(field), context)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} of {len(self)} objects and lists, {len(self._keys)} keys>"
+
+
+def _children(value: Any) -> Iterator[tuple[Any, Any]]:
+    if isinstance(value, list):
+        for i in range(len(value)):
+            yield index_path(i), value[i]
+    elif isinstance(value, dict):
+        for field in value:
+            yield field_path(field), value[field]
+
+
+def index_document(document: Any) -> DocumentIndex:
+    """
+    Indexes `document` and registers the index for the queries on it, unless it already has one.
+    """
+    index = get_index(document)
+    if index is None:
+        index = DocumentIndex(document)
+        with _lock:
+            _document_indexes[id(document)] = index
+            while len(_document_indexes) > MAX_INDEXES:
+                del _document_indexes[next(iter(_document_indexes))]
+    return index
+
+
+def get_index(document: Any) -> DocumentIndex | None:
+    """
+    Returns the index registered for `document`, or None.
+    """
+    index = _document_indexes.get(id(document))
+    return index if index is not None and index.document is document else None
+
+
+def invalidate(document: Any = NOT_SET) -> int:
+    """
+    Drops the index of `document` (of all documents if not given) and returns how many were removed.
+    """
+    with _lock:
+        if document is NOT_SET:
+            count = len(_document_indexes)
+            _document_indexes.clear()
+            return count
+        if get_index(document) is None:
+            return 0
+        del _document_indexes[id(document)]
+        return 1
+
+
+def descendants(root: Any, top: Any, value: Any, fields: tuple, make: Callable) -> Iterator[Any] | None:
+    """
+    The matches of `Fields(*fields)` at `value` and below, from the index of the document
+    `root`, or None if it has none. See `DocumentIndex._descendants()`.
+    """
+    index = get_index(root)
+    return None if index is None else index._descendants(top, value, fields, make)
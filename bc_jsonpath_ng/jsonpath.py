@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-import logging
-from typing import Any
-
-# Get logger name
-logger = logging.getLogger(__name__)
+# Not imported from `typing`, which is not needed at runtime and slow to import
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Callable, Iterator
 
 # Turn on/off the automatic creation of id attributes
 # ... could be a kwarg pervasively but uses are rare and simple today
@@ -14,6 +13,15 @@ NOT_SET = object()
 LIST_KEY = object()
 
 
+def __getattr__(name):
+    # Importing `logging` costs more than the rest of the package, get the logger on first use
+    if name == "logger":
+        import logging
+
+        return logging.getLogger(__name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class JSONPath:
     """
     The base class for JSONPath abstract syntax; those
@@ -29,6 +37,37 @@ class JSONPath:
         """
         raise NotImplementedError()
 
+    def ifind(self, data: Any) -> Iterator[DatumInContext]:
+        """
+        Yields the matches of `find()` one by one, only looking for the next one when it is asked for.
+        """
+        yield from self.find(data)
+
+    def first(self, data: Any) -> DatumInContext | None:
+        """
+        Returns the first match of `find()`, or None, without looking for the others.
+        """
+        for datum in self.ifind(data):
+            return datum
+        return None
+
+    def exists(self, data: Any) -> bool:
+        """
+        Returns whether `find()` matches anything, stopping at the first match.
+        """
+        for _ in self.ifind(data):
+            return True
+        return False
+
+    def find_distinct(self, data: Any) -> list[DatumInContext]:
+        """
+        Returns the matches of `find()` without the repeats of a node already matched, which
+        `bc_jsonpath_ng.distinct` drops as soon as `..` or a union produces them.
+        """
+        from .distinct import find_distinct
+
+        return find_distinct(self, data)
+
     def find_or_create(self, data: dict[str, Any]) -> list[DatumInContext]:
         return self.find(data)
 
@@ -73,7 +112,98 @@ class JSONPath:
         if isinstance(value, DatumInContext):
             return value
         else:
-            return DatumInContext(value, path=Root(), context=None)
+            return DatumInContext(value, path=ROOT, context=None)
+
+    def optimize(self) -> JSONPath:
+        """
+        Returns an equivalent expression rewritten by `bc_jsonpath_ng.optimizer` to find faster.
+        """
+        from .optimizer import optimize
+
+        return optimize(self)
+
+    def compile(self, paths: bool = False) -> Callable[[Any], list]:  # noqa: A003
+        """
+        Returns a function built by `bc_jsonpath_ng.compiler` taking a document and returning
+        the values `find()` matches in it, or the `DatumInContext`s themselves if `paths` is set.
+        """
+        from .compiler import compile_expression
+
+        return compile_expression(self, paths)
+
+    def find_values(self, data: Any) -> list[Any]:
+        """
+        Returns the values of the matches of `find()`, without building their
+        `DatumInContext`s, paths and contexts.
+        """
+        return self._compile_once("values")(data)
+
+    def find_paths(self, data: Any) -> list[tuple]:
+        """
+        Returns the `full_path` of each match of `find()` as a tuple of field names
+        and indices from the root of `data`, e.g. `("Resources", "Bucket", "Tags", 0)`.
+        Values which are not in `data`, such as `len` or arithmetic results, have `()`.
+        """
+        return self._compile_once("paths")(data)
+
+    def _compile_once(self, mode: str) -> Callable[[Any], list]:
+        # Compiled on first use and kept with the expression, which the cache shares
+        compiled = self.__dict__.setdefault("_compiled", {})
+        function = compiled.get(mode)
+        if function is None:
+            from .compiler import compile_expression, compile_keys
+
+            function = compiled[mode] = compile_expression(self) if mode == "values" else compile_keys(self)
+        return function
+
+    def __getstate__(self):
+        # The compiled functions are rebuilt on demand rather than pickled
+        state = self.__dict__.copy()
+        state.pop("_compiled", None)
+        return state
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes this expression in the compact format of `bc_jsonpath_ng.serialization`.
+        """
+        from .serialization import to_bytes
+
+        return to_bytes(self)
+
+    @staticmethod
+    def from_bytes(data: bytes) -> JSONPath:
+        """
+        Rebuilds an expression serialized by `to_bytes()`, without parsing it again.
+        """
+        from .serialization import from_bytes
+
+        return from_bytes(data)
+
+    def __copy__(self):
+        # The default copy, rather than the round trip of `__reduce_ex__()`
+        copied = type(self).__new__(type(self))
+        copied.__dict__.update(self.__getstate__())
+        return copied
+
+    def __deepcopy__(self, memo):
+        from copy import deepcopy
+
+        copied = memo[id(self)] = type(self).__new__(type(self))
+        copied.__dict__.update(deepcopy(self.__getstate__(), memo))
+        return copied
+
+    def __reduce_ex__(self, protocol):
+        # Pickle the whole tree as one `to_bytes()` payload; expressions holding nodes the
+        # format does not know about are pickled the default way
+        from .exceptions import JsonPathSerializationError
+        from .serialization import from_bytes, is_serializable, to_bytes
+
+        if is_serializable(self):
+            try:
+                return from_bytes, (to_bytes(self),)
+            except JsonPathSerializationError:
+                pass
+        return super().__reduce_ex__(protocol)
 
 
 class DatumInContext:
@@ -101,10 +231,13 @@ class DatumInContext:
         else:
             return cls(data)
 
+    # One per match, keep them small
+    __slots__ = ("context", "path", "value")
+
     def __init__(self, value, path=None, context=None):
         self.value = value
-        self.path = path or This()
-        self.context = None if context is None else DatumInContext.wrap(context)
+        self.path = path or THIS
+        self.context = context if context is None or isinstance(context, DatumInContext) else DatumInContext(context)
 
     def in_context(self, context, path):
         context = DatumInContext.wrap(context)
@@ -162,6 +295,8 @@ class AutoIdForDatum(DatumInContext):
     than `None`.
     """
 
+    __slots__ = ("datum", "id_field")
+
     def __init__(self, datum, id_field=None):
         """
         Invariant is that datum.path is the path from context to datum. The auto id
@@ -204,12 +339,10 @@ class Root(JSONPath):
 
     def find(self, data):
         if not isinstance(data, DatumInContext):
-            return [DatumInContext(data, path=Root(), context=None)]
-        else:
-            if data.context is None:
-                return [DatumInContext(data.value, context=None, path=Root())]
-            else:
-                return Root().find(data.context)
+            return [DatumInContext(data, path=ROOT, context=None)]
+        while data.context is not None:
+            data = data.context
+        return [DatumInContext(data.value, context=None, path=ROOT)]
 
     def update(self, data, val):
         return val
@@ -266,6 +399,19 @@ class Child(JSONPath):
         Extra special case: auto ids do not have children,
         so cut it off right now rather than auto id the auto id
         """
+        left = self.left
+        if type(left) is Child and (type(self.right) is Index or type(self.right) is Slice):
+            count = _leading_count(self.right)
+            find_top = getattr(left.right, "find_top", None)
+            if count is not None and find_top is not None:
+                # A sorted list followed by its first items, e.g. `[\created][0:10]`,
+                # only selects those
+                return [
+                    submatch
+                    for subdata in left.left.find(datum)
+                    if not isinstance(subdata, AutoIdForDatum)
+                    for submatch in find_top(subdata, self.right, count)
+                ]
 
         return [
             submatch
@@ -274,6 +420,21 @@ class Child(JSONPath):
             for submatch in self.right.find(subdata)
         ]
 
+    def ifind(self, datum):
+        left = self.left
+        if type(left) is Child and (type(self.right) is Index or type(self.right) is Slice):
+            count = _leading_count(self.right)
+            find_top = getattr(left.right, "find_top", None)
+            if count is not None and find_top is not None:
+                # Same as `find()`
+                for subdata in left.left.ifind(datum):
+                    if not isinstance(subdata, AutoIdForDatum):
+                        yield from find_top(subdata, self.right, count)
+                return
+        for subdata in self.left.ifind(datum):
+            if not isinstance(subdata, AutoIdForDatum):
+                yield from self.right.ifind(subdata)
+
     def update(self, data, val):
         for datum in self.left.find(data):
             self.right.update(datum.value, val)
@@ -311,6 +472,15 @@ class Child(JSONPath):
         return f"{self.__class__.__name__}({self.left!r}, {self.right!r})"
 
 
+def _leading_count(step):
+    # How many items from the start of a list `step` reads at most, None if not bounded
+    if type(step) is Index:
+        return step.index + 1 if step.index >= 0 else None
+    if step.end is None or step.end < 0 or (step.start or 0) < 0 or (step.step or 1) < 0:
+        return None
+    return step.end
+
+
 class Parent(JSONPath):
     """
     JSONPath that matches the parent node of the current match.
@@ -347,7 +517,12 @@ class Where(JSONPath):
         self.right = right
 
     def find(self, data):
-        return [subdata for subdata in self.left.find(data) if self.right.find(subdata)]
+        return [subdata for subdata in self.left.find(data) if self.right.exists(subdata)]
+
+    def ifind(self, data):
+        for subdata in self.left.ifind(data):
+            if self.right.exists(subdata):
+                yield subdata
 
     def update(self, data, val):
         for datum in self.find(data):
@@ -388,33 +563,43 @@ class Descendants(JSONPath):
         if not isinstance(left_matches, list):
             left_matches = [left_matches]
 
-        def match_recursively(datum):
-            right_matches = self.right.find(datum)
-
-            # Manually do the * or [*] to avoid coercion and recurse just the right-hand pattern
-            if isinstance(datum.value, list):
-                recursive_matches = [
-                    submatch
-                    for i in range(0, len(datum.value))
-                    for submatch in match_recursively(DatumInContext(datum.value[i], context=datum, path=Index(i)))
-                ]
-
-            elif isinstance(datum.value, dict):
-                recursive_matches = [
-                    submatch
-                    for field in datum.value
-                    for submatch in match_recursively(
-                        DatumInContext(datum.value[field], context=datum, path=Fields(field))
-                    )
-                ]
+        found = []
+        for left_match in left_matches:
+            indexed = self._indexed(left_match)
+            if indexed is not None:
+                found.extend(indexed)
+                continue
+            # Manually do the * or [*] to avoid coercion and match just the right-hand pattern
+            for descendant in _preorder(left_match, _child_datums):
+                found.extend(self.right.find(descendant))
+        return found
 
-            else:
-                recursive_matches = []
+    def ifind(self, datum):
+        # The left side, usually `$` or a few fields, is not worth a lazy walk
+        left_matches = self.left.find(datum)
+        if not isinstance(left_matches, list):
+            left_matches = [left_matches]
+        for left_match in left_matches:
+            indexed = self._indexed(left_match)
+            if indexed is not None:
+                yield from indexed
+                continue
+            for descendant in _preorder(left_match, _child_datums):
+                yield from self.right.ifind(descendant)
 
-            return right_matches + list(recursive_matches)
+    def _indexed(self, left_match):
+        # The matches from the index of the document, if it has one (see `bc_jsonpath_ng.index`)
+        if not _document_indexes or type(self.right) is not Fields:
+            return None
+        fields = self.right.fields
+        if "*" in fields or auto_id_field in fields:
+            return None
+        from .index import descendants
 
-        # TODO: repeatable iterator instead of list?
-        return [submatch for left_match in left_matches for submatch in match_recursively(left_match)]
+        root = left_match
+        while root.context is not None:
+            root = root.context
+        return descendants(root.value, left_match, left_match.value, fields, DatumInContext)
 
     def is_singular(self):
         return False
@@ -425,24 +610,11 @@ class Descendants(JSONPath):
         if not isinstance(left_matches, list):
             left_matches = [left_matches]
 
-        def update_recursively(data):
-            # Update only mutable values corresponding to JSON types
-            if not (isinstance(data, (list, dict))):
-                return
-
-            self.right.update(data, val)
-
-            # Manually do the * or [*] to avoid coercion and recurse just the right-hand pattern
-            if isinstance(data, list):
-                for i in range(0, len(data)):
-                    update_recursively(data[i])
-
-            elif isinstance(data, dict):
-                for field in data:
-                    update_recursively(data[field])
-
         for submatch in left_matches:
-            update_recursively(submatch.value)
+            for value in _preorder(submatch.value, _child_values):
+                # Update only mutable values corresponding to JSON types
+                if isinstance(value, (list, dict)):
+                    self.right.update(value, val)
 
         return data
 
@@ -452,24 +624,11 @@ class Descendants(JSONPath):
         if not isinstance(left_matches, list):
             left_matches = [left_matches]
 
-        def filter_recursively(data):
-            # Update only mutable values corresponding to JSON types
-            if not (isinstance(data, (list, dict))):
-                return
-
-            self.right.filter(fn, data)
-
-            # Manually do the * or [*] to avoid coercion and recurse just the right-hand pattern
-            if isinstance(data, list):
-                for i in range(0, len(data)):
-                    filter_recursively(data[i])
-
-            elif isinstance(data, dict):
-                for field in data:
-                    filter_recursively(data[field])
-
         for submatch in left_matches:
-            filter_recursively(submatch.value)
+            for value in _preorder(submatch.value, _child_values):
+                # Filter only mutable values corresponding to JSON types
+                if isinstance(value, (list, dict)):
+                    self.right.filter(fn, value)
 
         return data
 
@@ -504,6 +663,10 @@ class Union(JSONPath):
     def find(self, data):
         return self.left.find(data) + self.right.find(data)
 
+    def ifind(self, data):
+        yield from self.left.ifind(data)
+        yield from self.right.ifind(data)
+
 
 class Intersect(JSONPath):
     """
@@ -532,6 +695,12 @@ class Intersect(JSONPath):
             found_matches.extend(expression.find(data))
         return found_matches
 
+    def ifind(self, data: Any) -> Iterator[DatumInContext]:
+        for expression in self.left:
+            yield from expression.ifind(data)
+        for expression in self.right:
+            yield from expression.ifind(data)
+
 
 class Contains(JSONPath):
     """
@@ -558,6 +727,11 @@ class Contains(JSONPath):
     def find(self, data):
         return [subdata for subdata in self.left.find(data) if self.right.fields[0] in subdata.value]
 
+    def ifind(self, data):
+        for subdata in self.left.ifind(data):
+            if self.right.fields[0] in subdata.value:
+                yield subdata
+
 
 class Fields(JSONPath):
     """
@@ -582,7 +756,7 @@ class Fields(JSONPath):
                     datum.value[field] = field_value = {}
                 else:
                     return None
-            return DatumInContext(field_value, path=Fields(field), context=datum)
+            return DatumInContext(field_value, path=field_path(field), context=datum)
         except (TypeError, AttributeError):
             return None
 
@@ -607,6 +781,13 @@ class Fields(JSONPath):
         field_data = [self.get_field_datum(datum, field, create) for field in self.reified_fields(datum)]
         return [fd for fd in field_data if fd is not None]
 
+    def ifind(self, datum):
+        datum = DatumInContext.wrap(datum)
+        for field in self.reified_fields(datum):
+            field_datum = self.get_field_datum(datum, field, False)
+            if field_datum is not None:
+                yield field_datum
+
     def update(self, data, val):
         return self._update_base(data, val, create=False)
 
@@ -752,13 +933,25 @@ class Slice(JSONPath):
         # Some iterators do not support slicing but we can still
         # at least work for '*'
         if self.start is None and self.end is None and self.step is None:
-            return [DatumInContext(datum.value[i], path=Index(i), context=datum) for i in range(0, len(datum.value))]
+            return [
+                DatumInContext(datum.value[i], path=index_path(i), context=datum) for i in range(0, len(datum.value))
+            ]
         else:
             return [
-                DatumInContext(datum.value[i], path=Index(i), context=datum)
+                DatumInContext(datum.value[i], path=index_path(i), context=datum)
                 for i in range(0, len(datum.value))[self.start : self.end : self.step]
             ]
 
+    def ifind(self, datum):
+        datum = DatumInContext.wrap(datum)
+        if not datum.value:
+            return
+        # Same coercion as `find()`
+        if isinstance(datum.value, (int, str, dict)):
+            datum = DatumInContext([datum.value], path=datum.path, context=datum.context)
+        for i in range(0, len(datum.value))[self.start : self.end : self.step]:
+            yield DatumInContext(datum.value[i], path=index_path(i), context=datum)
+
     def update(self, data, val):
         for datum in self.find(data):
             datum.path.update(data, val)
@@ -795,6 +988,191 @@ class Slice(JSONPath):
         )
 
 
+def static_value(value, keys):
+    """
+    Returns the value at `keys`, the `(is_index, key)` pairs of a fixed path, in `value`,
+    or NOT_SET when there is none. Same checks as `Index.find()` and `Fields.get_field_datum()`.
+    """
+    for is_index, key in keys:
+        if is_index:
+            if not value or len(value) <= key:
+                return NOT_SET
+            value = value[key]
+        else:
+            try:
+                value = value.get(key, NOT_SET)
+            except (TypeError, AttributeError):
+                return NOT_SET
+            if value is NOT_SET:
+                return NOT_SET
+    return value
+
+
+class StaticPath(JSONPath):
+    """
+    JSONPath matching a fixed sequence of single fields and indices, e.g. `a.b[0].c`.
+    Equivalent to the `Child` chain of its steps, but `find()` walks the data in one
+    loop instead of going through a `find()` and a list of matches per step.
+    Built by `bc_jsonpath_ng.optimizer`, there is no concrete syntax for it.
+    """
+
+    def __init__(self, *steps):
+        self.steps = steps
+        # The equivalent `Child` chain; used for everything but the plain `find()`
+        self.path = steps[0]
+        for step in steps[1:]:
+            self.path = Child(self.path, step)
+        self._keys = [
+            (isinstance(step, Index), step.index if isinstance(step, Index) else step.fields[0]) for step in steps
+        ]
+
+    def find(self, datum):
+        if auto_id_field is not None:
+            return self.path.find(datum)
+
+        datum = DatumInContext.wrap(datum)
+        value = static_value(datum.value, self._keys)
+        if value is NOT_SET:
+            return []
+        # All the steps exist, their matches are the contexts of the last one
+        for step, (_, key) in zip(self.steps[:-1], self._keys):
+            datum = DatumInContext(datum.value[key], path=step, context=datum)
+        return [DatumInContext(value, path=self.steps[-1], context=datum)]
+
+    def find_or_create(self, datum):
+        return self.path.find_or_create(datum)
+
+    def update(self, data, val):
+        return self.path.update(data, val)
+
+    def update_or_create(self, data, val):
+        return self.path.update_or_create(data, val)
+
+    def filter(self, fn, data):  # noqa: A003
+        return self.path.filter(fn, data)
+
+    def __eq__(self, other):
+        return isinstance(other, StaticPath) and self.steps == other.steps
+
+    def __str__(self):
+        return str(self.path)
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, ", ".join(map(repr, self.steps)))
+
+
+class FlatUnion(JSONPath):
+    """
+    JSONPath that returns the union of the results of each of its paths, in order.
+    Equivalent to nested `Union`s, built by `bc_jsonpath_ng.optimizer` for `a | b | c`.
+    """
+
+    def __init__(self, *paths):
+        self.paths = paths
+
+    def is_singular(self):
+        return False
+
+    def find(self, data):
+        found = []
+        for path in self.paths:
+            found.extend(path.find(data))
+        return found
+
+    def ifind(self, data):
+        for path in self.paths:
+            yield from path.ifind(data)
+
+    def __eq__(self, other):
+        return isinstance(other, FlatUnion) and self.paths == other.paths
+
+    def __str__(self):
+        return "|".join(map(str, self.paths))
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, ", ".join(map(repr, self.paths)))
+
+
+# Shared by all the matches; like the rest of the AST, paths are never modified
+ROOT = Root()
+THIS = This()
+
+# The paths of the matches of `*`, `[*]`, `..` and filters, shared between matches. The
+# fields come from the data, so there is a bound on how many are kept
+PATH_CACHE_SIZE = 4096
+_index_paths: dict[int, Index] = {}
+_field_paths: dict[str, Fields] = {}
+
+
+def index_path(index: int) -> Index:
+    """
+    Returns an `Index(index)`, the same one for every match at that index.
+    """
+    path = _index_paths.get(index)
+    if path is None:
+        path = Index(index)
+        if len(_index_paths) < PATH_CACHE_SIZE:
+            _index_paths[index] = path
+    return path
+
+
+def field_path(field: Any) -> Fields:
+    """
+    Returns a `Fields(field)`, the same one for every match of a string field.
+    """
+    # Not other keys, `1`, `1.0` and `True` are equal but not printed the same
+    if not isinstance(field, str):
+        return Fields(field)
+    path = _field_paths.get(field)
+    if path is None:
+        path = Fields(field)
+        if len(_field_paths) < PATH_CACHE_SIZE:
+            _field_paths[field] = path
+    return path
+
+
+# The `DocumentIndex`es of `bc_jsonpath_ng.index`, by id() of their document
+_document_indexes: dict[int, Any] = {}
+
+
+def _preorder(node, children):
+    """
+    Yields `node` and its descendants, parents first, in the order of a recursive walk.
+    The children of a node are only looked at once the caller is done with the node, and
+    the walk keeps one iterator per level rather than recursing, so it works on documents
+    of any depth.
+    """
+    yield node
+    stack = [children(node)]
+    while stack:
+        for child in stack[-1]:
+            yield child
+            stack.append(children(child))
+            break
+        else:
+            stack.pop()
+
+
+def _child_datums(datum):
+    # Read when the walk gets there, after the right side of `..` may have wrapped a dict into a list
+    value = datum.value
+    if isinstance(value, list):
+        for i in range(0, len(value)):
+            yield DatumInContext(value[i], context=datum, path=index_path(i))
+    elif isinstance(value, dict):
+        for field in value:
+            yield DatumInContext(value[field], context=datum, path=field_path(field))
+
+
+def _child_values(value):
+    if isinstance(value, list):
+        for i in range(0, len(value)):
+            yield value[i]
+    elif isinstance(value, dict):
+        for field in value:
+            yield value[field]
+
+
 def _create_list_key(dict_):
     """
     Adds a list to a dictionary by reference and returns the list.
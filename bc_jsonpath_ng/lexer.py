@@ -1,13 +1,26 @@
 from __future__ import annotations
 
-import logging
 import sys
-
-import ply.lex
+import threading
+from typing import TYPE_CHECKING
 
 from bc_jsonpath_ng.exceptions import JsonPathLexerError
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    import ply.lex
+
+# Master lexers keyed by lexer class; `tokenize` works on clones of these
+_lexers: dict[type, ply.lex.Lexer] = {}
+_lexers_lock = threading.Lock()
+
+
+def __getattr__(name):
+    # Created on first use, as `jsonpath.logger`
+    if name == "logger":
+        import logging
+
+        return logging.getLogger(__name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class JsonPathLexer:
@@ -27,7 +40,7 @@ class JsonPathLexer:
         Maps a string to an iterator over tokens. In other words: [char] -> [token]
         """
 
-        new_lexer = ply.lex.lex(module=self, debug=self.debug, errorlog=logger)
+        new_lexer = self.new_lexer()
         new_lexer.latest_newline = 0
         new_lexer.string_value = None
         new_lexer.input(string)
@@ -42,6 +55,34 @@ class JsonPathLexer:
         if new_lexer.string_value is not None:
             raise JsonPathLexerError("Unexpected EOF in string literal or identifier")
 
+    def new_lexer(self) -> ply.lex.Lexer:
+        """
+        Returns a PLY lexer ready for `input()`.
+
+        The master regular expressions are built only once per lexer class; every call
+        gets a clone of that master lexer with its own position and state stack, so
+        clones can be used concurrently. The token rules are stateless, so it does not
+        matter which instance the master lexer was built from.
+        """
+        master = _lexers.get(type(self))
+        if master is None:
+            # PLY (and logging, for its error log) are only imported once a lexer is built
+            import logging
+
+            import ply.lex
+
+            with _lexers_lock:
+                master = _lexers.get(type(self))
+                if master is None:
+                    master = _lexers[type(self)] = ply.lex.lex(
+                        module=self, debug=self.debug, errorlog=logging.getLogger(__name__)
+                    )
+
+        new_lexer = master.clone()
+        # `clone()` is a shallow copy, the state stack must not be shared
+        new_lexer.lexstatestack = []
+        return new_lexer
+
     # ============== PLY Lexer specification ==================
     #
     # This probably should be private but:
@@ -177,6 +218,8 @@ class JsonPathLexer:
 
 
 if __name__ == "__main__":
+    import logging
+
     logging.basicConfig()
     lexer = JsonPathLexer(debug=True)
     for _token in lexer.tokenize(sys.stdin.read()):
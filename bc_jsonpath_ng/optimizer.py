@@ -0,0 +1,137 @@
+"""
+An optional rewriting pass over parsed expressions; `find()` returns the same matches
+(values, paths and contexts) on the optimized AST as on the parsed one.
+
+- Runs of single fields and indices in a chain of `Child` nodes, e.g. `a.b[0].c`,
+  become one `StaticPath`, which does not build a list of matches per step.
+- `This` steps of a chain are dropped, `@.a` is the same as `a`. A trailing one
+  is kept, `a.@` leaves out the `AutoIdForDatum` matches of `a`, and so is a leading
+  one followed by anything but a field or an index, `SortedThis` needs the document
+  wrapped in a `DatumInContext`.
+- `Operation`s on literals only, e.g. `2 * 3`, are computed once into a `Constant`.
+- Nested `Union`s become one `FlatUnion`.
+
+The parsed AST is never modified, the nodes which change are copied, so optimizing
+an expression shared through the expression cache is safe.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from bc_jsonpath_ng.ext.arithmetic import OPERATOR_MAP, Constant, Operation
+from bc_jsonpath_ng.ext.filter import Expression, Filter, Negate
+from bc_jsonpath_ng.ext.iterable import SortedThis
+from bc_jsonpath_ng.jsonpath import (
+    Child,
+    Contains,
+    Descendants,
+    Fields,
+    FlatUnion,
+    Index,
+    Intersect,
+    JSONPath,
+    StaticPath,
+    This,
+    Union,
+    Where,
+)
+
+# The shortest run of steps worth a `StaticPath`
+MIN_STATIC_STEPS = 2
+
+_OPERATION_SYMBOLS = {function: symbol for symbol, function in OPERATOR_MAP.items()}
+
+
+def optimize(jsonpath: JSONPath) -> JSONPath:
+    """
+    Returns an optimized equivalent of `jsonpath`.
+    """
+    return _optimize(jsonpath)
+
+
+def _optimize(node: Any) -> Any:
+    if isinstance(node, list):
+        return [_optimize(item) for item in node]
+    cls = type(node)
+    if cls is Child:
+        return _optimize_chain(node)
+    if cls is Union:
+        return FlatUnion(*[_optimize(path) for path in _union_paths(node)])
+    if cls in (Where, Descendants, Intersect):
+        return cls(_optimize(node.left), _optimize(node.right))
+    if cls is Contains:
+        # `Contains` reads the field name of its right side
+        return Contains(_optimize(node.left), node.right)
+    if cls is Operation:
+        return _fold(Operation(_optimize(node.left), _OPERATION_SYMBOLS[node.op], _optimize(node.right)))
+    if cls is Filter or cls is Negate:
+        return cls(_optimize(node.expressions))
+    if cls is Expression:
+        return Expression(_optimize(node.target), node.op, node.value)
+    if cls is SortedThis and node.expressions:
+        return SortedThis([(_optimize(field), reverse) for field, reverse in node.expressions])
+    return node
+
+
+def _optimize_chain(node: Child) -> JSONPath:
+    steps = [_optimize(step) for step in _chain_steps(node)]
+    # A leading `This` wraps the raw document for the next step, which only a static
+    # step does on its own, e.g. `SortedThis.find()` reads `datum.value`
+    leading = steps[:1] if type(steps[0]) is This and not _is_static(steps[1]) else []
+    steps = leading + [step for step in steps[len(leading) : -1] if type(step) is not This] + steps[-1:]
+
+    chain = []
+    run: list[JSONPath] = []
+    for step in [*steps, None]:
+        if _is_static(step):
+            run.append(step)
+            continue
+        if len(run) >= MIN_STATIC_STEPS:
+            chain.append(StaticPath(*run))
+        else:
+            chain.extend(run)
+        run = []
+        if step is not None:
+            chain.append(step)
+
+    jsonpath = chain[0]
+    for step in chain[1:]:
+        jsonpath = Child(jsonpath, step)
+    return jsonpath
+
+
+def _chain_steps(node: JSONPath) -> list[JSONPath]:
+    # `Child` is associative for `find()`, `(a.b).c` and `a.(b.c)` match the same
+    if type(node) is Child:
+        return [*_chain_steps(node.left), *_chain_steps(node.right)]
+    if type(node) is StaticPath:
+        return list(node.steps)
+    return [node]
+
+
+def _union_paths(node: JSONPath) -> list[JSONPath]:
+    if type(node) is Union:
+        return [*_union_paths(node.left), *_union_paths(node.right)]
+    if type(node) is FlatUnion:
+        return list(node.paths)
+    return [node]
+
+
+def _is_static(step: JSONPath | None) -> bool:
+    if type(step) is Index:
+        return True
+    return type(step) is Fields and len(step.fields) == 1 and step.fields[0] != "*"
+
+
+def _fold(operation: Operation) -> JSONPath:
+    operands = (operation.left, operation.right)
+    if not all(type(operand) is Constant or not isinstance(operand, JSONPath) for operand in operands):
+        return operation
+    try:
+        # The operands do not depend on the data
+        values = [datum.value for datum in operation.find(None)]
+    except Exception:
+        # e.g. a division by zero, leave it to `find()` to raise it
+        return operation
+    return Constant(*values)
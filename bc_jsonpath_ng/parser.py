@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-import logging
+import copy
 import os.path
 import sys
+import threading
 from typing import TYPE_CHECKING
 
-import ply.yacc
-
 from bc_jsonpath_ng import (
     Child,
     Contains,
@@ -21,17 +20,63 @@ from bc_jsonpath_ng import (
     Union,
     Where,
 )
+from bc_jsonpath_ng.cache import expression_cache
+from bc_jsonpath_ng.descent import JsonPathDescentParser
 from bc_jsonpath_ng.exceptions import JsonPathParserError
 from bc_jsonpath_ng.lexer import JsonPathLexer
 
 if TYPE_CHECKING:
+    import ply.yacc
+
     from bc_jsonpath_ng import JSONPath
 
-logger = logging.getLogger(__name__)
+# LR parsers keyed by (grammar class, start symbol); the grammar actions are stateless
+# so a parser built from one instance serves every instance of the same class.
+_lr_parsers: dict[tuple[type, str], ply.yacc.LRParser] = {}
+_lr_parsers_lock = threading.Lock()
+# Per-thread copies of `_lr_parsers`: a copy shares the (read-only) tables of its master
+# but has its own parse state, which PLY keeps on the parser object.
+_thread_lr_parsers = threading.local()
+
+# "ply" is the LALR parser generated by PLY, "descent" the hand-written parser of `bc_jsonpath_ng.descent`.
+# Both build the same AST.
+BACKENDS = ("ply", "descent")
+_default_backend = "ply"
+
 
+def __getattr__(name):
+    # Created on first use, as `jsonpath.logger`
+    if name == "logger":
+        import logging
 
-def parse(string: str):
-    return JsonPathParser().parse(string)
+        return logging.getLogger(__name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def set_default_backend(backend: str) -> None:
+    """
+    Selects the parser backend used by `parse()` and `ext.parse()` when they are not given one.
+    """
+    global _default_backend
+    _default_backend = resolve_backend(backend)
+
+
+def get_default_backend() -> str:
+    return _default_backend
+
+
+def resolve_backend(backend: str | None) -> str:
+    if backend is None:
+        return _default_backend
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown parser backend {backend!r}, expected one of {', '.join(BACKENDS)}")
+    return backend
+
+
+def parse(string: str, backend: str | None = None) -> JSONPath:
+    if resolve_backend(backend) == "descent":
+        return expression_cache.parse(JsonPathDescentParser, string)
+    return expression_cache.parse(JsonPathParser, string)
 
 
 class JsonPathParser:
@@ -57,29 +102,70 @@ class JsonPathParser:
         return self.parse_token_stream(lexer.tokenize(string))
 
     def parse_token_stream(self, token_iterator, start_symbol: str = "jsonpath"):
-        # Since PLY has some crufty aspects and dumps files, we try to keep them local
-        # However, we need to derive the name of the output Python file :-/
-        output_directory = os.path.dirname(__file__)
+        new_parser = self.lr_parser(start_symbol)
+        return new_parser.parse(lexer=IteratorToTokenStream(token_iterator))
+
+    def lr_parser(self, start_symbol: str = "jsonpath") -> ply.yacc.LRParser:
+        """
+        Returns the LR parser for this grammar class reserved to the calling thread,
+        building it on first use.
+
+        The tables are built once per class and start symbol. When a pregenerated
+        table module for the class exists (see `write_tables`) and its signature
+        matches the grammar, it is loaded instead of running the LALR construction.
+        Each thread then parses with its own shallow copy of that parser.
+        """
+        key = (type(self), start_symbol)
         try:
-            module_name = os.path.splitext(os.path.split(__file__)[1])[0]
-        except Exception:
-            module_name = __name__
+            lr_parsers = _thread_lr_parsers.parsers
+        except AttributeError:
+            lr_parsers = _thread_lr_parsers.parsers = {}
+        lr_parser = lr_parsers.get(key)
+        if lr_parser is None:
+            master = _lr_parsers.get(key)
+            if master is None:
+                with _lr_parsers_lock:
+                    master = _lr_parsers.get(key)
+                    if master is None:
+                        master = _lr_parsers[key] = self._yacc(start_symbol, write_tables=False)
+            lr_parser = lr_parsers[key] = copy.copy(master)
+        return lr_parser
+
+    @classmethod
+    def table_module(cls, start_symbol: str = "jsonpath") -> str:
+        """
+        The name of the pregenerated parse table module for this grammar class,
+        e.g. `bc_jsonpath_ng.parser_jsonpathparser_jsonpath_parsetab`.
+        Subclasses get their own name, so they never load the tables of their parent.
+        """
+        return "_".join([cls.__module__, cls.__name__.lower(), start_symbol, "parsetab"])
 
-        parsing_table_module = "_".join([module_name, start_symbol, "parsetab"])
+    @classmethod
+    def write_tables(cls, outputdir: str | None = None, start_symbol: str = "jsonpath") -> None:
+        """
+        Generates the parse table module for this grammar class next to the module defining it.
+        """
+        if outputdir is None:
+            outputdir = os.path.dirname(sys.modules[cls.__module__].__file__)
+        cls()._yacc(start_symbol, write_tables=True, outputdir=outputdir)
+
+    def _yacc(self, start_symbol: str, write_tables: bool, outputdir: str | None = None) -> ply.yacc.LRParser:
+        # PLY (and logging, for its error log) are only imported once a parser is built
+        import logging
 
-        # And we regenerate the parse table every time; it doesn't actually take that long!
-        new_parser = ply.yacc.yacc(
+        import ply.yacc
+
+        # Since PLY has some crufty aspects and dumps files, we try to keep them local
+        return ply.yacc.yacc(
             module=self,
             debug=self.debug,
-            tabmodule=parsing_table_module,
-            outputdir=output_directory,
-            write_tables=0,
+            tabmodule=self.table_module(start_symbol),
+            outputdir=outputdir or os.path.dirname(__file__),
+            write_tables=write_tables,
             start=start_symbol,
-            errorlog=logger,
+            errorlog=logging.getLogger(__name__),
         )
 
-        return new_parser.parse(lexer=IteratorToTokenStream(token_iterator))
-
     # ===================== PLY Parser specification =====================
 
     precedence = [
@@ -218,6 +304,8 @@ class IteratorToTokenStream:
 
 
 if __name__ == "__main__":
+    import logging
+
     logging.basicConfig()
     parser = JsonPathParser(debug=True)
     print(parser.parse(sys.stdin.read()))  # noqa: T201
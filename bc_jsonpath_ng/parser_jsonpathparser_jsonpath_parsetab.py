@@ -0,0 +1,58 @@
+
+# parser_jsonpathparser_jsonpath_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "jsonpathleft,leftDOUBLEDOTleft.leftDOUBLE_ORleft|leftDOUBLE_ANDleft&leftWHEREleftCONTAINSCONTAINS DOUBLEDOT DOUBLE_AND DOUBLE_OR ID NAMED_OPERATOR NUMBER WHEREjsonpath : jsonpath '.' jsonpath\n        | jsonpath DOUBLEDOT jsonpath\n        | jsonpath WHERE jsonpath\n        | jsonpath '|' jsonpath\n        | jsonpath DOUBLE_OR jsonpath\n        | jsonpath '&' jsonpath\n        | jsonpath DOUBLE_AND jsonpath\n        | jsonpath CONTAINS jsonpath\n        jsonpath : fields_or_anyjsonpath : NAMED_OPERATORjsonpath : '$'jsonpath : '[' idx ']'jsonpath : '[' slice ']'jsonpath : '[' fields ']'jsonpath : jsonpath '[' fields ']'jsonpath : jsonpath '[' idx ']'jsonpath : jsonpath '[' slice ']'jsonpath : '(' jsonpath ')'fields_or_any : fields\n        | '*'fields : IDfields : fields ',' fieldsidx : NUMBERslice : '*'slice : maybe_int ':' maybe_intmaybe_int : NUMBER\n        | emptyempty :"
+    
+_lr_action_items = {'NAMED_OPERATOR':([0,7,10,11,12,13,14,15,16,17,],[3,3,3,3,3,3,3,3,3,3,]),'$':([0,7,10,11,12,13,14,15,16,17,],[4,4,4,4,4,4,4,4,4,4,]),'[':([0,1,2,3,4,6,7,8,9,10,11,12,13,14,15,16,17,27,28,29,30,31,32,33,34,35,39,40,41,43,44,45,46,47,],[5,18,-9,-10,-11,-19,5,-20,-21,5,5,5,5,5,5,5,5,18,-1,-2,-3,-4,-5,-6,-7,-8,-12,-13,-14,-22,-18,-15,-16,-17,]),'(':([0,7,10,11,12,13,14,15,16,17,],[7,7,7,7,7,7,7,7,7,7,]),'*':([0,5,7,10,11,12,13,14,15,16,17,18,],[8,23,8,8,8,8,8,8,8,8,8,23,]),'ID':([0,5,7,10,11,12,13,14,15,16,17,18,26,],[9,9,9,9,9,9,9,9,9,9,9,9,9,]),'$end':([1,2,3,4,6,8,9,28,29,30,31,32,33,34,35,39,40,41,43,44,45,46,47,],[0,-9,-10,-11,-19,-20,-21,-1,-2,-3,-4,-5,-6,-7,-8,-12,-13,-14,-22,-18,-15,-16,-17,]),'.':([1,2,3,4,6,8,9,27,28,29,30,31,32,33,34,35,39,40,41,43,44,45,46,47,],[10,-9,-10,-11,-19,-20,-21,10,-1,10,-3,-4,-5,-6,-7,-8,-12,-13,-14,-22,-18,-15,-16,-17,]),'DOUBLEDOT':([1,2,3,4,6,8,9,27,28,29,30,31,32,33,34,35,39,40,41,43,44,45,46,47,],[11,-9,-10,-11,-19,-20,-21,11,-1,-2,-3,-4,-5,-6,-7,-8,-12,-13,-14,-22,-18,-15,-16,-17,]),'WHERE':([1,2,3,4,6,8,9,27,28,29,30,31,32,33,34,35,39,40,41,43,44,45,46,47,],[12,-9,-10,-11,-19,-20,-21,12,12,12,-3,12,12,12,12,-8,-12,-13,-14,-22,-18,-15,-16,-17,]),'|':([1,2,3,4,6,8,9,27,28,29,30,31,32,33,34,35,39,40,41,43,44,45,46,47,],[13,-9,-10,-11,-19,-20,-21,13,13,13,-3,-4,13,-6,-7,-8,-12,-13,-14,-22,-18,-15,-16,-17,]),'DOUBLE_OR':([1,2,3,4,6,8,9,27,28,29,30,31,32,33,34,35,39,40,41,43,44,45,46,47,],[14,-9,-10,-11,-19,-20,-21,14,14,14,-3,-4,-5,-6,-7,-8,-12,-13,-14,-22,-18,-15,-16,-17,]),'&':([1,2,3,4,6,8,9,27,28,29,30,31,32,33,34,35,39,40,41,43,44,45,46,47,],[15,-9,-10,-11,-19,-20,-21,15,15,15,-3,15,15,-6,15,-8,-12,-13,-14,-22,-18,-15,-16,-17,]),'DOUBLE_AND':([1,2,3,4,6,8,9,27,28,29,30,31,32,33,34,35,39,40,41,43,44,45,46,47,],[16,-9,-10,-11,-19,-20,-21,16,16,16,-3,16,16,-6,-7,-8,-12,-13,-14,-22,-18,-15,-16,-17,]),'CONTAINS':([1,2,3,4,6,8,9,27,28,29,30,31,32,33,34,35,39,40,41,43,44,45,46,47,],[17,-9,-10,-11,-19,-20,-21,17,17,17,17,17,17,17,17,-8,-12,-13,-14,-22,-18,-15,-16,-17,]),')':([2,3,4,6,8,9,27,28,29,30,31,32,33,34,35,39,40,41,43,44,45,46,47,],[-9,-10,-11,-19,-20,-21,44,-1,-2,-3,-4,-5,-6,-7,-8,-12,-13,-14,-22,-18,-15,-16,-17,]),'NUMBER':([5,18,42,],[22,22,49,]),':':([5,18,22,24,25,],[-28,-28,-26,42,-27,]),',':([6,9,21,36,43,],[26,-21,26,26,-22,]),']':([9,19,20,21,22,23,25,36,37,38,42,43,48,49,],[-21,39,40,41,-23,-24,-27,45,46,47,-28,-22,-25,-26,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'jsonpath':([0,7,10,11,12,13,14,15,16,17,],[1,27,28,29,30,31,32,33,34,35,]),'fields_or_any':([0,7,10,11,12,13,14,15,16,17,],[2,2,2,2,2,2,2,2,2,2,]),'fields':([0,5,7,10,11,12,13,14,15,16,17,18,26,],[6,21,6,6,6,6,6,6,6,6,6,36,43,]),'idx':([5,18,],[19,37,]),'slice':([5,18,],[20,38,]),'maybe_int':([5,18,42,],[24,24,48,]),'empty':([5,18,42,],[25,25,25,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> jsonpath","S'",1,None,None,None),
+  ('jsonpath -> jsonpath . jsonpath','jsonpath',3,'p_jsonpath_binop','parser.py',135),
+  ('jsonpath -> jsonpath DOUBLEDOT jsonpath','jsonpath',3,'p_jsonpath_binop','parser.py',136),
+  ('jsonpath -> jsonpath WHERE jsonpath','jsonpath',3,'p_jsonpath_binop','parser.py',137),
+  ('jsonpath -> jsonpath | jsonpath','jsonpath',3,'p_jsonpath_binop','parser.py',138),
+  ('jsonpath -> jsonpath DOUBLE_OR jsonpath','jsonpath',3,'p_jsonpath_binop','parser.py',139),
+  ('jsonpath -> jsonpath & jsonpath','jsonpath',3,'p_jsonpath_binop','parser.py',140),
+  ('jsonpath -> jsonpath DOUBLE_AND jsonpath','jsonpath',3,'p_jsonpath_binop','parser.py',141),
+  ('jsonpath -> jsonpath CONTAINS jsonpath','jsonpath',3,'p_jsonpath_binop','parser.py',142),
+  ('jsonpath -> fields_or_any','jsonpath',1,'p_jsonpath_fields','parser.py',160),
+  ('jsonpath -> NAMED_OPERATOR','jsonpath',1,'p_jsonpath_named_operator','parser.py',164),
+  ('jsonpath -> $','jsonpath',1,'p_jsonpath_root','parser.py',173),
+  ('jsonpath -> [ idx ]','jsonpath',3,'p_jsonpath_idx','parser.py',177),
+  ('jsonpath -> [ slice ]','jsonpath',3,'p_jsonpath_slice','parser.py',181),
+  ('jsonpath -> [ fields ]','jsonpath',3,'p_jsonpath_fieldbrackets','parser.py',185),
+  ('jsonpath -> jsonpath [ fields ]','jsonpath',4,'p_jsonpath_child_fieldbrackets','parser.py',189),
+  ('jsonpath -> jsonpath [ idx ]','jsonpath',4,'p_jsonpath_child_idxbrackets','parser.py',193),
+  ('jsonpath -> jsonpath [ slice ]','jsonpath',4,'p_jsonpath_child_slicebrackets','parser.py',197),
+  ('jsonpath -> ( jsonpath )','jsonpath',3,'p_jsonpath_parens','parser.py',201),
+  ('fields_or_any -> fields','fields_or_any',1,'p_fields_or_any','parser.py',206),
+  ('fields_or_any -> *','fields_or_any',1,'p_fields_or_any','parser.py',207),
+  ('fields -> ID','fields',1,'p_fields_id','parser.py',214),
+  ('fields -> fields , fields','fields',3,'p_fields_comma','parser.py',218),
+  ('idx -> NUMBER','idx',1,'p_idx','parser.py',222),
+  ('slice -> *','slice',1,'p_slice_any','parser.py',226),
+  ('slice -> maybe_int : maybe_int','slice',3,'p_slice','parser.py',230),
+  ('maybe_int -> NUMBER','maybe_int',1,'p_maybe_int','parser.py',234),
+  ('maybe_int -> empty','maybe_int',1,'p_maybe_int','parser.py',235),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',239),
+]
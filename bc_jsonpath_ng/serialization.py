@@ -0,0 +1,224 @@
+"""
+A compact, versioned binary format for compiled JSONPath expressions.
+
+`to_bytes` flattens an AST into nested tuples of plain values: every node becomes
+`(tag, *arguments)`, where the tag is the index of its class in `NODE_CLASSES` and
+the arguments are what its constructor takes. Operator functions are stored as their
+symbol and regular expressions as their source, so nothing is pickled by reference.
+The tuples are written with `marshal`, behind a magic number and the format version.
+
+`from_bytes` rebuilds the AST without lexing or parsing, and `JSONPath.__reduce_ex__`
+uses this format, so pickling an expression (e.g. to send it to a `multiprocessing`
+worker) stores a single bytes object.
+
+As with pickle, only load data produced by a trusted source.
+"""
+
+from __future__ import annotations
+
+import marshal
+from typing import Any, Callable, Iterable, Iterator
+
+from bc_jsonpath_ng.exceptions import JsonPathSerializationError
+from bc_jsonpath_ng.ext.arithmetic import OPERATOR_MAP, Constant, Operation
+from bc_jsonpath_ng.ext.filter import Expression, Filter, Negate
+from bc_jsonpath_ng.ext.iterable import Len, SortedThis
+from bc_jsonpath_ng.ext.string import Split, Str, Sub
+from bc_jsonpath_ng.jsonpath import (
+    Child,
+    Contains,
+    Descendants,
+    Fields,
+    FlatUnion,
+    Index,
+    Intersect,
+    JSONPath,
+    Parent,
+    Root,
+    Slice,
+    StaticPath,
+    This,
+    Union,
+    Where,
+)
+
+MAGIC = b"JPNG"
+# Bump when the encoding of an existing class changes. New classes are appended to
+# `NODE_CLASSES` and keep the version, older data still decodes the same.
+FORMAT_VERSION = 1
+MARSHAL_VERSION = 4
+
+# The tag of a node is the index of its class in this tuple
+NODE_CLASSES: tuple[type[JSONPath], ...] = (
+    Root,
+    This,
+    Parent,
+    Child,
+    Where,
+    Descendants,
+    Union,
+    Intersect,
+    Contains,
+    Fields,
+    Index,
+    Slice,
+    Operation,
+    Filter,
+    Negate,
+    Expression,
+    SortedThis,
+    Len,
+    Sub,
+    Split,
+    Str,
+    StaticPath,
+    FlatUnion,
+    Constant,
+)
+
+_TAGS = {cls: tag for tag, cls in enumerate(NODE_CLASSES)}
+_OPERATION_SYMBOLS = {function: symbol for symbol, function in OPERATOR_MAP.items()}
+_HEADER = MAGIC + bytes([FORMAT_VERSION])
+
+
+def to_bytes(jsonpath: JSONPath) -> bytes:
+    """
+    Serializes the AST `jsonpath`.
+
+    Raises `JsonPathSerializationError` when it holds a node of a class missing from `NODE_CLASSES`.
+    """
+    return _HEADER + marshal.dumps(_encode(jsonpath), MARSHAL_VERSION)
+
+
+def from_bytes(data: bytes) -> JSONPath:
+    """
+    Rebuilds the AST serialized by `to_bytes`.
+
+    Raises `JsonPathSerializationError` when `data` is not such an AST, or is truncated or corrupted.
+    """
+    if data[: len(MAGIC)] != MAGIC:
+        raise JsonPathSerializationError("Not a serialized JSONPath expression")
+    if len(data) < len(_HEADER):
+        raise JsonPathSerializationError("Corrupted serialized JSONPath expression: no format version")
+    if data[len(MAGIC)] != FORMAT_VERSION:
+        raise JsonPathSerializationError(
+            f"Unsupported serialization format version {data[len(MAGIC)]}, expected {FORMAT_VERSION}"
+        )
+    try:
+        encoded = marshal.loads(data[len(_HEADER) :])  # noqa: S302
+    except (EOFError, ValueError, TypeError) as e:
+        raise JsonPathSerializationError(f"Corrupted serialized JSONPath expression: {e}") from e
+    try:
+        return _decode(encoded)
+    except (IndexError, KeyError, TypeError, ValueError) as e:
+        # e.g. an unknown tag or a node missing arguments
+        raise JsonPathSerializationError(f"Corrupted serialized JSONPath expression: {e!r}") from e
+
+
+def is_serializable(jsonpath: JSONPath) -> bool:
+    """
+    Whether all the nodes of `jsonpath` are of a class of `NODE_CLASSES`.
+    """
+    return type(jsonpath) in _TAGS and all(is_serializable(node) for node in _child_nodes(vars(jsonpath).values()))
+
+
+def _child_nodes(values: Iterable) -> Iterator[JSONPath]:
+    # The nodes in the attributes of a node, and in their lists and tuples
+    for value in values:
+        if isinstance(value, JSONPath):
+            yield value
+        elif isinstance(value, (list, tuple)):
+            yield from _child_nodes(value)
+
+
+def _encode(node: Any) -> Any:
+    """
+    Encodes a node as `(tag, *arguments)`; the literal operands of `Operation` and
+    `Expression` (numbers, strings, booleans, None) are stored as they are, and the
+    lists of filter expressions that `Union` and `Intersect` can hold as lists.
+    """
+    if not isinstance(node, JSONPath):
+        if isinstance(node, list):
+            return [_encode(item) for item in node]
+        return node
+    cls = type(node)
+    tag = _TAGS.get(cls)
+    if tag is None:
+        raise JsonPathSerializationError(f"Cannot serialize {cls.__module__}.{cls.__qualname__} nodes")
+    if cls in (Child, Where, Descendants, Union, Intersect, Contains):
+        return tag, _encode(node.left), _encode(node.right)
+    if cls is Fields:
+        return (tag, *node.fields)
+    if cls is Index:
+        return tag, node.index
+    if cls is Slice:
+        return tag, node.start, node.end, node.step
+    if cls is Operation:
+        return tag, _encode(node.left), _OPERATION_SYMBOLS[node.op], _encode(node.right)
+    if cls is Filter or cls is Negate:
+        return (tag, *[_encode(expression) for expression in node.expressions])
+    if cls is Expression:
+        return tag, _encode(node.target), node.op, _encode(node.value)
+    if cls is SortedThis:
+        if node.expressions is None:
+            return (tag,)
+        return (tag, *[(_encode(field), reverse) for field, reverse in node.expressions])
+    if cls is Sub or cls is Split or cls is Str:
+        return tag, node.method
+    if cls is StaticPath:
+        return (tag, *[_encode(step) for step in node.steps])
+    if cls is FlatUnion:
+        return (tag, *[_encode(path) for path in node.paths])
+    if cls is Constant:
+        return (tag, *node.values)
+    # Root, This, Parent and Len have no state
+    return (tag,)
+
+
+def _decode(data: Any) -> Any:
+    # Nodes are the only tuples of the encoding
+    if type(data) is tuple:
+        if not data or type(data[0]) is not int or not 0 <= data[0] < len(_DECODERS):
+            raise JsonPathSerializationError(f"Corrupted serialized JSONPath expression: unknown node {data!r}")
+        return _DECODERS[data[0]](data)
+    if isinstance(data, list):
+        return [_decode(item) for item in data]
+    return data
+
+
+def _decode_binary(cls: type[JSONPath]) -> Callable[[tuple], JSONPath]:
+    return lambda data: cls(_decode(data[1]), _decode(data[2]))
+
+
+def _decode_sorted_this(data: tuple) -> SortedThis:
+    if len(data) == 1:
+        return SortedThis()
+    return SortedThis([(_decode(field), reverse) for field, reverse in data[1:]])
+
+
+_DECODERS: list[Callable[[tuple], JSONPath]] = [
+    lambda _data: Root(),
+    lambda _data: This(),
+    lambda _data: Parent(),
+    _decode_binary(Child),
+    _decode_binary(Where),
+    _decode_binary(Descendants),
+    _decode_binary(Union),
+    _decode_binary(Intersect),
+    _decode_binary(Contains),
+    lambda data: Fields(*data[1:]),
+    lambda data: Index(data[1]),
+    lambda data: Slice(data[1], data[2], data[3]),
+    lambda data: Operation(_decode(data[1]), data[2], _decode(data[3])),
+    lambda data: Filter([_decode(expression) for expression in data[1:]]),
+    lambda data: Negate([_decode(expression) for expression in data[1:]]),
+    lambda data: Expression(_decode(data[1]), data[2], _decode(data[3])),
+    _decode_sorted_this,
+    lambda _data: Len(),
+    lambda data: Sub(data[1]),
+    lambda data: Split(data[1]),
+    lambda data: Str(data[1]),
+    lambda data: StaticPath(*[_decode(step) for step in data[1:]]),
+    lambda data: FlatUnion(*[_decode(path) for path in data[1:]]),
+    lambda data: Constant(*data[1:]),
+]
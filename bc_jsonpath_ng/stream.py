@@ -0,0 +1,534 @@
+"""
+Evaluation of an expression over JSON text read a chunk at a time, without loading the
+whole document.
+
+`tokenize()` turns the text into events: the start and end of each object and array,
+the keys of objects and the other values. `find()` follows the expression along those
+events and only builds the values of the matches, which it yields as soon as they end
+in the text. Memory holds the path to the current value and the matches being read,
+not the document.
+
+The expression may only go forward: `$` at the start, fields, non-negative indices and
+slices, `..` and filters. Others, such as `parent`, negative indices or unions, raise
+`JsonPathStreamError`. The matches are those of `find()` on the loaded document, as
+`(path, value)` with the path of `find_paths()`, but in the order they end in the text:
+a match inside another one comes first, and fields come in the order of the text rather
+than the expression. A key repeated in an object gives a match for each, `json.load()`
+keeps the last one.
+
+A filter reads each item of the list before testing it, and the steps after a filter,
+or after an index or a slice on something else than a list, run on the value read.
+When a step raises on a value, such as an index on an object, no more matches are
+yielded and the error `find()` raises is raised at the end of the text; with several
+`..`, or fields in another order than the text, it may be another one of the errors.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import IO, Any, Iterator
+
+from bc_jsonpath_ng import jsonpath as _jsonpath
+from bc_jsonpath_ng.compiler import _datum_keys
+from bc_jsonpath_ng.exceptions import JsonPathStreamError
+from bc_jsonpath_ng.ext.filter import Filter, Negate, _all_predicate
+from bc_jsonpath_ng.jsonpath import (
+    Child,
+    DatumInContext,
+    Descendants,
+    Fields,
+    Index,
+    JSONPath,
+    Root,
+    Slice,
+    StaticPath,
+    This,
+)
+
+# Characters read from the source at a time
+CHUNK_SIZE = 64 * 1024
+
+# The events of `tokenize()`, with the key or the value for `MAP_KEY` and `VALUE`
+START_MAP = "start_map"
+MAP_KEY = "map_key"
+END_MAP = "end_map"
+START_ARRAY = "start_array"
+END_ARRAY = "end_array"
+VALUE = "value"
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# The next token, strings without escapes (as `json.load()`, the non-standard NaN and
+# infinities are accepted)
+_TOKEN = re.compile(
+    r'[ \t\n\r]*(?:(?P<punctuation>[{}\[\],:])|"(?P<string>[^"\\\x00-\x1f]*)"'
+    r"|(?P<number>-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?)|(?P<literal>true|false|null|NaN|-?Infinity))"
+)
+_STRING_END = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_LITERALS = {
+    "true": True,
+    "false": False,
+    "null": None,
+    "NaN": float("nan"),
+    "Infinity": float("inf"),
+    "-Infinity": float("-inf"),
+}
+# Characters after a token enough to tell that it is not cut by the end of a chunk
+_LOOKAHEAD = 16
+
+_STRING, _OTHER, _EOF = '"', "v", ""
+
+
+def tokenize(source: IO, chunk_size: int = CHUNK_SIZE) -> Iterator[tuple[str, Any]]:
+    """
+    Yields the events of the JSON text read from `source`, a file opened in text or
+    binary (UTF-8) mode, e.g. `(START_MAP, None)`, `(MAP_KEY, "a")`, `(VALUE, 1)`.
+    Raises `JsonPathStreamError` on invalid JSON.
+    """
+    scanner = _Scanner(source, chunk_size)
+    next_token = scanner.next_token
+    # "{" or "[" for each object or array open
+    stack: list[str] = []
+    kind, value = next_token()
+    while True:
+        # A value starts at `kind`
+        if kind == "{":
+            yield START_MAP, None
+            kind, value = next_token()
+            if kind == "}":
+                yield END_MAP, None
+            else:
+                stack.append("{")
+                yield MAP_KEY, scanner.key(kind, value)
+                kind, value = next_token()
+                continue
+        elif kind == "[":
+            yield START_ARRAY, None
+            kind, value = next_token()
+            if kind == "]":
+                yield END_ARRAY, None
+            else:
+                stack.append("[")
+                continue
+        elif kind is _STRING or kind is _OTHER:
+            yield VALUE, value
+        else:
+            scanner.error("Expecting value")
+
+        # Then a comma, the end of its object or array, or of the text
+        while True:
+            kind, value = next_token()
+            if not stack:
+                if kind != _EOF:
+                    scanner.error("Extra data")
+                return
+            if kind == ",":
+                kind, value = next_token()
+                if stack[-1] == "{":
+                    yield MAP_KEY, scanner.key(kind, value)
+                    kind, value = next_token()
+                break
+            if kind == "}" and stack[-1] == "{":
+                stack.pop()
+                yield END_MAP, None
+            elif kind == "]" and stack[-1] == "[":
+                stack.pop()
+                yield END_ARRAY, None
+            else:
+                scanner.error("Expecting ',' delimiter")
+
+
+class _Scanner:
+    # The tokens of the text, read a chunk at a time: punctuation, strings and other values
+
+    def __init__(self, source: IO, chunk_size: int) -> None:
+        self.source = source
+        self.chunk_size = chunk_size
+        self.decoder = None
+        self.buffer = ""
+        self.position = 0
+        # Characters dropped from the start of the buffer
+        self.offset = 0
+        self.eof = False
+        self.next_token = self.tokens().__next__
+
+    def read(self) -> bool:
+        # Appends the next chunk to the buffer, False at the end of the source
+        if self.eof:
+            return False
+        chunk = self.source.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+        if isinstance(chunk, bytes):
+            if self.decoder is None:
+                self.decoder = codecs.getincrementaldecoder("utf-8-sig")()
+            chunk = self.decoder.decode(chunk, final=self.eof)
+        elif not chunk:
+            chunk = ""
+        self.offset += self.position
+        self.buffer = self.buffer[self.position :] + chunk
+        self.position = 0
+        return not self.eof
+
+    def tokens(self) -> Iterator[tuple[str, Any]]:
+        # The tokens up to near the end of the buffer are matched here, the others by
+        # `read_token()`, which reads the next chunk when they need it
+        while True:
+            limit = len(self.buffer) if self.eof else len(self.buffer) - _LOOKAHEAD
+            for match in iter(_TOKEN.scanner(self.buffer, self.position).match, None):
+                end = match.end()
+                if end > limit:
+                    break
+                self.position = end
+                yield _token(match)
+            yield self.read_token()
+
+    def read_token(self) -> tuple[str, Any]:
+        match = _TOKEN.match(self.buffer, self.position)
+        # Read more when the token may go on in the next chunk, e.g. `1` of `1.5`
+        while (match is None or match.end() > len(self.buffer) - _LOOKAHEAD) and not self.eof:
+            if match is None:
+                position = _WHITESPACE.match(self.buffer, self.position).end()
+                if self.buffer.startswith('"', position):
+                    return _STRING, self.string(position)
+                if len(self.buffer) - position >= _LOOKAHEAD:
+                    break
+            self.read()
+            match = _TOKEN.match(self.buffer, self.position)
+
+        if match is None:
+            self.position = position = _WHITESPACE.match(self.buffer, self.position).end()
+            if position == len(self.buffer):
+                return _EOF, None
+            if self.buffer.startswith('"', position):
+                return _STRING, self.string(position)
+            self.error("Expecting value")
+        self.position = match.end()
+        return _token(match)
+
+    def string(self, position: int) -> str:
+        # A string with escapes or control characters, read to its end
+        self.position = position
+        while _STRING_END.match(self.buffer, self.position + 1) is None:
+            if not self.read():
+                self.error("Unterminated string")
+        try:
+            value, self.position = json.decoder.scanstring(self.buffer, self.position + 1)
+        except json.JSONDecodeError as e:
+            self.position = e.pos
+            self.error(re.sub(" at$", "", e.msg))
+        return value
+
+    def key(self, kind: str, value: Any) -> str:
+        if kind is not _STRING:
+            self.error("Expecting property name enclosed in double quotes")
+        kind, _ = self.next_token()
+        if kind != ":":
+            self.error("Expecting ':' delimiter")
+        return value
+
+    def error(self, message: str):
+        raise JsonPathStreamError(f"{message} at character {self.offset + self.position} of the JSON text")
+
+
+def _token(match: re.Match) -> tuple[str, Any]:
+    kind = match.lastgroup
+    if kind == "punctuation":
+        return match["punctuation"], None
+    if kind == "string":
+        return _STRING, match["string"]
+    if kind == "literal":
+        return _OTHER, _LITERALS[match["literal"]]
+    number = match["number"]
+    if "." in number or "e" in number or "E" in number:
+        return _OTHER, float(number)
+    return _OTHER, int(number)
+
+
+def find(expression: JSONPath, source: IO, chunk_size: int = CHUNK_SIZE) -> Iterator[tuple[tuple, Any]]:
+    """
+    Yields the `(path, value)` of each match of `expression` in the JSON text read from
+    `source`, a file opened in text or binary mode, as soon as the value ends.
+
+    Raises `JsonPathStreamError` right away when the expression cannot be evaluated on a
+    stream, and while reading when the JSON text is invalid. The errors of the expression
+    on the values are raised at the end of the text.
+    """
+    steps = _steps(expression)
+    if _jsonpath.auto_id_field is not None:
+        raise JsonPathStreamError("Auto ids need the whole document, they cannot be found on a stream")
+    return _Stream(steps).find(tokenize(source, chunk_size))
+
+
+def find_values(expression: JSONPath, source: IO, chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Yields the value of each match of `find()`.
+    """
+    return (value for _, value in find(expression, source, chunk_size))
+
+
+class _Descend:
+    # The `..` between the steps of its left and right sides
+    def __repr__(self) -> str:
+        return ".."
+
+
+DESCEND = _Descend()
+
+# What is done with a value once read
+_MATCH, _FIND, _FILTER = range(3)
+
+
+def _steps(expression: JSONPath) -> list:
+    # The steps of the expression in the order it takes them
+    steps = _flatten(expression)
+    if Root in steps[1:]:
+        raise JsonPathStreamError(f"`$` can only start an expression evaluated on a stream, not {expression}")
+    return [step for step in steps if step is not Root]
+
+
+def _flatten(node: JSONPath) -> list:
+    cls = type(node)
+    if cls is Child:
+        return _flatten(node.left) + _flatten(node.right)
+    if cls is Descendants:
+        return [*_flatten(node.left), DESCEND, *_flatten(node.right)]
+    if cls is StaticPath:
+        return _flatten(node.path)
+    if cls is This:
+        return []
+    if cls is Root:
+        return [Root]
+    if cls is Fields:
+        return [node]
+    if cls is Index and node.index >= 0:
+        return [node]
+    if cls is Slice and (node.start or 0) >= 0 and (node.end or 0) >= 0 and (node.step or 1) > 0:
+        return [node]
+    if (cls is Filter or cls is Negate) and node.expressions:
+        return [node]
+    raise JsonPathStreamError(
+        f"{node} cannot be evaluated on a stream, only `$`, fields, non-negative indices and slices, "
+        "`..` and filters can"
+    )
+
+
+def _path(steps: list) -> JSONPath:
+    # The expression taking `steps`
+    if DESCEND in steps:
+        i = steps.index(DESCEND)
+        return Descendants(_path(steps[:i]), _path(steps[i + 1 :]))
+    path = This()
+    for step in steps:
+        path = step if type(path) is This else Child(path, step)
+    return path
+
+
+class _Frame:
+    # An object or array being read
+    __slots__ = ("actions", "actives", "is_array", "key", "start", "value")
+
+    def __init__(self, is_array: bool, start: int, actives: list, actions: list, value: Any) -> None:
+        self.is_array = is_array
+        # Its order among the values started
+        self.start = start
+        # The key of the current value, or its index
+        self.key = -1
+        # The steps its values are matched against
+        self.actives = actives
+        # What to do with it once read
+        self.actions = actions
+        # Read only when it is needed
+        self.value = value
+
+
+class _Stream:
+    def __init__(self, steps: list) -> None:
+        self.steps = steps
+        # The expressions of the steps from each one, run on values read
+        self.paths: dict[int, JSONPath] = {}
+
+    def find(self, events: Iterator[tuple[str, Any]]) -> Iterator[tuple[tuple, Any]]:
+        frames: list[_Frame] = []
+        # Depth in a value without any match, skipped
+        skip = 0
+        # The values started and not skipped, in the order `find()` goes through them
+        started = 0
+        # The first error of `find()` so far with its order, raised at the end
+        failure = None
+        for event, value in events:
+            if skip:
+                if event is START_MAP or event is START_ARRAY:
+                    skip += 1
+                elif event is END_MAP or event is END_ARRAY:
+                    skip -= 1
+                continue
+            if event is MAP_KEY:
+                frames[-1].key = value
+                continue
+            if event is END_MAP or event is END_ARRAY:
+                frame = frames.pop()
+                if frame.actions:
+                    failure = yield from self._matches(frames, frame.start, frame.value, frame.actions, failure)
+                continue
+
+            # A value starts
+            started += 1
+            if frames:
+                parent = frames[-1]
+                if parent.is_array:
+                    parent.key += 1
+                actives, actions = self._child(parent.actives, parent.key)
+                read = parent.value is not None
+            else:
+                parent, actives, actions, read = None, [0], [], False
+            is_array = event is START_ARRAY
+            actives = self._expand(actives, actions, event is START_MAP, is_array)
+
+            if event is VALUE:
+                if read:
+                    _add(parent, value)
+                if actions:
+                    failure = yield from self._matches(frames, started, value, actions, failure)
+                continue
+            if not (actives or actions or read):
+                skip = 1
+                continue
+            container = None
+            if actions or read:
+                container = [] if is_array else {}
+                if read:
+                    _add(parent, container)
+            frames.append(_Frame(is_array, started, actives, actions, container))
+        if failure is not None:
+            raise failure[1]
+
+    def _child(self, actives: list, key: Any) -> tuple[list, list]:
+        # The steps matching the value at `key` from those of its object or array, and the
+        # filters to test it against
+        steps = self.steps
+        found, actions = [], []
+        for k in actives:
+            step = steps[k]
+            cls = type(step)
+            if step is DESCEND:
+                found.append(k)
+            elif cls is Fields:
+                fields = step.fields
+                found.extend([k + 1] * (1 if "*" in fields else fields.count(key)))
+            elif cls is Index:
+                if key == step.index:
+                    found.append(k + 1)
+            elif cls is Slice:
+                start = step.start or 0
+                if key >= start and (step.end is None or key < step.end) and (key - start) % (step.step or 1) == 0:
+                    found.append(k + 1)
+            else:
+                actions.append((_FILTER, k))
+        return found, actions
+
+    def _expand(self, actives: list, actions: list, is_object: bool, is_array: bool) -> list:
+        # The steps the values of this one are matched against; its own matches and the
+        # steps to run on it once read are added to `actions`
+        steps, last = self.steps, len(self.steps)
+        found = []
+        actives = list(actives)
+        for k in actives:
+            if k == last:
+                actions.append((_MATCH, k))
+                continue
+            step = steps[k]
+            if step is DESCEND:
+                # Its values and itself
+                found.append(k)
+                actives.append(k + 1)
+            elif type(step) is Fields:
+                # No fields but in objects
+                if is_object:
+                    found.append(k)
+            elif is_array:
+                found.append(k)
+            else:
+                # Indices, slices and filters have their own rules for objects and
+                # other values, see `Slice.find()`
+                actions.append((_FIND, k))
+        return found
+
+    def _matches(self, frames: list[_Frame], start: int, value: Any, actions: list, failure: tuple | None):
+        # Yields the matches of `_done()` until an error, and returns the error `find()` raises
+        # first: it tests the values step after step, in the order their `..` (or else they
+        # themselves) start rather than the order they end
+        try:
+            if failure is None:
+                yield from self._done(frames, value, actions)
+            else:
+                # Only tested for an error coming first
+                list(self._done(frames, value, actions))
+        except Exception:
+            for action in actions:
+                try:
+                    list(self._done(frames, value, [action]))
+                except Exception as e:
+                    order = (self._failed_step(value, action), self._anchor(frames, start, action))
+                    if failure is None or order < failure[0]:
+                        failure = (order, e)
+        return failure
+
+    def _failed_step(self, value: Any, action: tuple) -> int:
+        # The step of `action`, or of the steps after it run on the value read, which raises
+        action, k = action
+        if action == _FILTER:
+            try:
+                _all_predicate(self.steps[k])(value)
+            except Exception:
+                return k
+            k += 1
+        for end in range(k + 1, len(self.steps) + 1):
+            try:
+                _path(self.steps[k:end]).find(DatumInContext.wrap(value))
+            except Exception:
+                return end - 1
+        return len(self.steps) - 1
+
+    def _anchor(self, frames: list[_Frame], start: int, action: tuple) -> tuple:
+        # The starts of the values down to the one the last `..` before the step of `action`
+        # matched, each step after the `..` going one value further down
+        action, k = action
+        starts = (*(frame.start for frame in frames), start)
+        descend = max((i for i in range(k) if self.steps[i] is DESCEND), default=None)
+        if descend is None:
+            return starts
+        below = k - descend - (0 if action == _FILTER else 1)
+        return starts[: len(starts) - below]
+
+    def _done(self, frames: list[_Frame], value: Any, actions: list) -> Iterator[tuple[tuple, Any]]:
+        path = tuple(frame.key for frame in frames)
+        for action, k in actions:
+            if action == _FILTER:
+                step = self.steps[k]
+                if bool(_all_predicate(step)(value)) is (type(step) is Negate):
+                    continue
+                k += 1
+                if k == len(self.steps):
+                    yield path, value
+                    continue
+            elif action == _MATCH:
+                yield path, value
+                continue
+            found = self._path(k).find(DatumInContext.wrap(value))
+            for keys, datum in zip(_datum_keys(found), found):
+                yield path + keys, datum.value
+
+    def _path(self, k: int) -> JSONPath:
+        path = self.paths.get(k)
+        if path is None:
+            path = self.paths[k] = _path(self.steps[k:])
+        return path
+
+
+def _add(frame: _Frame, value: Any) -> None:
+    if frame.is_array:
+        frame.value.append(value)
+    else:
+        frame.value[frame.key] = value
@@ -0,0 +1,392 @@
+"""
+A document flattened into a table of its nodes, to run many queries on one large document.
+
+`PathTable(document)` walks the document once and stores one row per node (object,
+list or scalar) in pre-order, in columns: the parent row, the key or index of the
+node in its parent, a type tag and the value itself. The rows below a row are a
+contiguous range, so `..` is a range of rows, and `..key` a lookup in a map of the
+rows by key built on first use.
+
+`PathTable.find(expression)` evaluates a parsed `JSONPath` on the table and returns
+the same `DatumInContext`s as `expression.find(document)`. Matches are row numbers
+until the end, where only they and their ancestors are turned into `DatumInContext`s;
+`find_values()` skips that and returns the values. The steps the table does not
+know about, such as filters, run their own `find()` on the `DatumInContext` of their
+input rows, and the steps after them work on their results the usual way.
+
+The table does not follow changes to the document, build a new one after changing it.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Any
+
+from bc_jsonpath_ng import jsonpath
+from bc_jsonpath_ng.jsonpath import (
+    ROOT,
+    THIS,
+    Child,
+    DatumInContext,
+    Descendants,
+    Fields,
+    FlatUnion,
+    Index,
+    JSONPath,
+    Parent,
+    Root,
+    Slice,
+    StaticPath,
+    This,
+    Union,
+    field_path,
+    index_path,
+)
+
+if TYPE_CHECKING:
+    from typing import Hashable
+
+# Type tags
+SCALAR = 0
+OBJECT = 1
+ARRAY = 2
+
+# Steps evaluated on the rows; any other step gets the `DatumInContext`s of its input rows
+TABLE_STEPS = (Root, This, Parent, Child, StaticPath, Descendants, Union, FlatUnion, Fields, Index, Slice)
+
+
+class PathTable:
+    """
+    The nodes of a document as columns, in pre-order. Row 0 is the document itself.
+    """
+
+    def __init__(self, document: Any) -> None:
+        self.document = document
+        self.parents = array("q", [-1])
+        self.keys: list[Hashable] = [None]
+        self.tags = array("b", [_tag(document)])
+        self.values: list[Any] = [document]
+        # One past the last row below each row
+        self.ends = array("q", [1])
+        # Built on first use: the rows of the children of a row, by position and by key,
+        # and the rows of the values of object keys, by key
+        self._children: dict[int, list[int]] = {}
+        self._child_rows: dict[int, dict[Hashable, int]] = {}
+        self._by_key: dict[Hashable, list[int]] | None = None
+        self._build()
+
+    def _build(self) -> None:
+        parents, keys, tags, values, ends = self.parents, self.keys, self.tags, self.values, self.ends
+        stack = [(0, _items(self.document))]
+        while stack:
+            parent, items = stack[-1]
+            for key, value in items:
+                row = len(values)
+                tag = _tag(value)
+                parents.append(parent)
+                keys.append(key)
+                tags.append(tag)
+                values.append(value)
+                ends.append(row + 1)
+                if tag != SCALAR:
+                    stack.append((row, _items(value)))
+                    break
+            else:
+                stack.pop()
+                ends[parent] = len(values)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def find(self, expression: JSONPath) -> list[DatumInContext]:
+        """
+        Returns the matches of `expression.find(document)`.
+        """
+        if not self._on_rows(expression):
+            return expression.find(self.document)
+        top = _top(expression)
+        datums = {0: DatumInContext(self.document, path=top)}
+        found = self._find(expression, [0], top)
+        return [match if not isinstance(match, int) else self.datum(match, datums) for match in found]
+
+    def find_values(self, expression: JSONPath) -> list[Any]:
+        """
+        Returns the values of the matches of `expression.find(document)`.
+        """
+        if not self._on_rows(expression):
+            return [datum.value for datum in expression.find(self.document)]
+        values = self.values
+        found = self._find(expression, [0], _top(expression))
+        return [values[match] if isinstance(match, int) else match.value for match in found]
+
+    def datum(self, row: int, datums: dict[int, DatumInContext] | None = None) -> DatumInContext:
+        """
+        Returns the `DatumInContext` of `row`, with the path and contexts `find()` gives it.
+        Rows sharing an ancestor in `datums` share its `DatumInContext`, which are added there;
+        by default row 0 is the document as matched by `$`.
+        """
+        if datums is None:
+            datums = {0: DatumInContext(self.document, path=ROOT)}
+        chain = []
+        while row not in datums:
+            chain.append(row)
+            row = self.parents[row]
+        datum = datums[row]
+        for row in reversed(chain):
+            key = self.keys[row]
+            path = index_path(key) if self.tags[self.parents[row]] == ARRAY else field_path(key)
+            datum = datums[row] = DatumInContext(self.values[row], path=path, context=datum)
+        return datum
+
+    def path(self, row: int) -> tuple:
+        """
+        Returns the keys and indices leading from the document to `row`.
+        """
+        path = []
+        while row > 0:
+            path.append(self.keys[row])
+            row = self.parents[row]
+        return tuple(reversed(path))
+
+    def children(self, row: int) -> list[int]:
+        """
+        Returns the rows of the children of `row`, in the order of the document.
+        """
+        children = self._children.get(row)
+        if children is None:
+            ends, child, end = self.ends, row + 1, self.ends[row]
+            children = self._children[row] = []
+            while child < end:
+                children.append(child)
+                child = ends[child]
+        return children
+
+    def child(self, row: int, key: Hashable) -> int | None:
+        """
+        Returns the row of the value of `key` in the object at `row`, or None.
+        """
+        fields = self._child_rows.get(row)
+        if fields is None:
+            keys = self.keys
+            fields = self._child_rows[row] = {keys[child]: child for child in self.children(row)}
+        return fields.get(key)
+
+    def rows_by_key(self, key: Hashable) -> list[int]:
+        """
+        Returns the rows of the values of `key` in all the objects, in pre-order.
+        """
+        if self._by_key is None:
+            by_key: dict[Hashable, list[int]] = {}
+            parents, keys, tags = self.parents, self.keys, self.tags
+            for row in range(1, len(keys)):
+                if tags[parents[row]] == OBJECT:
+                    by_key.setdefault(keys[row], []).append(row)
+            self._by_key = by_key
+        return self._by_key.get(key, [])
+
+    def _on_rows(self, expression: JSONPath) -> bool:
+        # Auto ids are left to `find()`, as is `$` after the start of a path: row 0 stands
+        # for both the document given to `find()` and the document matched by `$`, whose
+        # `DatumInContext`s differ by their path
+        if jsonpath.auto_id_field is not None:
+            return False
+        return _starts_with_root(expression) or not _has_root(expression)
+
+    def _find(self, node: JSONPath, matches: list, top: JSONPath) -> list:
+        """
+        Returns the matches of `node` for each of `matches`, rows or `DatumInContext`s,
+        `top` being the path of row 0.
+        """
+        cls = type(node)
+        if cls is Child:
+            return self._find(node.right, self._find(node.left, matches, top), top)
+        if cls is StaticPath:
+            return self._find(node.path, matches, top)
+        if cls is Union:
+            found = []
+            for match in matches:
+                found.extend(self._find(node.left, [match], top))
+                found.extend(self._find(node.right, [match], top))
+            return found
+        if cls is FlatUnion:
+            found = []
+            for match in matches:
+                for path in node.paths:
+                    found.extend(self._find(path, [match], top))
+            return found
+        if cls is Descendants:
+            return self._descendants(node, self._find(node.left, matches, top), top)
+
+        step = _STEPS.get(cls)
+        found = []
+        for match in matches:
+            if not isinstance(match, int):
+                found.extend(node.find(match))
+            elif step is None or not step(self, node, match, found):
+                datum = self._own_datum(match, top)
+                found.extend(self._rows(match, datum, node.find(datum)))
+        return found
+
+    def _rows(self, row: int, datum: DatumInContext, found: list[DatumInContext]) -> list:
+        # Back to rows, the matches which are `row` itself or one of its items, as a filter on
+        # a list returns; the steps after them are then run on the rows too
+        if datum.value is not self.values[row]:
+            # Changed by the step, e.g. a filter wrapping an object into a list
+            return found
+        children = self.children(row) if self.tags[row] == ARRAY else ()
+        rows = []
+        for match in found:
+            if match is datum:
+                match = row
+            elif not isinstance(match, DatumInContext):
+                # `Parent.find()` of the document is [None], the next steps get it as `Child.find()` does
+                pass
+            elif match.context is datum and type(match.path) is Index and 0 <= match.path.index < len(children):
+                child = children[match.path.index]
+                if self.values[child] is match.value:
+                    match = child
+            rows.append(match)
+        return rows
+
+    def _own_datum(self, row: int, top: JSONPath) -> DatumInContext:
+        # A `DatumInContext` of its own, steps such as filters change their input
+        return self.datum(row, {0: DatumInContext(self.document, path=top)})
+
+    def _descendants(self, node: Descendants, matches: list, top: JSONPath) -> list:
+        found = []
+        right = node.right
+        fields = right.fields if type(right) is Fields else ()
+        by_key = fields and "*" not in fields and len(set(fields)) == len(fields)
+        for match in matches:
+            if not isinstance(match, int) or not _is_pure(right):
+                found.extend(
+                    Descendants(THIS, right).find(match if not isinstance(match, int) else self._own_datum(match, top))
+                )
+            elif by_key:
+                found.extend(self._descendant_fields(match, fields))
+            else:
+                # The rows below a row, in the order of the walk of `Descendants.find()`
+                found.extend(self._find(right, list(range(match, self.ends[match])), top))
+        return found
+
+    def _descendant_fields(self, row: int, fields: tuple) -> list[int]:
+        end = self.ends[row]
+        rows = []
+        for field in fields:
+            found = self.rows_by_key(field)
+            rows.extend(found[bisect_left(found, row + 1) : bisect_left(found, end)])
+        if len(fields) == 1:
+            # By object, as `find()` looks for the field in each object of the walk
+            return sorted(rows, key=self.parents.__getitem__)
+        order = {field: i for i, field in enumerate(fields)}
+        keys, parents = self.keys, self.parents
+        return sorted(rows, key=lambda row: (parents[row], order[keys[row]]))
+
+    # The steps on a row: each appends its matches to `found` and returns True, or returns
+    # False to have the step run its own `find()`
+
+    def _step_root(self, node: Root, row: int, found: list) -> bool:
+        found.append(0)
+        return True
+
+    def _step_this(self, node: This, row: int, found: list) -> bool:
+        found.append(row)
+        return True
+
+    def _step_parent(self, node: Parent, row: int, found: list) -> bool:
+        if row == 0:
+            return False
+        found.append(self.parents[row])
+        return True
+
+    def _step_fields(self, node: Fields, row: int, found: list) -> bool:
+        tag = self.tags[row]
+        if tag == ARRAY:
+            return True
+        if tag != OBJECT:
+            return False
+        if "*" in node.fields:
+            found.extend(self.children(row))
+            return True
+        for field in node.fields:
+            child = self.child(row, field)
+            if child is not None:
+                found.append(child)
+        return True
+
+    def _step_index(self, node: Index, row: int, found: list) -> bool:
+        if self.tags[row] != ARRAY or node.index < 0:
+            return False
+        children = self.children(row)
+        if node.index < len(children):
+            found.append(children[node.index])
+        return True
+
+    def _step_slice(self, node: Slice, row: int, found: list) -> bool:
+        # Other values are coerced into a one element list
+        if self.tags[row] != ARRAY:
+            return False
+        children = self.children(row)
+        found.extend(children[node.start : node.end : node.step])
+        return True
+
+
+_STEPS = {
+    Root: PathTable._step_root,
+    This: PathTable._step_this,
+    Parent: PathTable._step_parent,
+    Fields: PathTable._step_fields,
+    Index: PathTable._step_index,
+    Slice: PathTable._step_slice,
+}
+
+
+def _tag(value: Any) -> int:
+    if isinstance(value, dict):
+        return OBJECT
+    if isinstance(value, list):
+        return ARRAY
+    return SCALAR
+
+
+def _items(value: Any):
+    # The same children as the walk of `Descendants`
+    if isinstance(value, list):
+        for i in range(len(value)):
+            yield i, value[i]
+    elif isinstance(value, dict):
+        for field in value:
+            yield field, value[field]
+
+
+def _is_pure(node: JSONPath) -> bool:
+    # Whether `node` leaves its input alone, the walk of `..` then stays on the rows
+    cls = type(node)
+    if cls is Child or cls is Descendants or cls is Union:
+        return _is_pure(node.left) and _is_pure(node.right)
+    if cls is FlatUnion:
+        return all(_is_pure(path) for path in node.paths)
+    return cls in TABLE_STEPS
+
+
+def _top(expression: JSONPath) -> JSONPath:
+    return ROOT if _starts_with_root(expression) else THIS
+
+
+def _starts_with_root(node: JSONPath) -> bool:
+    while type(node) in (Child, Descendants):
+        node = node.left
+    if type(node) is StaticPath:
+        node = node.steps[0]
+    return type(node) is Root
+
+
+def _has_root(node: Any) -> bool:
+    if isinstance(node, Root):
+        return True
+    if isinstance(node, JSONPath):
+        return any(_has_root(child) for name, child in vars(node).items() if name != "_compiled")
+    if isinstance(node, (list, tuple)):
+        return any(_has_root(item) for item in node)
+    return False
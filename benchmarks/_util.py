@@ -0,0 +1,25 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Run them from the repository root, e.g. `make bench` or `PYTHONPATH=. python benchmarks/bench_parse.py`.
+"""
+from __future__ import annotations
+
+import timeit
+from typing import Callable
+
+
+def bench(label: str, fn: Callable[[], object], number: int | None = None, repeat: int = 5) -> float:
+    """
+    Prints and returns the best time per call of `fn`, in seconds.
+    """
+    timer = timeit.Timer(fn)
+    if number is None:
+        number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+    print(f"{label:<60} {best * 1e6:14.2f} us")  # noqa: T201
+    return best
+
+
+def header(title: str) -> None:
+    print(f"\n{title}\n{'-' * len(title)}")  # noqa: T201
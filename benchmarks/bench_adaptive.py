@@ -0,0 +1,56 @@
+"""
+Filters whose expressions are written expensive and unselective first, on skewed
+data: the adaptive order against the written one.
+"""
+from __future__ import annotations
+
+from _util import bench, header
+
+from bc_jsonpath_ng.ext import filter as filter_
+from bc_jsonpath_ng.ext.parser import ExtentedJsonPathParser
+
+# Equality tests on fixed fields, which never raise and so may be reordered
+QUERIES = [
+    "$.items[?(@.name != 'bucket' & @.size != '-1' & @.type == 'aws_s3_bucket')]",
+    "$.items[?(@.name == 'bucket' | @.size == '-1' | @.type == 'aws_instance')]",
+]
+
+
+class WrittenOrder:
+    def reorder(self):
+        pass
+
+
+def main():
+    size = 20_000
+    document = {
+        "items": [
+            {
+                "name": f"item{i}",
+                "type": "aws_s3_bucket" if i % 100 == 0 else "aws_instance",
+                "size": str(i % 1000),
+                "tags": [{"key": "env"}, {"key": "team"}],
+            }
+            for i in range(size)
+        ]
+    }
+    # Tested item by item, see bench_columnar.py otherwise
+    filter_.COLUMNAR_MIN_ITEMS = size + 1
+    reorder = filter_.AdaptivePredicate.reorder
+    for query in QUERIES:
+        header(f"{query} ({size} items)")
+        for label, method in (("written order", WrittenOrder.reorder), ("adaptive order", reorder)):
+            filter_.AdaptivePredicate.reorder = method
+            # Not the cached expression, its predicates are those of the first order
+            expression = ExtentedJsonPathParser().parse(query)
+            bench(f"find() {label}", lambda: expression.find(document), number=1)  # noqa: B023
+            bench(f"find_values() {label}", lambda: expression.find_values(document), number=1)  # noqa: B023
+        node = expression.right
+        if "|" in query:
+            node = node.expressions[0]
+        for statistics in filter_.statistics(node):
+            print(f"    {statistics.position} {statistics.pass_rate:.3f} {statistics.expression}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
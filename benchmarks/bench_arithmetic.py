@@ -0,0 +1,61 @@
+"""
+Arithmetic over large lists, `$.a[*].x * $.a[*].y`: the columns at once against
+the operation applied and wrapped a pair at a time as before.
+"""
+from __future__ import annotations
+
+from _util import bench, header
+
+from bc_jsonpath_ng.ext import columnar
+from bc_jsonpath_ng.ext.arithmetic import Operation
+from bc_jsonpath_ng.ext.parser import ExtentedJsonPathParser
+from bc_jsonpath_ng.jsonpath import DatumInContext, JSONPath
+
+QUERIES = [
+    "$.a[*].x * $.a[*].y",
+    "$.a[*].x + $.a[*].f",
+    "$.a[*].f * 2.5",
+]
+
+
+class PairAtATime(Operation):
+    # `Operation.find()` before the columns
+    def find(self, datum):
+        result = []
+        if isinstance(self.left, JSONPath) and isinstance(self.right, JSONPath):
+            left_results = self.left.find(datum)
+            right_results = self.right.find(datum)
+            if left_results and right_results and len(left_results) == len(right_results):
+                for left, right in zip(left_results, right_results):
+                    try:
+                        result.append(self.op(left.value, right.value))
+                    except TypeError:
+                        return []
+            else:
+                return []
+        elif isinstance(self.left, JSONPath):
+            for left in self.left.find(datum):
+                try:
+                    result.append(self.op(left.value, self.right))
+                except TypeError:
+                    return []
+        return [DatumInContext.wrap(r) for r in result]
+
+
+def main():
+    print(f"NumPy: {'yes' if columnar.numpy is not None else 'no'}")  # noqa: T201
+    for size in (10_000, 100_000):
+        document = {"a": [{"x": i, "y": i % 7, "f": i / 3} for i in range(size)]}
+        for query in QUERIES:
+            expression = ExtentedJsonPathParser().parse(query)
+            before = PairAtATime(expression.left, "+", expression.right)
+            before.op = expression.op
+            header(f"{query} ({size} items)")
+            bench("find() pair at a time", lambda: before.find(document), number=1)  # noqa: B023
+            bench("find() columns", lambda: expression.find(document), number=1)  # noqa: B023
+            bench("ifind() columns, first match", lambda: next(expression.ifind(document)), number=1)  # noqa: B023
+            bench("find_values() columns", lambda: expression.find_values(document), number=1)  # noqa: B023
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Expressions parsed per second by the PLY backend and the recursive descent backend.
+
+The expression cache is bypassed, every call parses its expressions from scratch.
+"""
+from __future__ import annotations
+
+from functools import partial
+
+from _util import bench, header
+
+from bc_jsonpath_ng.descent import JsonPathDescentParser
+from bc_jsonpath_ng.ext.descent import ExtendedJsonPathDescentParser
+from bc_jsonpath_ng.ext.parser import ExtentedJsonPathParser
+from bc_jsonpath_ng.parser import JsonPathParser
+
+BASE_EXPRESSIONS = [
+    "$.resource[*].aws_s3_bucket.*.versioning[0].enabled",
+    "$..Properties.Tags[*].Key",
+    "spec.template.spec.containers[*].securityContext.privileged",
+    "foo[1:3].bar where baz",
+    "`this`.'quoted key'.`parent`",
+]
+
+EXTENDED_EXPRESSIONS = [
+    *BASE_EXPRESSIONS,
+    "$.Resources[?(@.Type == 'AWS::S3::Bucket')].Properties",
+    "$.resource[?(@.count > 1 & @.enabled == true)].name",
+    "$.objects[\\cat, /cow].name",
+    "$.price * $.quantity",
+    "$.items.`len`",
+]
+
+
+def parse_all(parser_class, expressions):
+    for expression in expressions:
+        parser_class().parse(expression)
+
+
+def main():
+    for title, expressions, backends in [
+        ("JsonPathParser grammar", BASE_EXPRESSIONS, [JsonPathParser, JsonPathDescentParser]),
+        (
+            "ExtentedJsonPathParser grammar",
+            EXTENDED_EXPRESSIONS,
+            [ExtentedJsonPathParser, ExtendedJsonPathDescentParser],
+        ),
+    ]:
+        header(f"{title}, {len(expressions)} expressions")
+        for parser_class in backends:
+            parse_all(parser_class, expressions)  # build the PLY tables before timing
+            best = bench(parser_class.__name__, partial(parse_all, parser_class, expressions))
+            print(f"{'':<60} {len(expressions) / best:14.0f} expressions/s")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Loading a policy pack: parsing thousands of expressions, many of them repeated with different spacing.
+
+"before" calls `ext.parse` on every string, "after" calls `parse_many` once. The expression
+cache is cleared before every run, so every run starts cold.
+"""
+from __future__ import annotations
+
+import os
+
+from _util import bench, header
+
+from bc_jsonpath_ng.bulk import parse_many
+from bc_jsonpath_ng.cache import expression_cache
+from bc_jsonpath_ng.ext import parse
+
+# 2000 distinct expressions, each appearing three times with different spacing
+STRINGS = [
+    spacing.format(i=i)
+    for i in range(2000)
+    for spacing in [
+        "$.resource[*].aws_s3_bucket.*.rule{i}[?(@.enabled == true)].name",
+        "$.resource[*].aws_s3_bucket.*.rule{i}[?(@.enabled == true)].name ",
+        "$.resource[*].aws_s3_bucket.*.rule{i}[?(@.enabled  ==  true)].name",
+    ]
+]
+
+
+def parse_each():
+    expression_cache.clear()
+    for string in STRINGS:
+        parse(string)
+
+
+def parse_bulk(processes=None):
+    expression_cache.clear()
+    parse_many(STRINGS, processes=processes)
+
+
+def main():
+    header(f"{len(STRINGS)} strings, 2000 distinct expressions, cold cache")
+    bench("before: ext.parse() per string", parse_each, number=1, repeat=3)
+    bench("after: parse_many()", parse_bulk, number=1, repeat=3)
+    processes = os.cpu_count() or 1
+    bench(f"after: parse_many(processes={processes})", lambda: parse_bulk(processes), number=1, repeat=3)
+
+
+if __name__ == "__main__":
+    main()
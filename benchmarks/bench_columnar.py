@@ -0,0 +1,53 @@
+"""
+Filters on large lists of records, item by item against a column at a time,
+at 10k, 100k and 1M items.
+"""
+from __future__ import annotations
+
+from _util import bench, header
+
+from bc_jsonpath_ng.ext import columnar
+from bc_jsonpath_ng.ext import filter as filter_
+from bc_jsonpath_ng.ext.parser import ExtentedJsonPathParser
+
+QUERIES = [
+    "$.items[?(@.price > 10)]",
+    "$.items[?(@.price > 10.5)]",
+    "$.items[?(@.type == 'aws_s3_bucket')]",
+    "$.items[?(@.type == 'aws_s3_bucket' & @.price > 10)]",
+    "$.items[?(@.tags[0].key == 'env')]",
+]
+
+
+def main():
+    print(f"NumPy: {'yes' if columnar.numpy is not None else 'no'}")  # noqa: T201
+    columnar_min_items = filter_.COLUMNAR_MIN_ITEMS
+    for size in (10_000, 100_000, 1_000_000):
+        document = {
+            "items": [
+                {
+                    "type": "aws_s3_bucket" if i % 10 == 0 else "aws_instance",
+                    "price": i % 20,
+                    "tags": [{"key": "env" if i % 2 else "team"}],
+                }
+                for i in range(size)
+            ]
+        }
+        for item in document["items"][::2]:
+            item["price"] += 0.5
+        for query in QUERIES:
+            expression = ExtentedJsonPathParser().parse(query)
+            header(f"{query} ({size} items)")
+            for label, min_items in (("item by item", size + 1), ("columns", columnar_min_items)):
+                filter_.COLUMNAR_MIN_ITEMS = min_items
+                bench(f"find() {label}", lambda: expression.find(document), number=1, repeat=3)  # noqa: B023
+                bench(
+                    f"find_values() {label}",
+                    lambda: expression.find_values(document),  # noqa: B023
+                    number=1,
+                    repeat=3,
+                )
+
+
+if __name__ == "__main__":
+    main()
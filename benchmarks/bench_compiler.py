@@ -0,0 +1,69 @@
+"""
+`find()` against the functions returned by `compile()`, on CloudFormation and
+Terraform shaped documents.
+"""
+from __future__ import annotations
+
+from _util import bench, header
+
+from bc_jsonpath_ng.ext import parse
+
+
+def cloudformation(resources: int) -> dict:
+    return {
+        "AWSTemplateFormatVersion": "2010-09-09",
+        "Resources": {
+            f"Bucket{i}": {
+                "Type": "AWS::S3::Bucket" if i % 2 else "AWS::EC2::Instance",
+                "Properties": {
+                    "BucketName": f"bucket-{i}",
+                    "Tags": [{"Key": "env", "Value": "prod"}, {"Key": "owner", "Value": f"team{i % 5}"}],
+                    "VersioningConfiguration": {"Status": "Enabled" if i % 3 else "Suspended"},
+                },
+            }
+            for i in range(resources)
+        },
+    }
+
+
+def terraform(resources: int) -> dict:
+    return {
+        "resource": [
+            {
+                "aws_instance": {
+                    f"web{i}": {
+                        "ami": "ami-123",
+                        "instance_type": "t2.micro" if i % 2 else "m5.large",
+                        "ebs_block_device": [{"encrypted": bool(i % 2), "volume_size": 8 * (i % 4 + 1)}],
+                    }
+                }
+            }
+            for i in range(resources)
+        ]
+    }
+
+
+QUERIES = [
+    ("cloudformation", "$.Resources.*.Properties.BucketName"),
+    ("cloudformation", "$.Resources.*.Properties.Tags[*].Value"),
+    ("cloudformation", "$.Resources.*[?(@.Type == 'AWS::S3::Bucket')].Properties.VersioningConfiguration.Status"),
+    ("cloudformation", "$..Key"),
+    ("terraform", "$.resource[*].aws_instance.*.ebs_block_device[?(@.volume_size > 16)].encrypted"),
+    ("terraform", "$.resource[*].aws_instance.*.instance_type"),
+]
+
+
+def main():
+    documents = {"cloudformation": cloudformation(200), "terraform": terraform(200)}
+    for name, query in QUERIES:
+        expression, document = parse(query), documents[name]
+        header(f"{query[:70]} ({name}, 200 resources)")
+        bench("find()", lambda: expression.find(document))  # noqa: B023
+        compiled = expression.compile()
+        bench("compile()", lambda: compiled(document))  # noqa: B023
+        compiled = expression.compile(paths=True)
+        bench("compile(paths=True)", lambda: compiled(document))  # noqa: B023
+
+
+if __name__ == "__main__":
+    main()
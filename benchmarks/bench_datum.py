@@ -0,0 +1,36 @@
+"""
+Memory kept per match and `find()` time on large arrays, where most of the work is
+building the `DatumInContext` of each match.
+"""
+from __future__ import annotations
+
+import tracemalloc
+
+from _util import bench, header
+
+from bc_jsonpath_ng.ext import parse
+
+QUERIES = ["$.items[*]", "$.items[*].name", "$.items[*].*", "$..id"]
+
+
+def memory_per_match(expression, document) -> float:
+    expression.find(document)
+    tracemalloc.start()
+    found = expression.find(document)
+    kept, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return kept / len(found)
+
+
+def main():
+    size = 100_000
+    document = {"items": [{"id": i, "name": f"item{i}", "tags": ["a", "b"]} for i in range(size)]}
+    for query in QUERIES:
+        expression = parse(query)
+        header(f"{query} ({size} items)")
+        bench("find()", lambda: expression.find(document), number=1)  # noqa: B023
+        print(f"{'memory per match':<60} {memory_per_match(expression, document):14.1f} B")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+`..` on very deep and very wide documents: time of `find()` and `ifind()`, and peak
+memory of walking the document with `first()`, which should not depend on its size.
+"""
+from __future__ import annotations
+
+import tracemalloc
+
+from _util import bench, header
+
+from bc_jsonpath_ng.ext import parse
+
+
+def deep(depth: int) -> dict:
+    document = leaf = {}
+    for i in range(depth):
+        child = {}
+        leaf["x"], leaf["a"] = i, [child] if i % 2 else child
+        leaf = child
+    return document
+
+
+def wide(width: int) -> dict:
+    return {"items": [{"id": i} for i in range(width)], "x": 1}
+
+
+def peak(fn) -> int:
+    tracemalloc.start()
+    fn()
+    _, top = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return top
+
+
+def main():
+    for name, document in (("10k levels deep", deep(10_000)), ("1M nodes wide", wide(1_000_000))):
+        header(name)
+        for query in ("$..x", "$..missing"):
+            expression = parse(query)
+            try:
+                bench(f"{query} find()", lambda: expression.find(document), number=1, repeat=1)  # noqa: B023
+                count = lambda: sum(1 for _ in expression.ifind(document))  # noqa: B023, E731
+                bench(f"{query} ifind()", count, number=1, repeat=1)
+                top = peak(lambda: expression.first(document))  # noqa: B023
+                print(f"{query + ' first() peak memory':<60} {top / 1024:14.1f} KiB")  # noqa: T201
+            except RecursionError:
+                print(f"{query:<60} {'RecursionError':>14}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+`find()` against `find_distinct()` on expressions matching the same nodes many times:
+chained `..` on nested objects, and overlapping unions.
+"""
+from __future__ import annotations
+
+from _util import bench, header
+from bench_compiler import cloudformation
+
+from bc_jsonpath_ng.ext import parse
+
+
+def nested(depth: int) -> dict:
+    document = leaf = {}
+    for i in range(depth):
+        leaf["b"] = i
+        leaf["a"] = leaf = {}
+    return document
+
+
+def counts(expression, document) -> None:
+    found, distinct = len(expression.find(document)), len(expression.find_distinct(document))
+    print(f"{'matches, distinct matches':<60} {found:>8} {distinct:>8}")  # noqa: T201
+
+
+def main():
+    document = nested(40)
+    for query in ["$..a..b", "$..a..a..b", "$..a..a..a..b"]:
+        expression = parse(query)
+        header(f"{query} (40 nested objects)")
+        counts(expression, document)
+        bench("find()", lambda: expression.find(document), repeat=1)  # noqa: B023
+        bench("find_distinct()", lambda: expression.find_distinct(document))  # noqa: B023
+
+    document = cloudformation(500)
+    for query in ["$..Properties..Key", "$..Resources..Tags..Key"]:
+        expression = parse(query)
+        header(f"{query} (500 resources)")
+        counts(expression, document)
+        bench("find()", lambda: expression.find(document))  # noqa: B023
+        bench("find_distinct()", lambda: expression.find_distinct(document))  # noqa: B023
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Separate `find()` calls for many expressions against one `ExpressionSet.find()`.
+"""
+from __future__ import annotations
+
+from _util import bench, header
+
+from bc_jsonpath_ng.expression_set import ExpressionSet
+from bc_jsonpath_ng.ext import parse
+
+
+def template(resources: int) -> dict:
+    return {
+        "Resources": {
+            f"Resource{i}": {
+                "Type": f"AWS::Service{i % 7}::Thing",
+                "Properties": {"Name": f"name{i}", "Tags": [{"Key": "k", "Value": i}], "Size": i},
+            }
+            for i in range(resources)
+        }
+    }
+
+
+def queries(count: int) -> list[str]:
+    shapes = [
+        "$.Resources.Resource{i}.Properties.Name",
+        "$.Resources.Resource{i}.Type",
+        "$.Resources.*.Properties.Tags[{j}].Key",
+        "$..Size",
+        "$..Value",
+        "$.Resources.Resource{i}..Key",
+    ]
+    return [shapes[n % len(shapes)].format(i=n % 50, j=n % 2) for n in range(count)]
+
+
+def main():
+    document = template(50)
+    for count in (10, 100, 500):
+        expressions = [parse(query) for query in queries(count)]
+        header(f"{count} expressions, 50 resources")
+        bench("separate find()", lambda: [expression.find(document) for expression in expressions])  # noqa: B023
+        expression_set = ExpressionSet(expressions)
+        bench("ExpressionSet.find()", lambda: expression_set.find(document))  # noqa: B023
+
+
+if __name__ == "__main__":
+    main()
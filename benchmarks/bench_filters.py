@@ -0,0 +1,43 @@
+"""
+Filters on a large list: `find()` and `find_values()` with comparisons, number
+coercion, regexes, `&` and `|`.
+"""
+from __future__ import annotations
+
+from _util import bench, header
+
+from bc_jsonpath_ng.ext import parse
+
+QUERIES = [
+    "$.items[?(@.type == 'bucket')]",
+    "$.items[?(@.size > 500)]",
+    "$.items[?(@.name =~ '^item1')]",
+    "$.items[?(@.type == 'bucket' & @.size > 500)]",
+    "$.items[?(@.type == 'bucket' | @.size > 500)]",
+    "$.items[?(@.tags[0].key == 'env')]",
+    "$.items[?(@.tags[*].key == 'env')]",
+]
+
+
+def main():
+    size = 10_000
+    document = {
+        "items": [
+            {
+                "name": f"item{i}",
+                "type": "bucket" if i % 3 else "queue",
+                "size": str(i % 1000),
+                "tags": [{"key": "env"}, {"key": "team"}],
+            }
+            for i in range(size)
+        ]
+    }
+    for query in QUERIES:
+        expression = parse(query)
+        header(f"{query} ({size} items)")
+        bench("find()", lambda: expression.find(document), number=1)  # noqa: B023
+        bench("find_values()", lambda: expression.find_values(document), number=1)  # noqa: B023
+
+
+if __name__ == "__main__":
+    main()
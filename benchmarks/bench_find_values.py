@@ -0,0 +1,41 @@
+"""
+`find()` against `find_values()` and `find_paths()`: time, and memory allocated per call.
+"""
+from __future__ import annotations
+
+import tracemalloc
+
+from _util import bench, header
+from bench_compiler import QUERIES, cloudformation, terraform
+
+from bc_jsonpath_ng.ext import parse
+
+
+def allocated(label: str, fn) -> None:
+    """
+    Prints the memory allocated while calling `fn` once, and the memory its result keeps.
+    """
+    fn()
+    tracemalloc.start()
+    result = fn()
+    kept, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<40} {peak / 1024:10.1f} KiB peak {kept / 1024:10.1f} KiB kept")  # noqa: T201
+    del result
+
+
+def main():
+    documents = {"cloudformation": cloudformation(200), "terraform": terraform(200)}
+    for name, query in QUERIES:
+        expression, document = parse(query), documents[name]
+        header(f"{query[:70]} ({name}, 200 resources)")
+        bench("find()", lambda: [match.value for match in expression.find(document)])  # noqa: B023
+        bench("find_values()", lambda: expression.find_values(document))  # noqa: B023
+        bench("find_paths()", lambda: expression.find_paths(document))  # noqa: B023
+        allocated("find()", lambda: expression.find(document))  # noqa: B023
+        allocated("find_values()", lambda: expression.find_values(document))  # noqa: B023
+        allocated("find_paths()", lambda: expression.find_paths(document))  # noqa: B023
+
+
+if __name__ == "__main__":
+    main()
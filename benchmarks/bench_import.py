@@ -0,0 +1,75 @@
+"""
+Import cost of the package, measured with `python -X importtime` in fresh interpreters.
+
+Exits with status 1 when the median cost of `import bc_jsonpath_ng` exceeds `--budget` milliseconds.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+from _util import header
+
+SCENARIOS = {
+    "import bc_jsonpath_ng": "import bc_jsonpath_ng",
+    "import bc_jsonpath_ng.ext": "import bc_jsonpath_ng.ext",
+    "from bc_jsonpath_ng import parse": "from bc_jsonpath_ng import parse",
+    "imports of a first parse, descent backend": "from bc_jsonpath_ng.ext import parse; parse('$.a[?(@.b > 1)]', backend='descent')",
+    "imports of a first parse, ply backend": "from bc_jsonpath_ng.ext import parse; parse('$.a[?(@.b > 1)]')",
+}
+
+
+def import_time(code: str, startup_modules: frozenset[str] = frozenset()) -> tuple[float, set[str]]:
+    """
+    Runs `code` in a new interpreter, returns the cumulative import time (in seconds) of the
+    modules it imported besides `startup_modules` and the names of all the imported modules.
+    """
+    # Measure with bytecode caching, as an installed package would run
+    env = {key: value for key, value in os.environ.items() if key != "PYTHONDONTWRITEBYTECODE"}
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    total = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        modules.add(name.strip())
+        # The cumulative time of the top level imports covers the nested ones
+        if not name.startswith("  ") and name.strip() not in startup_modules:
+            total += int(cumulative)
+    return total / 1e6, modules
+
+
+def main():
+    argparser = argparse.ArgumentParser(description=__doc__)
+    argparser.add_argument("--repeat", type=int, default=7)
+    argparser.add_argument("--budget", type=float, help="budget of `import bc_jsonpath_ng`, in milliseconds")
+    args = argparser.parse_args()
+
+    startup_modules = frozenset(import_time("pass")[1])
+    header(f"Import time on top of the interpreter startup, median of {args.repeat} runs")
+
+    medians = {}
+    for label, code in SCENARIOS.items():
+        import_time(code)  # warm up the bytecode cache
+        runs = [import_time(code, startup_modules) for _ in range(args.repeat)]
+        medians[label] = statistics.median(run[0] for run in runs)
+        ply = "loads PLY" if any(module.startswith("ply") for module in runs[0][1]) else "no PLY"
+        print(f"{label:<50} {medians[label] * 1e3:10.1f} ms   {ply}")  # noqa: T201
+
+    if args.budget is not None and medians["import bc_jsonpath_ng"] * 1e3 > args.budget:
+        print(f"import bc_jsonpath_ng is over its {args.budget} ms budget")  # noqa: T201
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""
+`..key` queries on a document with and without a `DocumentIndex`, and the cost of building the index.
+"""
+from __future__ import annotations
+
+from _util import bench, header
+from bench_compiler import cloudformation
+
+from bc_jsonpath_ng.ext import parse
+from bc_jsonpath_ng.index import DocumentIndex, index_document, invalidate
+
+QUERIES = ["$..Key", "$..Type", "$..Key,Value", "$.Resources.Bucket7..Key", "$..missing"]
+
+
+def main():
+    resources = 1000
+    document = cloudformation(resources)
+    header(f"index ({resources} resources)")
+    bench("DocumentIndex()", lambda: DocumentIndex(document), number=1)
+    for query in QUERIES:
+        expression = parse(query)
+        header(f"{query} ({resources} resources)")
+        bench("find()", lambda: expression.find(document))  # noqa: B023
+        bench("find_values()", lambda: expression.find_values(document))  # noqa: B023
+        index_document(document)
+        bench("find(), indexed", lambda: expression.find(document))  # noqa: B023
+        bench("find_values(), indexed", lambda: expression.find_values(document))  # noqa: B023
+        invalidate(document)
+
+
+if __name__ == "__main__":
+    main()
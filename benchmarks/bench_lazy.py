@@ -0,0 +1,33 @@
+"""
+`bool(find())` against `exists()`, and `find()[0]` against `first()`, on a large
+CloudFormation shaped document where the first match comes early.
+"""
+from __future__ import annotations
+
+from _util import bench, header
+from bench_compiler import cloudformation
+
+from bc_jsonpath_ng.ext import parse
+
+QUERIES = [
+    "$.Resources.*.Properties.BucketName",
+    "$.Resources.*[?(@.Type == 'AWS::S3::Bucket')].Properties.Tags[*].Value",
+    "$..Key",
+    "$.Resources.*[?(@.Properties.Tags[*].Key == 'owner')]",
+]
+
+
+def main():
+    document = cloudformation(1000)
+    for query in QUERIES:
+        expression = parse(query)
+        header(f"{query} (1000 resources)")
+        bench("bool(find())", lambda: bool(expression.find(document)))  # noqa: B023
+        bench("exists()", lambda: expression.exists(document))  # noqa: B023
+        bench("find()[0]", lambda: expression.find(document)[0])  # noqa: B023
+        bench("first()", lambda: expression.first(document))  # noqa: B023
+        bench("list(ifind())", lambda: list(expression.ifind(document)))  # noqa: B023
+
+
+if __name__ == "__main__":
+    main()
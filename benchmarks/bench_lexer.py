@@ -0,0 +1,47 @@
+"""
+Tokenizing short expressions with a lexer built per call ("before") and with clones of a
+lexer built once per class ("after").
+"""
+from __future__ import annotations
+
+import logging
+from functools import partial
+
+import ply.lex
+from _util import bench, header
+
+from bc_jsonpath_ng.ext.parser import ExtendedJsonPathLexer
+from bc_jsonpath_ng.lexer import JsonPathLexer
+
+EXPRESSIONS = {
+    JsonPathLexer: "$.resource[*].aws_s3_bucket.*.versioning[0].enabled",
+    ExtendedJsonPathLexer: "$.Resources[?(@.Type == 'AWS::S3::Bucket')].Properties",
+}
+
+null_logger = logging.getLogger("bench")
+null_logger.disabled = True
+
+
+def tokenize_rebuilding_lexer(lexer, string):
+    new_lexer = ply.lex.lex(module=lexer, errorlog=null_logger)
+    new_lexer.latest_newline = 0
+    new_lexer.string_value = None
+    new_lexer.input(string)
+    return list(iter(new_lexer.token, None))
+
+
+def tokenize(lexer, string):
+    return list(lexer.tokenize(string))
+
+
+def main():
+    for lexer_class, string in EXPRESSIONS.items():
+        header(f"{lexer_class.__name__}: {string}")
+        lexer = lexer_class()
+        before = bench("before: ply.lex.lex() on every call", partial(tokenize_rebuilding_lexer, lexer, string))
+        after = bench("after: clone of the per-class lexer", partial(tokenize, lexer, string))
+        print(f"speedup: {before / after:.1f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
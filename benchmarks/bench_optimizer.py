@@ -0,0 +1,46 @@
+"""
+`find()` on parsed expressions against the same expressions after `optimize()`.
+"""
+from __future__ import annotations
+
+from _util import bench, header
+
+from bc_jsonpath_ng.ext import parse
+
+
+def nested(depth: int) -> dict:
+    document: dict = {"leaf": 1}
+    for level in reversed(range(depth)):
+        document = {f"k{level}": [document] if level % 3 == 2 else document}
+    return document
+
+
+def static_path(depth: int) -> str:
+    return "$" + "".join(f".k{level}[0]" if level % 3 == 2 else f".k{level}" for level in range(depth)) + ".leaf"
+
+
+def main():
+    for depth in (2, 5, 10, 20):
+        expression, document = parse(static_path(depth)), nested(depth)
+        header(f"{static_path(depth)[:60]} ({depth} levels)")
+        before = bench("before: parsed", lambda: expression.find(document))  # noqa: B023
+        optimized = expression.optimize()
+        after = bench("after: optimized", lambda: optimized.find(document))  # noqa: B023
+        print(f"{'per level overhead removed':<60} {(before - after) / depth * 1e6:14.2f} us")  # noqa: T201
+
+    document = {f"f{i}": i for i in range(8)}
+    expression = parse(" | ".join(f"f{i}" for i in range(8)))
+    header("f0 | f1 | ... | f7")
+    bench("before: parsed", lambda: expression.find(document))
+    optimized = expression.optimize()
+    bench("after: optimized", lambda: optimized.find(document))
+
+    expression = parse("$.price * 2 + 3 * 4")
+    header("$.price * 2 + 3 * 4")
+    bench("before: parsed", lambda: expression.find({"price": 5}))
+    optimized = expression.optimize()
+    bench("after: optimized", lambda: optimized.find({"price": 5}))
+
+
+if __name__ == "__main__":
+    main()
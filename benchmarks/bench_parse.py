@@ -0,0 +1,60 @@
+"""
+Cold and warm parse cost, with and without the per-class LALR tables.
+
+"before" rebuilds the tables on every parse, which is what `parse_token_stream` used to do.
+"""
+from __future__ import annotations
+
+import logging
+import sys
+from functools import partial
+
+import ply.yacc
+from _util import bench, header
+
+from bc_jsonpath_ng import parser as base_parser
+from bc_jsonpath_ng.ext.parser import ExtentedJsonPathParser
+from bc_jsonpath_ng.parser import IteratorToTokenStream, JsonPathParser
+
+EXPRESSION = "$.resource[*].aws_s3_bucket.*.versioning[0].enabled"
+
+null_logger = logging.getLogger("bench")
+null_logger.disabled = True
+
+
+def parse_rebuilding_tables(parser_class):
+    parser = parser_class()
+    tokens = parser.lexer_class().tokenize(EXPRESSION)
+    lr_parser = ply.yacc.yacc(
+        module=parser,
+        debug=False,
+        tabmodule="missing_parsetab",
+        write_tables=False,
+        start="jsonpath",
+        errorlog=null_logger,
+    )
+    return lr_parser.parse(lexer=IteratorToTokenStream(tokens))
+
+
+def parse_cold(parser_class):
+    base_parser._lr_parsers.clear()
+    base_parser._thread_lr_parsers.__dict__.clear()
+    sys.modules.pop(parser_class.table_module(), None)
+    return parser_class().parse(EXPRESSION)
+
+
+def parse_warm(parser_class):
+    return parser_class().parse(EXPRESSION)
+
+
+def main():
+    for parser_class in (JsonPathParser, ExtentedJsonPathParser):
+        header(parser_class.__name__)
+        bench("before: tables rebuilt on every parse", partial(parse_rebuilding_tables, parser_class))
+        bench("after: cold parse, prebuilt tables loaded", partial(parse_cold, parser_class))
+        parser_class().parse(EXPRESSION)
+        bench("after: warm parse, tables built once", partial(parse_warm, parser_class))
+
+
+if __name__ == "__main__":
+    main()
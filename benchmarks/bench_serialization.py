@@ -0,0 +1,63 @@
+"""
+Loading a compiled expression in a worker: `from_bytes` against unpickling the plain
+objects (what `pickle` did before `JSONPath.__reduce_ex__`) and against parsing again.
+"""
+from __future__ import annotations
+
+import io
+import pickle
+from functools import partial
+
+from _util import bench, header
+
+from bc_jsonpath_ng.ext.descent import ExtendedJsonPathDescentParser
+from bc_jsonpath_ng.ext.parser import ExtentedJsonPathParser
+from bc_jsonpath_ng.jsonpath import JSONPath
+from bc_jsonpath_ng.serialization import from_bytes, to_bytes
+
+EXPRESSIONS = [
+    "$.resource[*].aws_s3_bucket.*.versioning[0].enabled",
+    "$.Resources[?(@.Type == 'AWS::S3::Bucket' & @.Properties.Versioning.Status != 'Enabled')].Properties",
+    "$.spec.template.spec.containers[?(@.securityContext.privileged == true)].`sub(/-/, _)`[/name, \\image]",
+    "$.price * $.quantity + 1",
+]
+
+
+class PlainPickler(pickle.Pickler):
+    """
+    Pickles the AST nodes attribute by attribute, as `pickle` did before they reduced to `to_bytes()`.
+    """
+
+    def reducer_override(self, obj):
+        if isinstance(obj, JSONPath):
+            return object.__reduce_ex__(obj, 2)
+        return NotImplemented
+
+
+def plain_dumps(jsonpath):
+    buffer = io.BytesIO()
+    PlainPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(jsonpath)
+    return buffer.getvalue()
+
+
+def main():
+    for expression in EXPRESSIONS:
+        jsonpath = ExtentedJsonPathParser().parse(expression)
+        plain, compact = plain_dumps(jsonpath), pickle.dumps(jsonpath, protocol=pickle.HIGHEST_PROTOCOL)
+        data = to_bytes(jsonpath)
+
+        header(expression)
+        print(  # noqa: T201
+            f"{'payload size':<60} pickle {len(plain)} B, pickle with __reduce_ex__ {len(compact)} B, "
+            f"to_bytes {len(data)} B"
+        )
+        bench("before: parse again, ply backend", partial(ExtentedJsonPathParser().parse, expression))
+        bench("before: parse again, descent backend", partial(ExtendedJsonPathDescentParser().parse, expression))
+        bench("before: pickle.loads of the plain objects", partial(pickle.loads, plain))
+        bench("after: from_bytes", partial(from_bytes, data))
+        bench("after: pickle.loads, via __reduce_ex__", partial(pickle.loads, compact))
+        bench("after: to_bytes", partial(to_bytes, jsonpath))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+`sorted` with fields on a 100k items list, with the fields found once per item,
+against comparing the items field by field as before.
+"""
+from __future__ import annotations
+
+import functools
+import random
+
+from _util import bench, header
+
+from bc_jsonpath_ng.ext.parser import ExtentedJsonPathParser
+from bc_jsonpath_ng.jsonpath import DatumInContext
+
+QUERIES = [
+    "$[/price]",
+    "$[\\price]",
+    "$[/type,\\price]",
+    "$[/tags[0].key,/price]",
+    # Some items lack `rank`, compared a pair at a time
+    "$[/rank,\\price]",
+]
+
+
+def compare_fields(expressions):
+    # `SortedThis` before the fields were found once per item
+    def compare(left, right):
+        for field, reverse in expressions:
+            l_datum = field.find(DatumInContext.wrap(left))
+            r_datum = field.find(DatumInContext.wrap(right))
+            if (
+                not l_datum
+                or not r_datum
+                or len(l_datum) > 1
+                or len(r_datum) > 1
+                or l_datum[0].value == r_datum[0].value
+            ):
+                continue
+            elif l_datum[0].value < r_datum[0].value:
+                return 1 if reverse else -1
+            else:
+                return -1 if reverse else 1
+        return 0
+
+    return functools.cmp_to_key(compare)
+
+
+def main():
+    size = 100_000
+    rng = random.Random(0)  # noqa: S311
+    items = [
+        {
+            "type": rng.choice(["aws_s3_bucket", "aws_instance", "aws_vpc"]),
+            "price": rng.randrange(1000),
+            "tags": [{"key": rng.choice(["env", "team", "owner"])}],
+        }
+        for _ in range(size)
+    ]
+    for item in items[::3]:
+        item["rank"] = rng.randrange(10)
+    for query in QUERIES:
+        expression = ExtentedJsonPathParser().parse(query)
+        key = compare_fields(expression.right.expressions)
+        header(f"{query} ({size} items)")
+        bench("compared field by field", lambda: sorted(items, key=key), number=1, repeat=1)  # noqa: B023
+        bench("find()", lambda: expression.find(items), number=1, repeat=3)  # noqa: B023
+
+
+if __name__ == "__main__":
+    main()
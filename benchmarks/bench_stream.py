@@ -0,0 +1,72 @@
+"""
+Streaming matches from the JSON text against loading the document and searching it:
+time and peak memory.
+"""
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import tracemalloc
+
+from _util import bench, header
+
+from bc_jsonpath_ng import stream
+from bc_jsonpath_ng.ext.parser import ExtentedJsonPathParser
+
+QUERIES = [
+    "$.items[*].id",
+    "$.items[0:10].name",
+    "$..key",
+    "$.items[?(@.type == 'aws_s3_bucket')].id",
+]
+
+
+def loaded(expression, filename):
+    with open(filename, "rb") as f:
+        return expression.find_values(json.load(f))
+
+
+def streamed(expression, filename):
+    with open(filename, "rb") as f:
+        return list(stream.find_values(expression, f))
+
+
+def peak(fn) -> int:
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    size = 50_000
+    document = {
+        "items": [
+            {
+                "id": i,
+                "type": "aws_s3_bucket" if i % 10 == 0 else "aws_instance",
+                "name": f"resource-{i}",
+                "tags": [{"key": "env", "value": "prod"}, {"key": "team", "value": str(i % 7)}],
+            }
+            for i in range(size)
+        ]
+    }
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+        json.dump(document, f)
+    del document
+    try:
+        for query in QUERIES:
+            expression = ExtentedJsonPathParser().parse(query)
+            header(f"{query} ({size} items, {os.path.getsize(f.name) // 1024} KiB)")
+            for label, fn in (("json.load + find", loaded), ("stream", streamed)):
+                bench(label, lambda: fn(expression, f.name), number=1, repeat=3)  # noqa: B023
+                memory = peak(lambda: fn(expression, f.name)) / 1024  # noqa: B023
+                print(f"{label + ' peak memory':<60} {memory:14.0f} KiB")  # noqa: T201
+    finally:
+        os.unlink(f.name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Throughput of repeated queries on one large document: `find()` and `find_values()` on
+the nested dicts against the same on a `PathTable` of the document, and the cost of
+building the table.
+"""
+from __future__ import annotations
+
+import time
+
+from _util import bench, header
+from bench_compiler import QUERIES, cloudformation, terraform
+
+from bc_jsonpath_ng.ext import parse
+from bc_jsonpath_ng.table import PathTable
+
+
+def throughput(label: str, fn, seconds: float = 1.0) -> None:
+    count, start = 0, time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        fn()
+        count += 1
+    print(f"{label:<60} {count / (time.perf_counter() - start):14.1f} /s")  # noqa: T201
+
+
+def main():
+    resources = 2000
+    documents = {"cloudformation": cloudformation(resources), "terraform": terraform(resources)}
+    tables = {}
+    for name, document in documents.items():
+        header(f"{name} ({resources} resources)")
+        bench("PathTable()", lambda: PathTable(document), number=1)  # noqa: B023
+        tables[name] = PathTable(document)
+
+    for name, query in QUERIES:
+        expression, document, table = parse(query), documents[name], tables[name]
+        table.find_values(expression)  # Builds the lookups the query needs
+        header(f"{query[:70]} ({name})")
+        throughput("find()", lambda: expression.find(document))  # noqa: B023
+        throughput("PathTable.find()", lambda: table.find(expression))  # noqa: B023
+        throughput("find_values()", lambda: expression.find_values(document))  # noqa: B023
+        throughput("PathTable.find_values()", lambda: table.find_values(expression))  # noqa: B023
+
+
+if __name__ == "__main__":
+    main()
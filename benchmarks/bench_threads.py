@@ -0,0 +1,61 @@
+"""
+Throughput of concurrent parsing from a `ThreadPoolExecutor` with 1, 4 and 16 threads.
+
+The expressions are all distinct and the expression cache is bypassed, so every call parses.
+"new parser per call" is what the expression cache used to do on a miss, "thread-local parser"
+reuses the parser instance of the worker thread (see `bc_jsonpath_ng.cache.parser_for_thread`).
+"""
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from _util import header
+
+from bc_jsonpath_ng.cache import parser_for_thread
+from bc_jsonpath_ng.descent import JsonPathDescentParser
+from bc_jsonpath_ng.ext.parser import ExtentedJsonPathParser
+from bc_jsonpath_ng.parser import JsonPathParser
+
+EXPRESSIONS = [f"$.resource[{i}].aws_s3_bucket.*.versioning[0].enabled" for i in range(4000)]
+THREADS = (1, 4, 16)
+CHUNK = 50
+
+
+def new_parser_per_call(parser_class, expressions):
+    for expression in expressions:
+        parser_class().parse(expression)
+
+
+def thread_local_parser(parser_class, expressions):
+    for expression in expressions:
+        parser_for_thread(parser_class).parse(expression)
+
+
+def throughput(fn, parser_class, threads: int, repeat: int = 3) -> float:
+    """
+    Returns the best number of expressions parsed per second by `threads` workers.
+    """
+    chunks = [EXPRESSIONS[i : i + CHUNK] for i in range(0, len(EXPRESSIONS), CHUNK)]
+    best = float("inf")
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for future in [executor.submit(fn, parser_class, chunk) for chunk in chunks]:
+                future.result()
+            best = min(best, time.perf_counter() - start)
+    return len(EXPRESSIONS) / best
+
+
+def main():
+    for parser_class in (JsonPathParser, ExtentedJsonPathParser, JsonPathDescentParser):
+        header(f"{parser_class.__name__}, {len(EXPRESSIONS)} distinct expressions")
+        parser_class().parse(EXPRESSIONS[0])  # build the PLY tables before timing
+        for fn in (new_parser_per_call, thread_local_parser):
+            for threads in THREADS:
+                label = f"{fn.__name__.replace('_', ' ')}, {threads} threads"
+                print(f"{label:<60} {throughput(fn, parser_class, threads):14.0f} expressions/s")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
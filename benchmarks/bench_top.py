@@ -0,0 +1,41 @@
+"""
+A sorted list followed by a slice of its first items: selecting them with a heap
+against sorting the whole list.
+"""
+from __future__ import annotations
+
+import random
+
+from _util import bench, header
+
+from bc_jsonpath_ng.ext import iterable
+from bc_jsonpath_ng.ext.parser import ExtentedJsonPathParser
+
+QUERIES = [
+    "$.items[\\created][0:10]",
+    "$.items[/created][0]",
+    "$.items[/type,\\created][0:10]",
+    "$.items[\\created][0:1000]",
+]
+
+
+def main():
+    top_ratio = iterable.TOP_RATIO
+    for size in (10_000, 100_000):
+        rng = random.Random(0)  # noqa: S311
+        document = {
+            "items": [
+                {"type": rng.choice(["aws_s3_bucket", "aws_instance"]), "created": rng.randrange(10**9)}
+                for _ in range(size)
+            ]
+        }
+        for query in QUERIES:
+            expression = ExtentedJsonPathParser().parse(query)
+            header(f"{query} ({size} items)")
+            for label, ratio in (("sort", size + 1), ("heap", top_ratio)):
+                iterable.TOP_RATIO = ratio
+                bench(f"find() {label}", lambda: expression.find(document), number=1, repeat=3)  # noqa: B023
+
+
+if __name__ == "__main__":
+    main()
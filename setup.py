@@ -38,6 +38,9 @@ setuptools.setup(
         "ply",
         "decorator",
     ],
+    extras_require={
+        "numpy": ["numpy"],
+    },
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Topic :: Software Development :: Libraries :: Python Modules",
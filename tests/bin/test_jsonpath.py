@@ -47,3 +47,19 @@ class TestJsonPathScript(unittest.TestCase):
         test2 = os.path.join(os.path.dirname(__file__), "test2.json")
         main("jsonpath.py", "foo..baz", test1, test2)
         self.assertEqual(self.output.getvalue(), "1\n2\n3\n4\n")
+
+    def test_stream_mode(self):
+        test1 = os.path.join(os.path.dirname(__file__), "test1.json")
+        test2 = os.path.join(os.path.dirname(__file__), "test2.json")
+        main("jsonpath.py", "--stream", "foo..baz", test1, test2)
+        self.assertEqual(self.output.getvalue(), "1\n2\n3\n4\n")
+
+    def test_stream_mode_stdin(self):
+        self.input.write(json.dumps({"foo": [{"baz": 1}, {"baz": 2}]}))
+        self.input.seek(0)
+        main("jsonpath.py", "--stream", "foo[1].baz")
+        self.assertEqual(self.output.getvalue(), "2\n")
+
+    def test_stream_mode_rejects_expressions(self):
+        with self.assertRaises(SystemExit):
+            main("jsonpath.py", "--stream", "foo.`parent`")
@@ -0,0 +1,154 @@
+"""
+The PLY and the recursive descent parser backends must build the same AST for every expression.
+
+The expressions are all the string literals of the test suite, so every expression used by
+the other tests is covered, together with a few cases for the conflicts of the extended grammar.
+"""
+import ast
+import pathlib
+import re
+
+import pytest
+
+from bc_jsonpath_ng import parser
+from bc_jsonpath_ng.cache import expression_cache
+from bc_jsonpath_ng.descent import JsonPathDescentParser
+from bc_jsonpath_ng.exceptions import JsonPathLexerError, JsonPathParserError
+from bc_jsonpath_ng.ext import parse as ext_parse
+from bc_jsonpath_ng.ext.descent import ExtendedJsonPathDescentParser
+from bc_jsonpath_ng.ext.parser import ExtentedJsonPathParser
+from bc_jsonpath_ng.jsonpath import JSONPath
+from bc_jsonpath_ng.parser import JsonPathParser
+
+
+def suite_literals():
+    literals = set()
+    for path in pathlib.Path(__file__).parent.rglob("*.py"):
+        for node in ast.walk(ast.parse(path.read_text())):
+            if isinstance(node, ast.Constant) and isinstance(node.value, str):
+                literals.add(node.value)
+    return sorted(literals)
+
+
+GRAMMAR_CASES = [
+    # Arithmetic takes everything on its right, but nothing of a path on its left
+    "$.a + $.b.c * 2",
+    "a.b + c",
+    "a + b[0]",
+    "a + 2[0]",
+    "1 + 2.a",
+    "1 + b.a",
+    "1.5 * 2.5 - 1",
+    "a + 1 + 2 . c",
+    "a where b + c",
+    "a.* * 2",
+    # Filters: a parenthesis can hold a jsonpath or a group of expressions
+    "$[?(@.a)]",
+    "$[?(@.a) & (@.b)]",
+    "$[?(@.a > 1) & (@.b)]",
+    "$[?((@.a) > 1)]",
+    "$[?(@.a) + 1 > 2]",
+    "$[?@.a & @.b]",
+    "$[?a > 1 | b > 2 & c > 3]",
+    "$[?a > 1 || b > 2 | c > 3 && d = 'x']",
+    "$[?!a > 1 & b > 2]",
+    "$[?!(a > 1)].c",
+    "a.!b > 1.c",
+    # Sorting
+    "$.a[/b, \\c][0]",
+    "$.a[\\b.c/d]",
+    # PLY reads the token after a named operator before building it
+    "`sub(/a/,b)`a",
+    "`sub(/a/,b)`.a",
+    "`len`>",
+    "`foo`#",
+]
+
+
+def dump(node):
+    """
+    A comparable representation of an AST; not all nodes implement `__eq__`.
+    """
+    if isinstance(node, (list, tuple)):
+        return type(node).__name__, tuple(dump(item) for item in node)
+    if isinstance(node, re.Pattern):
+        return "re", node.pattern
+    if isinstance(node, JSONPath):
+        # Leaves out the functions `find_values()` and `find_paths()` compile on demand
+        items = sorted((key, value) for key, value in vars(node).items() if key != "_compiled")
+        return type(node).__name__, tuple((key, dump(value)) for key, value in items)
+    return type(node).__name__, node
+
+
+def outcome(parser_class, string):
+    try:
+        return "ok", dump(parser_class().parse(string))
+    except Exception as e:
+        return "error", e
+
+
+@pytest.mark.parametrize("string", suite_literals() + GRAMMAR_CASES)
+@pytest.mark.parametrize(
+    "ply_class,descent_class",
+    [(JsonPathParser, JsonPathDescentParser), (ExtentedJsonPathParser, ExtendedJsonPathDescentParser)],
+    ids=["base", "extended"],
+)
+def test_backends_agree(ply_class, descent_class, string):
+    expected = outcome(ply_class, string)
+    actual = outcome(descent_class, string)
+
+    if expected[0] == "ok":
+        assert actual == expected
+    elif isinstance(expected[1], AttributeError):
+        # PLY fails in `p_error` when the input ends too early
+        assert actual[0] == "error"
+        assert isinstance(actual[1], JsonPathParserError)
+    else:
+        assert actual[0] == "error"
+        assert type(actual[1]) is type(expected[1])
+
+
+@pytest.mark.parametrize(
+    "string,error",
+    [
+        ("foo.", "Parse error at end of input"),
+        ("a b", "Parse error at 1:2 near token b (ID)"),
+        ("[1:2:3]", "Parse error at 1:4 near token : (:)"),
+        ("`foo`", "Unknown named operator `foo` at 1:4"),
+    ],
+)
+def test_parse_errors(string, error):
+    with pytest.raises(JsonPathParserError, match=re.escape(error)):
+        JsonPathDescentParser().parse(string)
+
+
+def test_lexer_errors():
+    with pytest.raises(JsonPathLexerError, match="Unexpected character: #"):
+        ExtendedJsonPathDescentParser().parse("a.b#")
+    with pytest.raises(JsonPathLexerError, match="Unexpected EOF"):
+        JsonPathDescentParser().parse("a.'b")
+
+
+def test_binding_powers_follow_ply_precedence():
+    levels = [JsonPathDescentParser.binary_operators.get(token, (None,))[0] for _, token in JsonPathParser.precedence]
+    levels = [level for level in levels if level is not None]
+    assert levels == sorted(levels)
+
+
+def test_backend_selection():
+    expression_cache.clear()
+    assert parser.get_default_backend() == "ply"
+    parser.parse("foo.bar", backend="descent")
+    ext_parse("foo.bar", backend="descent")
+    assert expression_cache.invalidate(grammar=JsonPathDescentParser) == 1
+    assert expression_cache.invalidate(grammar=ExtendedJsonPathDescentParser) == 1
+
+    parser.set_default_backend("descent")
+    try:
+        parser.parse("foo.bar")
+        assert expression_cache.invalidate(grammar=JsonPathDescentParser) == 1
+    finally:
+        parser.set_default_backend("ply")
+
+    with pytest.raises(ValueError):
+        parser.parse("foo", backend="yacc")
@@ -0,0 +1,108 @@
+import pytest
+
+import bc_jsonpath_ng
+from bc_jsonpath_ng.bulk import ParseResult, grammar_for, normalize, parse_many
+from bc_jsonpath_ng.cache import expression_cache
+from bc_jsonpath_ng.descent import JsonPathDescentParser
+from bc_jsonpath_ng.exceptions import JsonPathLexerError, JsonPathParserError
+from bc_jsonpath_ng.ext import parse as ext_parse
+from bc_jsonpath_ng.ext.descent import ExtendedJsonPathDescentParser
+from bc_jsonpath_ng.ext.parser import ExtentedJsonPathParser
+from bc_jsonpath_ng.parser import JsonPathParser
+from bc_jsonpath_ng.parser import parse as base_parse
+from tests.test_backends import dump, suite_literals
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    expression_cache.clear()
+    yield
+    expression_cache.clear()
+
+
+@pytest.mark.parametrize(
+    "string,expected",
+    [
+        ("$.a.b", "$.a.b"),
+        ("  $.a  .\tb \n", "$.a . b"),
+        ("$[?(@.a == 'x  y')]", "$[?(@.a == 'x  y')]"),
+        ("$['a  \\'  b'  ,  \"c  d\"]", "$['a  \\'  b' , \"c  d\"]"),
+        ("a.`sub(/a  b/, c)`   .d", "a.`sub(/a  b/, c)` .d"),
+        ("a.'unterminated  ", "a.'unterminated  "),
+    ],
+)
+def test_normalize(string, expected):
+    assert normalize(string) == expected
+
+
+@pytest.mark.parametrize("string", suite_literals())
+def test_normalize_keeps_the_meaning(string):
+    def outcome(string):
+        try:
+            return dump(ExtendedJsonPathDescentParser().parse(string))
+        except Exception as e:
+            return type(e)
+
+    assert outcome(normalize(string)) == outcome(string)
+
+
+def test_grammar_for():
+    assert grammar_for(extended=False, backend="ply") is JsonPathParser
+    assert grammar_for(extended=True, backend="ply") is ExtentedJsonPathParser
+    assert grammar_for(extended=False, backend="descent") is JsonPathDescentParser
+    assert grammar_for(extended=True, backend="descent") is ExtendedJsonPathDescentParser
+
+
+@pytest.mark.parametrize("processes", [None, 2])
+def test_parse_many(processes):
+    strings = ["$.a .b", "$.a  .b", "foo[*]", "$[?(@.a > 1)]", "\t$.a\n.b ", "foo[*]"]
+
+    results = parse_many(strings, processes=processes)
+
+    assert [result.error for result in results] == [None] * len(strings)
+    # Strings which only differ by their whitespace share one AST
+    assert results[0].expression is results[1].expression is results[4].expression
+    assert results[2].expression is results[5].expression
+    assert expression_cache.cache_info().currsize == 3
+    assert [str(result.expression) for result in results] == [str(ext_parse(string)) for string in strings]
+
+
+def test_parse_many_reuses_cached_expressions():
+    cached = expression_cache.parse(ExtentedJsonPathParser, "$.a .b")
+    expression_cache.clear()
+    expression_cache.put(ExtentedJsonPathParser, "$.a .b", cached)
+
+    (result,) = parse_many(["$.a   .b"])
+
+    assert result.expression is cached
+    assert expression_cache.cache_info().hits == 1
+
+
+@pytest.mark.parametrize("processes", [None, 2])
+def test_parse_many_errors_per_item(processes):
+    strings = ["$.a", "a  b", "a.b#", "a b", "$.b"]
+
+    results = parse_many(strings, extended=False, processes=processes)
+
+    assert str(results[0].expression) == "$.a"
+    assert str(results[4].expression) == "$.b"
+    # The errors point into the original strings, not the normalized ones
+    assert isinstance(results[1].error, JsonPathParserError)
+    assert "1:3" in str(results[1].error)
+    assert "1:2" in str(results[3].error)
+    assert isinstance(results[2].error, JsonPathLexerError)
+    assert results[1].expression is results[2].expression is results[3].expression is None
+    with pytest.raises(JsonPathParserError, match="1:3"):
+        base_parse("a  b")
+
+
+def test_parse_many_base_grammar_and_backend():
+    results = parse_many(["$.a[0]", "$.a[?(@.b)]"], extended=False, backend="descent")
+
+    assert results[0] == ParseResult(results[0].expression, None)
+    assert isinstance(results[1].error, JsonPathLexerError)
+    assert expression_cache.invalidate(grammar=JsonPathDescentParser) == 1
+
+
+def test_lazy_export():
+    assert bc_jsonpath_ng.parse_many is parse_many
@@ -0,0 +1,103 @@
+import threading
+
+import pytest
+
+from bc_jsonpath_ng import parse
+from bc_jsonpath_ng.cache import ExpressionCache, expression_cache
+from bc_jsonpath_ng.exceptions import JsonPathParserError
+from bc_jsonpath_ng.ext import parse as ext_parse
+from bc_jsonpath_ng.ext.parser import ExtentedJsonPathParser
+from bc_jsonpath_ng.jsonpath import Child, Fields
+from bc_jsonpath_ng.parser import JsonPathParser
+
+
+@pytest.fixture
+def cache():
+    return ExpressionCache(maxsize=2)
+
+
+def test_hit_returns_same_ast(cache):
+    first = cache.parse(JsonPathParser, "foo.bar")
+    second = cache.parse(JsonPathParser, "foo.bar")
+
+    assert first is second
+    assert first == Child(Fields("foo"), Fields("bar"))
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+    assert info.compile_time_saved > 0
+
+
+def test_grammars_do_not_share_entries(cache):
+    base = cache.parse(JsonPathParser, "foo")
+    extended = cache.parse(ExtentedJsonPathParser, "foo")
+
+    assert base is not extended
+    assert cache.cache_info().misses == 2
+
+
+def test_lru_eviction(cache):
+    cache.parse(JsonPathParser, "a")
+    cache.parse(JsonPathParser, "b")
+    cache.parse(JsonPathParser, "a")  # "b" is now the least recently used
+    cache.parse(JsonPathParser, "c")
+
+    assert cache.cache_info().evictions == 1
+    assert cache.invalidate("b") == 0
+    assert cache.invalidate("a") == 1
+
+
+def test_resize_evicts(cache):
+    cache.parse(JsonPathParser, "a")
+    cache.parse(JsonPathParser, "b")
+    cache.maxsize = 1
+
+    assert len(cache) == 1
+    assert cache.cache_info().evictions == 1
+
+
+def test_invalidate_by_grammar(cache):
+    cache.parse(JsonPathParser, "a")
+    cache.parse(ExtentedJsonPathParser, "a")
+
+    assert cache.invalidate(grammar=ExtentedJsonPathParser) == 1
+    assert cache.invalidate() == 1
+    assert len(cache) == 0
+
+
+def test_disabled_cache():
+    cache = ExpressionCache(maxsize=0)
+    assert cache.parse(JsonPathParser, "a") is not cache.parse(JsonPathParser, "a")
+    assert len(cache) == 0
+
+
+def test_errors_are_not_cached(cache):
+    for _ in range(2):
+        with pytest.raises(JsonPathParserError):
+            cache.parse(JsonPathParser, "foo.`grandparent`")
+    assert cache.cache_info().misses == 2
+    assert len(cache) == 0
+
+
+def test_concurrent_misses(cache):
+    cache.maxsize = None
+    results = []
+
+    def worker():
+        results.append(cache.parse(ExtentedJsonPathParser, "$.foo[?(@.bar > 1)]"))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(cache) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_module_level_parse_uses_cache():
+    expression_cache.clear()
+    assert parse("foo.baz") is parse("foo.baz")
+    assert ext_parse("foo.baz") is ext_parse("foo.baz")
+    assert ext_parse("foo.baz") is not parse("foo.baz")
+    assert expression_cache.cache_info().hits == 4
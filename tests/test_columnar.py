@@ -0,0 +1,168 @@
+"""
+Filters tested a column at a time must find the same matches as item by item.
+"""
+import pytest
+
+from bc_jsonpath_ng.ext import columnar
+from bc_jsonpath_ng.ext.arithmetic import OPERATOR_MAP, Operation
+from bc_jsonpath_ng.ext import filter as filter_
+from bc_jsonpath_ng.ext.parser import ExtentedJsonPathParser
+from bc_jsonpath_ng.jsonpath import Child, Fields, This
+from tests.test_backends import dump
+
+ITEMS = [
+    {"a": 1},
+    {"a": "1"},
+    {"a": "12"},
+    {"a": "x"},
+    {"a": True},
+    {"a": 2.5},
+    {"a": -(2**70)},
+    {"a": {"b": [{"c": "foo"}]}},
+    {"b": 2},
+    {},
+]
+MIXED = {"items": ITEMS * 150 + [[], "a", 3, None]}
+NUMBERS = {"items": [{"a": i % 7, "b": i / 4, "c": f"x{i % 3}", "d": [{"e": i % 2}]} for i in range(3000)]}
+
+QUERIES = [
+    "$.items[?(@.a)]",
+    "$.items[?(@.a == 1)]",
+    "$.items[?(@.a > 1)]",
+    "$.items[?(@.a != 'x')]",
+    "$.items[?(@.a == true)]",
+    "$.items[?(@.a =~ '^1')]",
+    "$.items[?(@.a == 2.5)]",
+    "$.items[?(@.a.b[0].c == 'foo')]",
+    "$.items[?(@.b >= 2 & @.a)]",
+    "$.items[?(!(@.a == 1))]",
+    "$.items[?(@.a < 3 & @.b > 100.0)]",
+    "$.items[?(@.c == 'x1' & @.d[0].e == 1)]",
+    "$.items[?(@.a == 9223372036854775808)]",
+    "$.items[?(@.b > 0.5)]",
+    "$.items[?(@.a == 1 | @.b == 2)]",
+]
+
+
+def matches(found):
+    return [(match.value, str(match.full_path), dump(match.path)) for match in found]
+
+
+def outcome(fn):
+    try:
+        return fn()
+    except Exception as e:
+        return type(e)
+
+
+@pytest.mark.parametrize("data", [MIXED, NUMBERS], ids=["mixed", "numbers"])
+@pytest.mark.parametrize("query", QUERIES)
+def test_same_matches(monkeypatch, query, data):
+    expression = ExtentedJsonPathParser().parse(query)
+
+    monkeypatch.setattr(filter_, "COLUMNAR_MIN_ITEMS", 10**9)
+    expected = outcome(lambda: matches(expression.find(data)))
+    expected_values = outcome(lambda: expression.find_values(data))
+    monkeypatch.setattr(filter_, "COLUMNAR_MIN_ITEMS", 0)
+
+    assert outcome(lambda: matches(expression.find(data))) == expected
+    assert outcome(lambda: expression.find_values(data)) == expected_values
+
+
+def test_matching_rows():
+    expression = ExtentedJsonPathParser().parse("$[?(@.a > 1 & @.b)]")
+    items = [{"a": 2, "b": 1}, {"a": 0, "b": 1}, {"a": "3"}, {"a": "5", "b": 0}, {"b": 1}]
+
+    assert columnar.matching_rows(expression.right, items) == [0, 3]
+    assert columnar.matching_rows(ExtentedJsonPathParser().parse("$[?(@.a[*] > 1)]").right, items) is None
+
+
+def test_column():
+    items = [{"a": [1]}, {"a": []}, {"b": 1}, {"a": [2, 3]}]
+
+    assert columnar.column(items, [(False, "a"), (True, 0)]) == ([0, 3], [1, 2])
+    assert columnar.column(items, [(False, "a")], rows=[1, 2]) == ([1], [[]])
+
+
+def test_auto_id_is_item_by_item(monkeypatch):
+    monkeypatch.setattr(filter_._jsonpath, "auto_id_field", "id")
+
+    expression = filter_.Filter([filter_.Expression(Child(This(), Fields("a")), "==", 1)])
+
+    assert columnar.matching_rows(expression, [{"a": 1}]) is None
+
+
+def test_numpy_columns():
+    pytest.importorskip("numpy")
+    items = [{"a": i} for i in range(2000)]
+
+    assert columnar.matching_rows(ExtentedJsonPathParser().parse("$[?(@.a >= 1998)]").right, items) == [1998, 1999]
+
+
+def reference_operation(op, left, right):
+    # `Operation.find()` before the columns
+    result = []
+    for left_value, right_value in zip(left, right):
+        try:
+            result.append(op(left_value, right_value))
+        except TypeError:
+            return []
+    return result
+
+
+COLUMNS = [
+    [1, 2, 3] * 500,
+    [1.5, -2.0, 0.25] * 500,
+    [2**62, 3, -5] * 500,
+    [2**70, 1, 0] * 500,
+    [True, False, True] * 500,
+    [1, 2.5, 3] * 500,
+    [1, "a", 3] * 500,
+    ["a", "b", "c"] * 500,
+    [0, 0.0, 1] * 500,
+]
+
+
+@pytest.mark.parametrize("op", ["+", "-", "*", "/"])
+@pytest.mark.parametrize("left", COLUMNS)
+@pytest.mark.parametrize("right", COLUMNS)
+def test_apply(monkeypatch, op, left, right):
+    monkeypatch.setattr(filter_, "COLUMNAR_MIN_ITEMS", 0)
+    function = OPERATOR_MAP[op]
+
+    def apply():
+        try:
+            return columnar.apply(function, left, right)
+        except TypeError:
+            return []
+
+    assert outcome(apply) == outcome(lambda: reference_operation(function, left, right))
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("$.a[*].x * $.a[*].y", [0, 4, 10]),
+        ("$.a[*].x + 1", [1, 2, 3]),
+        ("$.a[*].y - $.a[*].z", []),
+        ("$.a[*].x * $.b", []),
+    ],
+)
+def test_operation(query, expected):
+    data = {"a": [{"x": i, "y": i + 3, "z": "s"} for i in range(3)], "b": [1]}
+    expression = ExtentedJsonPathParser().parse(query)
+
+    assert [match.value for match in expression.find(data)] == expected
+    assert [match.value for match in expression.ifind(data)] == expected
+    assert expression.find_values(data) == expected
+
+
+def test_division():
+    # `/` is a sort direction for the parser
+    expression = Operation(ExtentedJsonPathParser().parse("$.a[*]"), "/", ExtentedJsonPathParser().parse("$.b[*]"))
+
+    assert [match.value for match in expression.find({"a": [0, 1, 2], "b": [3, 4, 5]})] == [0.0, 1 / 4, 2 / 5]
+    with pytest.raises(ZeroDivisionError):
+        expression.find({"a": [1, 2, "x"], "b": [1, 0, 1]})
+    # The `TypeError` comes first
+    assert expression.find({"a": [1, "x", 2], "b": [1, 1, 0]}) == []
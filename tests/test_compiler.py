@@ -0,0 +1,200 @@
+"""
+A compiled expression must return the same matches as `find()`: same values, and
+with `paths=True` the same paths and contexts. The queries are the cases of
+`test_optimizer`, parsed and optimized.
+"""
+import pickle
+
+import pytest
+
+from bc_jsonpath_ng.compiler import compile_expression
+from bc_jsonpath_ng.ext.descent import ExtendedJsonPathDescentParser
+from bc_jsonpath_ng.ext.filter import Filter
+from bc_jsonpath_ng.jsonpath import Child, DatumInContext, Fields, Index, JSONPath, Parent, Root
+from tests.test_backends import dump
+from tests.test_optimizer import CASES, auto_id_field  # noqa: F401
+
+
+def matches(found):
+    return [(match.value, str(match.full_path), dump(match.path), dump(match.context)) for match in found]
+
+
+def outcome(fn):
+    try:
+        return fn()
+    except Exception as e:
+        return type(e)
+
+
+def expressions():
+    for query, data in CASES:
+        try:
+            expression = ExtendedJsonPathDescentParser().parse(query)
+        except Exception:  # noqa: S112
+            continue
+        yield query, expression, data
+        yield query, expression.optimize(), data
+
+
+def test_same_matches(auto_id_field):  # noqa: F811
+    checked = 0
+    for query, expression, data in expressions():
+        expected = outcome(lambda: [match.value for match in expression.find(data)])  # noqa: B023
+        assert outcome(lambda: expression.compile()(data)) == expected, query  # noqa: B023
+
+        expected = outcome(lambda: matches(expression.find(data)))  # noqa: B023
+        assert outcome(lambda: matches(expression.compile(paths=True)(data))) == expected, query  # noqa: B023
+        checked += 1
+    assert checked > 1000
+
+
+def keys(path):
+    if isinstance(path, Child):
+        left, right = keys(path.left), keys(path.right)
+        return right if isinstance(path.right, Root) else left + right
+    if isinstance(path, Fields):
+        return path.fields
+    if isinstance(path, Index):
+        return (path.index,)
+    if isinstance(path, str):
+        return (path,)
+    return ()
+
+
+def test_find_values_and_paths(auto_id_field):  # noqa: F811
+    for query, expression, data in expressions():
+        expected = outcome(lambda: [match.value for match in expression.find(data)])  # noqa: B023
+        assert outcome(lambda: expression.find_values(data)) == expected, query  # noqa: B023
+
+        # `find_paths()` gives `()` to the None match of the `parent` of the document
+        expected = outcome(
+            lambda: [keys(match.full_path) if match is not None else () for match in expression.find(data)]  # noqa: B023
+        )
+        assert outcome(lambda: expression.find_paths(data)) == expected, query  # noqa: B023
+
+
+def test_find_values_keeps_the_expression_picklable():
+    expression = Child(Root(), Custom())
+    expression.find_values({})
+
+    assert pickle.loads(pickle.dumps(expression)).find_values({}) == [1]  # noqa: S301
+
+
+@pytest.mark.parametrize(
+    "query,data,expected",
+    [
+        (
+            "$.Resources.*.Properties.Tags[*].Key",
+            {"Resources": {"a": {"Properties": {"Tags": [{"Key": "k"}]}}}},
+            [("Resources", "a", "Properties", "Tags", 0, "Key")],
+        ),
+        ("$..b", {"a": [{"b": 1}], "b": 2}, [("b",), ("a", 0, "b")]),
+        ("$.a.`len`", {"a": [1]}, [()]),
+        ("$.a.b.`parent`", {"a": {"b": 1}}, [("a",)]),
+    ],
+)
+def test_find_paths(query, data, expected):
+    assert ExtendedJsonPathDescentParser().parse(query).find_paths(data) == expected
+
+
+@pytest.mark.parametrize(
+    "query,data,expected",
+    [
+        ("$.Resources.*.Properties.Tags[*].Key", {"Resources": {"a": {"Properties": {"Tags": [{"Key": "k"}]}}}}, ["k"]),
+        ("$..Type", {"a": {"Type": 1, "b": [{"Type": 2}]}}, [1, 2]),
+        ("$.a[?(@.b > 1)].b", {"a": [{"b": 1}, {"b": 2}, {"b": 3}]}, [2, 3]),
+        ("$.a[?(@.b > 1)].b", {"a": {"b": 2}}, [2]),
+        ("$.a[?(!(@.b > 1))].b", {"a": [{"b": 1}, {"b": 2}]}, [1]),
+        ("$.a[*]", {"a": "foo"}, ["foo"]),
+        ("$.a.`len`", {"a": [1, 2]}, [2]),
+        ("$.a * 2", {"a": 3}, [6]),
+        ("$.a.b.`parent`.c", {"a": {"b": 1, "c": 2}}, [2]),
+    ],
+)
+def test_values(query, data, expected):
+    expression = ExtendedJsonPathDescentParser().parse(query)
+
+    assert expression.compile()(data) == expected
+    assert expression.compile(paths=True)(data) == expression.find(data)
+
+
+class Custom(JSONPath):
+    def find(self, datum):
+        return [DatumInContext(1, path=self, context=DatumInContext.wrap(datum))]
+
+
+@pytest.mark.parametrize(
+    "expression,data",
+    [
+        # Unknown nodes
+        (Child(Root(), Custom()), {}),
+        # A filter without expressions returns its input as is
+        (Filter([]), [1]),
+        # `parent` of the root matches None
+        (Child(Root(), Parent()), {}),
+        # Matches of a `DatumInContext`
+        (Fields("a"), DatumInContext({"a": 1}, path=Fields("b"))),
+    ],
+)
+def test_falls_back_to_find(expression, data):
+    assert outcome(lambda: compile_expression(expression, paths=True)(data)) == outcome(lambda: expression.find(data))
+
+
+def test_filters_do_not_change_the_document():
+    data = {"a": {"b": 2}}
+
+    assert ExtendedJsonPathDescentParser().parse("$.a[?(@.b > 1)]").compile()(data) == [{"b": 2}]
+    assert data == {"a": {"b": 2}}
+
+
+# The first value of each row matches `== 1`, the later ones cannot be compared to a number
+MIXED_ROWS = [
+    {"c": 1.5, "b": [1, 2], "a": "abc"},
+    {"a": 1, "b": {"x": 1}},
+    {"a": "1", "b": None},
+    {"a": 0},
+]
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "$[?(@.* == 1)]",
+        "$[?(@.* > 0)]",
+        "$[?(@.a == 1 & @.* == 1)]",
+        "$[?(!(@.* == 1))]",
+        "$[?(@.* == 1 | @.a =~ 'x')]",
+    ],
+)
+def test_filters_on_mixed_rows(query):
+    # The compiled filter stops at the first match of an expression as `find()` does, a
+    # later value which cannot be compared must not raise
+    expression = ExtendedJsonPathDescentParser().parse(query)
+    expected = outcome(lambda: matches(expression.find(MIXED_ROWS)))
+
+    assert outcome(lambda: matches(expression.compile(paths=True)(MIXED_ROWS))) == expected
+    assert outcome(lambda: expression.find_values(MIXED_ROWS)) == outcome(
+        lambda: [match.value for match in expression.find(MIXED_ROWS)]
+    )
+    assert outcome(lambda: expression.find_paths(MIXED_ROWS)) == outcome(
+        lambda: [keys(match.full_path) for match in expression.find(MIXED_ROWS)]
+    )
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "$.*[*] where (b[?(@.x > 1)])",
+        "$.*[*] where (b[*][?(@.x > 1)])",
+        "$.*[*] where (b[?(@.x > 1)] | c)",
+    ],
+)
+def test_where_stops_at_the_first_match(query):
+    # The first item of `b` matches, the next one cannot be compared to a number
+    data = {"a": [{"b": [{"x": 2}, {"x": {}}]}, {"b": [{"x": 0}]}]}
+    expression = ExtendedJsonPathDescentParser().parse(query)
+    expected = outcome(lambda: matches(expression.find(data)))
+
+    assert expected != TypeError
+    assert outcome(lambda: matches(expression.compile(paths=True)(data))) == expected
+    assert outcome(lambda: expression.compile()(data)) == [match.value for match in expression.find(data)]
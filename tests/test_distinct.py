@@ -0,0 +1,92 @@
+"""
+`find_distinct()` must return the matches of `find()` without their repeats: the first
+match of each node, in the same order.
+"""
+import pytest
+
+from bc_jsonpath_ng.distinct import node_key
+from bc_jsonpath_ng.ext.descent import ExtendedJsonPathDescentParser
+from tests.test_backends import dump
+from tests.test_optimizer import CASES, auto_id_field  # noqa: F401
+
+
+def matches(found):
+    return [(match.value, str(match.full_path), dump(match.path), dump(match.context)) for match in found]
+
+
+def distinct(found):
+    seen = set()
+    for match in found:
+        key = node_key(match)
+        if key is None or key not in seen:
+            seen.add(key)
+            yield match
+
+
+def outcome(fn):
+    try:
+        return fn()
+    except Exception as e:
+        return type(e)
+
+
+def test_same_matches(auto_id_field):  # noqa: F811
+    checked = 0
+    for query, data in CASES:
+        try:
+            expression = ExtendedJsonPathDescentParser().parse(query)
+        except Exception:  # noqa: S112
+            continue
+        for expression in (expression, expression.optimize()):  # noqa: B020
+            expected = outcome(lambda: matches(distinct(expression.find(data))))  # noqa: B023
+            assert outcome(lambda: matches(expression.find_distinct(data))) == expected, query  # noqa: B023
+            checked += 1
+    assert checked > 1000
+
+
+def nested(depth):
+    # `a` in `a` in `a`..., each with a `b`
+    data = leaf = {}
+    for i in range(depth):
+        leaf["b"] = i
+        leaf["a"] = leaf = {}
+    return data
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("$..a..b", list(range(1, 6))),
+        ("$..a..a..b", list(range(2, 6))),
+        ("$..b | $..b", list(range(6))),
+        ("$..a[?(@.b > 3)].b", [4, 5]),
+    ],
+)
+def test_no_repeats(query, expected):
+    expression = ExtendedJsonPathDescentParser().parse(query)
+
+    assert [match.value for match in expression.find_distinct(nested(6))] == expected
+    assert len(expression.find(nested(6))) >= len(expected)
+
+
+@pytest.mark.parametrize(
+    "query,data",
+    [
+        ("$.`parent` | $[*]", [1, 2]),
+        ("$.`parent` | $.`parent` | $.*", {"a": 1}),
+        ("@.`parent` | $.*", {"a": 1}),
+    ],
+)
+def test_parent_of_the_document(query, data):
+    # `Parent.find()` of the document returns [None], which is not a node of the document
+    expression = ExtendedJsonPathDescentParser().parse(query)
+
+    assert expression.find_distinct(data) == expression.find(data)
+
+
+def test_nested_descendants_do_not_blow_up():
+    # `find()` matches the deepest `b` once per `a` above it, for every `..a`
+    expression = ExtendedJsonPathDescentParser().parse("$..a..a..a..b")
+
+    assert len(expression.find(nested(30))) == 27405
+    assert [match.value for match in expression.find_distinct(nested(30))] == list(range(3, 30))
@@ -0,0 +1,103 @@
+"""
+`ExpressionSet.find()` must find, for each expression, the same matches as its own
+`find()`: same values, same paths and same contexts, in the same order.
+"""
+import pytest
+
+from bc_jsonpath_ng.expression_set import ExpressionSet
+from bc_jsonpath_ng.ext.descent import ExtendedJsonPathDescentParser
+from bc_jsonpath_ng.jsonpath import Child, DatumInContext, Fields, JSONPath
+from bc_jsonpath_ng.optimizer import optimize
+from tests.test_backends import dump
+from tests.test_optimizer import CASES, auto_id_field  # noqa: F401
+
+
+def matches(found):
+    return [(match.value, str(match.full_path), dump(match.path), dump(match.context)) for match in found]
+
+
+def outcome(expression, data):
+    try:
+        return matches(expression.find(data))
+    except Exception as e:
+        return type(e)
+
+
+def expressions_by_document():
+    queries = {}
+    for query, data in CASES:
+        try:
+            expression = ExtendedJsonPathDescentParser().parse(query)
+        except Exception:  # noqa: S112
+            continue
+        queries.setdefault(repr(data), (data, []))[1].append(expression)
+    return list(queries.values())
+
+
+def test_same_matches(auto_id_field):  # noqa: F811
+    checked = 0
+    for data, expressions in expressions_by_document():
+        expected = [outcome(expression, data) for expression in expressions]
+        # An expression raising makes the whole set raise, leave them out
+        expressions = [expression for expression, result in zip(expressions, expected) if isinstance(result, list)]
+        expected = [result for result in expected if isinstance(result, list)]
+        for candidates in (expressions, [optimize(expression) for expression in expressions]):
+            found = ExpressionSet(candidates).find(data)
+            assert [matches(result) for result in found] == expected
+        checked += len(expressions)
+    assert checked > 500
+
+
+def test_shared_prefixes_and_descendants():
+    parse = ExtendedJsonPathDescentParser().parse
+    expressions = [parse(query) for query in ("$.a.b", "$.a.c", "$.a", "$..b", "$..c[0]", "$..b", "$.a..*")]
+    data = {"a": {"b": 1, "c": [2, {"b": 3}]}}
+
+    found = ExpressionSet(expressions).find(data)
+
+    assert [[match.value for match in result] for result in found] == [
+        [expression.value for expression in expression.find(data)] for expression in expressions
+    ]
+    assert [[str(match.full_path) for match in result] for result in found] == [
+        ["a.b"],
+        ["a.c"],
+        ["a"],
+        ["a.b", "a.c.[1].b"],
+        ["a.c.[0]"],
+        ["a.b", "a.c.[1].b"],
+        ["a.b", "a.c", "a.c.[1].b"],
+    ]
+    # Same expressions, separate results
+    assert found[3] is not found[5]
+
+
+def test_filters_do_not_change_the_input_of_other_expressions():
+    parse = ExtendedJsonPathDescentParser().parse
+    # A filter wraps a dict it is given into a list
+    expressions = [parse("$.a[?(@.b == 1)]"), parse("$.a.b"), parse("$.a[?(@.b == 2)]"), parse("$.a")]
+    data = {"a": {"b": 1}}
+
+    found = ExpressionSet(expressions).find(data)
+
+    assert [[match.value for match in result] for result in found] == [[{"b": 1}], [1], [], [{"b": 1}]]
+    assert data == {"a": {"b": 1}}
+
+
+class Failing(JSONPath):
+    def find(self, datum):
+        raise ValueError("failing")
+
+
+def test_errors_are_raised():
+    expressions = [Fields("a"), Child(Fields("a"), Failing())]
+
+    with pytest.raises(ValueError, match="failing"):
+        ExpressionSet(expressions).find({"a": 1})
+
+
+def test_data_in_context():
+    expression = ExtendedJsonPathDescentParser().parse("b..c")
+    datum = DatumInContext({"b": {"c": 1}}, path=ExtendedJsonPathDescentParser().parse("a"))
+
+    assert matches(ExpressionSet([expression]).find(datum)[0]) == matches(expression.find(datum))
+    assert len(ExpressionSet([expression, expression])) == 2
@@ -0,0 +1,228 @@
+"""
+The predicates compiled from filter expressions must agree with `exists()`.
+"""
+import re
+import threading
+
+import pytest
+
+from bc_jsonpath_ng.ext import filter as filter_
+from bc_jsonpath_ng.ext import parse
+from bc_jsonpath_ng.ext.parser import ExtentedJsonPathParser
+from bc_jsonpath_ng.ext.filter import Expression, predicate, static_keys, statistics, value_matcher
+from bc_jsonpath_ng.jsonpath import Child, Fields, Index, Root, This
+
+ITEMS = [
+    {"a": 1},
+    {"a": "1"},
+    {"a": "x"},
+    {"a": True},
+    {"a": None},
+    {"a": [1, 2]},
+    {"a": {"b": [{"c": "foo"}]}},
+    {"b": 2},
+    {},
+    [],
+    "a",
+    3,
+    None,
+]
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        Expression(Child(This(), Fields("a")), None, None),
+        Expression(Child(This(), Fields("a")), "==", 1),
+        Expression(Child(This(), Fields("a")), ">", 0),
+        Expression(Child(This(), Fields("a")), "!=", "x"),
+        Expression(Child(This(), Fields("a")), "==", True),
+        Expression(Child(This(), Fields("a")), "=~", "^f"),
+        Expression(Child(Child(Fields("a"), Fields("b")), Index(0)), None, None),
+        Expression(Child(Root(), Child(Fields("a"), Index(1))), "==", 2),
+        Expression(Child(This(), Fields("*")), "==", 2),
+        Expression(Child(Fields("a"), Fields("b")), "==", "foo"),
+    ],
+    ids=str,
+)
+def test_predicate_is_exists(expression):
+    for item in ITEMS:
+        try:
+            expected = expression.exists(item)
+        except Exception as e:
+            with pytest.raises(type(e)):
+                predicate(expression)(item)
+        else:
+            assert predicate(expression)(item) is expected, item
+
+
+def test_predicate_is_built_once():
+    expression = Expression(Child(This(), Fields("a")), "==", 1)
+
+    assert predicate(expression) is predicate(expression)
+
+
+@pytest.mark.parametrize(
+    "target,keys",
+    [
+        (Child(This(), Fields("a")), [(False, "a")]),
+        (Child(Child(Fields("a"), Index(0)), Fields("b")), [(False, "a"), (True, 0), (False, "b")]),
+        (Child(This(), Fields("a", "b")), None),
+        (Child(This(), Fields("*")), None),
+        (Child(Fields("a"), Root()), None),
+        (Index(-1), None),
+    ],
+)
+def test_static_keys(target, keys):
+    assert static_keys(target) == keys
+
+
+def test_regex_is_compiled_once(monkeypatch):
+    matches = value_matcher("=~", "^ab+c$")
+
+    def no_regex(*args):
+        raise AssertionError("compiled again")
+
+    monkeypatch.setattr(re, "search", no_regex)
+    monkeypatch.setattr(re, "compile", no_regex)
+
+    assert [matches(value) for value in ["abbc", "ac", "xabc"]] == [True, False, False]
+
+
+def test_invalid_regex_is_raised_when_used():
+    expression = parse("$.a[?(@.b =~ '(')]")
+
+    assert expression.find({"a": []}) == []
+    with pytest.raises(re.error):
+        expression.find({"a": [{"b": "x"}]})
+
+
+def test_or_stops_at_the_first_match():
+    class Untouchable(dict):
+        def get(self, *args):
+            raise AssertionError("looked at")
+
+    data = {"a": [{"b": 1, "c": Untouchable()}]}
+
+    assert parse("$.a[?(@.b == 1 | @.c.d == 2)]").find_values(data) == data["a"]
+    assert [match.value for match in parse("$.a[?(@.b == 1 | @.c.d == 2)]").find(data)] == data["a"]
+
+
+def test_update():
+    data = {"a": [{"b": 1}, {"b": 2}, {"c": 3}]}
+
+    parse("$.a[?(@.b > 1)]").update(data, "x")
+
+    assert data == {"a": [{"b": 1}, "x", {"c": 3}]}
+
+
+SKEWED = {"a": [{"name": f"item{i}", "type": "bucket" if i % 50 == 0 else "queue", "size": i % 7} for i in range(2000)]}
+
+
+@pytest.mark.parametrize(
+    "query,test",
+    [
+        (
+            "$.a[?(@.name =~ 'item' & @.size > 0 & @.type == 'bucket')]",
+            lambda item: item["size"] > 0 and item["type"] == "bucket",
+        ),
+        ("$.a[?(!(@.name =~ 'item' & @.type == 'bucket'))]", lambda item: item["type"] != "bucket"),
+        (
+            "$.a[?(@.name =~ 'x' | @.size == 9 | @.type == 'bucket')]",
+            lambda item: item["type"] == "bucket",
+        ),
+    ],
+)
+def test_reordering_keeps_the_matches(query, test):
+    expression = ExtentedJsonPathParser().parse(query)
+    expected = [item for item in SKEWED["a"] if test(item)]
+
+    for _ in range(3):
+        assert [match.value for match in expression.find(SKEWED)] == expected
+        assert expression.find_values(SKEWED) == expected
+
+
+def test_selective_expressions_move_first(monkeypatch):
+    monkeypatch.setattr(filter_, "COLUMNAR_MIN_ITEMS", len(SKEWED["a"]) + 1)
+    expression = ExtentedJsonPathParser().parse("$.a[?(@.name != 'x' & @.size != 'x' & @.type == 'bucket')]")
+    expression.find(SKEWED)
+
+    found = expression.right.statistics()
+
+    assert [statistics.expression for statistics in found] == expression.right.expressions
+    assert found[2].position == 0
+    assert found[2].pass_rate < 0.1
+    assert found[0].evaluations < len(SKEWED["a"])
+    assert all(statistics.cost > 0 for statistics in found)
+
+
+def test_statistics_of_compiled_expressions(monkeypatch):
+    monkeypatch.setattr(filter_, "COLUMNAR_MIN_ITEMS", len(SKEWED["a"]) + 1)
+    expression = ExtentedJsonPathParser().parse("$.a[?(@.size > 0 & @.type == 'bucket')]")
+
+    assert [statistics.evaluations for statistics in expression.right.statistics()] == [0, 0]
+    expression.find_values(SKEWED)
+
+    assert sum(statistics.evaluations for statistics in expression.right.statistics()) > 0
+
+
+def test_statistics_of_branches():
+    expression = ExtentedJsonPathParser().parse("$.a[?(@.size == '9' | @.type == 'bucket')]")
+    expression.find(SKEWED)
+
+    branches = expression.right.expressions[0]
+    found = statistics(branches)
+
+    assert [branch.expression for branch in found] == [*branches.left, *branches.right]
+    assert found[0].passes == 0
+    assert 0 < found[1].passes < found[1].evaluations
+    assert found[1].position == 0
+
+
+def test_expressions_which_may_raise_stay_in_place(monkeypatch):
+    # Tried first, `@.size > 0` raises on the list of the last item, which `@.type == 'bucket'`
+    # would skip if it were moved first
+    monkeypatch.setattr(filter_, "COLUMNAR_MIN_ITEMS", len(SKEWED["a"]) + 2)
+    data = {"a": [*SKEWED["a"], {"name": "item", "type": "queue", "size": [1]}]}
+    expression = ExtentedJsonPathParser().parse("$.a[?(@.size > 0 & @.type == 'bucket' & @.name != 'x')]")
+
+    for _ in range(3):
+        with pytest.raises(TypeError):
+            expression.find(data)
+        with pytest.raises(TypeError):
+            expression.find_values(data)
+    assert [statistics.position for statistics in expression.right.statistics()] == [0, 1, 2]
+
+
+@pytest.mark.parametrize(
+    "expression,expected",
+    [
+        ("@.type == 'bucket'", True),
+        ("@.type != 1.5", True),
+        ("@.Properties.Type", True),
+        ("@.type == 'a' | @.name", True),
+        ("@.size == 1", False),
+        ("@.size > 'a'", False),
+        ("@.name =~ 'x'", False),
+        ("@.tags[0].key == 'a'", False),
+        ("@.* == 'a'", False),
+        ("@.type == 'a' | @.size > 1", False),
+    ],
+)
+def test_never_raises(expression, expected):
+    assert filter_.never_raises(parse(f"$[?({expression})]").right.expressions[0]) is expected
+
+
+def test_statistics_are_shared_between_threads(monkeypatch):
+    monkeypatch.setattr(filter_, "COLUMNAR_MIN_ITEMS", len(SKEWED["a"]) + 1)
+    expression = ExtentedJsonPathParser().parse("$.a[?(@.type == 'bucket')]")
+    threads = [threading.Thread(target=lambda: [expression.find(SKEWED) for _ in range(5)]) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Every sampled item counted once
+    calls = 8 * 5 * len(SKEWED["a"])
+    sampled = filter_.WARMUP + sum(1 for call in range(filter_.WARMUP + 1, calls + 1) if call % filter_.SAMPLE_EVERY == 0)
+    assert expression.right.statistics()[0].evaluations == sampled
@@ -0,0 +1,97 @@
+"""
+PLY and the extension modules must only be imported when they are used,
+see `benchmarks/bench_import.py` for the import times.
+"""
+import subprocess
+import sys
+
+import pytest
+
+
+def imported_modules(code):
+    # `sys.modules` rather than `-X importtime`, which misses the submodules loaded by `importlib`
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys; print(*sys.modules)"], capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import bc_jsonpath_ng",
+        "import bc_jsonpath_ng.ext",
+        "from bc_jsonpath_ng import Child, Fields, Root; Child(Root(), Fields('foo')).find({'foo': 1})",
+    ],
+)
+def test_import_loads_neither_ply_nor_parser(code):
+    modules = imported_modules(code)
+
+    assert "bc_jsonpath_ng.jsonpath" in modules
+    assert not {"ply", "logging", "bc_jsonpath_ng.parser", "bc_jsonpath_ng.ext.parser"} & modules
+
+
+def test_descent_backend_does_not_load_ply():
+    modules = imported_modules(
+        "from bc_jsonpath_ng import parse; parse('$.foo', backend='descent');"
+        "from bc_jsonpath_ng.ext import parse; parse('$.foo[?(@.bar > 1)]', backend='descent')"
+    )
+
+    assert "bc_jsonpath_ng.ext.filter" in modules
+    assert not {module for module in modules if module.startswith("ply")}
+
+
+def test_ply_backend_loads_ply_on_first_parse():
+    modules = imported_modules("from bc_jsonpath_ng import parse; parse('$.foo')")
+
+    assert {"ply.lex", "ply.yacc"} <= modules
+
+
+def test_lazy_attributes():
+    import bc_jsonpath_ng
+    import bc_jsonpath_ng.ext
+    from bc_jsonpath_ng import jsonpath, lexer, parser
+    from bc_jsonpath_ng.ext.parser import parse as ext_parse
+    from bc_jsonpath_ng.parser import parse
+
+    assert bc_jsonpath_ng.parse is parse
+    assert bc_jsonpath_ng.ext.parse is ext_parse
+    assert jsonpath.logger.name == "bc_jsonpath_ng.jsonpath"
+    assert lexer.logger.name == "bc_jsonpath_ng.lexer"
+    assert parser.logger.name == "bc_jsonpath_ng.parser"
+    with pytest.raises(AttributeError):
+        bc_jsonpath_ng.missing  # noqa: B018
+
+
+def test_submodules_are_attributes():
+    # In a new interpreter, where nothing has imported the submodules yet
+    code = (
+        "import bc_jsonpath_ng, bc_jsonpath_ng.ext\n"
+        "for name in ('parser', 'lexer', 'exceptions', 'jsonpath'):\n"
+        "    assert getattr(bc_jsonpath_ng, name).__name__ == f'bc_jsonpath_ng.{name}'\n"
+        "    assert name in dir(bc_jsonpath_ng)\n"
+        "for name in ('parser', 'filter', 'iterable', 'arithmetic', 'string'):\n"
+        "    assert getattr(bc_jsonpath_ng.ext, name).__name__ == f'bc_jsonpath_ng.ext.{name}'\n"
+        "    assert name in dir(bc_jsonpath_ng.ext)\n"
+    )
+
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_lazy_attributes_are_listed():
+    import bc_jsonpath_ng
+    import bc_jsonpath_ng.ext
+
+    assert {"parse", "parse_many", "Child", "Fields"} <= set(dir(bc_jsonpath_ng))
+    assert "parse" in dir(bc_jsonpath_ng.ext)
+    assert all(hasattr(bc_jsonpath_ng, name) for name in bc_jsonpath_ng.__all__)
+
+
+def test_star_import_includes_the_lazy_attributes():
+    namespace = {}
+    exec("from bc_jsonpath_ng import *", namespace)  # noqa: S102
+    ext_namespace = {}
+    exec("from bc_jsonpath_ng.ext import *", ext_namespace)  # noqa: S102
+
+    assert {"parse", "parse_many", "Child", "DatumInContext"} <= set(namespace)
+    assert "parse" in ext_namespace
@@ -0,0 +1,131 @@
+"""
+With the document indexed, `..` must find the same matches as without: same values,
+paths and contexts, in the same order.
+"""
+import pytest
+
+from bc_jsonpath_ng import index
+from bc_jsonpath_ng.ext.descent import ExtendedJsonPathDescentParser
+from bc_jsonpath_ng.index import DocumentIndex, get_index, index_document, invalidate
+from tests.test_backends import dump
+from tests.test_optimizer import CASES, auto_id_field  # noqa: F401
+
+
+def matches(found):
+    return [(match.value, str(match.full_path), dump(match.path), dump(match.context)) for match in found]
+
+
+def outcome(fn):
+    try:
+        return fn()
+    except Exception as e:
+        return type(e)
+
+
+def results(expression, data):
+    return [
+        outcome(lambda: matches(expression.find(data))),
+        outcome(lambda: matches(expression.ifind(data))),
+        outcome(lambda: matches(expression.compile(paths=True)(data))),
+        outcome(lambda: expression.find_values(data)),
+        outcome(lambda: expression.find_paths(data)),
+    ]
+
+
+@pytest.fixture(autouse=True)
+def no_indexes():
+    invalidate()
+    yield
+    invalidate()
+
+
+def test_same_matches(auto_id_field):  # noqa: F811
+    checked = 0
+    for query, data in CASES:
+        try:
+            expression = ExtendedJsonPathDescentParser().parse(query)
+        except Exception:  # noqa: S112
+            continue
+        expected = results(expression, data)
+        index_document(data)
+        assert results(expression, data) == expected, query
+        invalidate(data)
+        checked += 1
+    assert checked > 1000
+
+
+DOCUMENT = {
+    "Resources": {
+        "Bucket": {"Type": "AWS::S3::Bucket", "Properties": {"Tags": [{"Key": "env", "Value": "prod"}]}},
+        "Queue": {"Type": "AWS::SQS::Queue", "Properties": {"Tags": [{"Value": "x", "Key": "team"}]}},
+    },
+    "Key": "top",
+}
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["$..Key", "$..Key,Value", "$.Resources..Key", "$.Resources.Queue..Key", "$..Tags[0]..Key", "$..missing"],
+)
+def test_queries_use_the_index(query, monkeypatch):
+    expression = ExtendedJsonPathDescentParser().parse(query)
+    expected = matches(expression.find(DOCUMENT))
+    index_document(DOCUMENT)
+    monkeypatch.setattr(index, "_children", None)
+
+    def no_walk(*args):
+        raise AssertionError("walked")
+
+    monkeypatch.setattr("bc_jsonpath_ng.jsonpath._preorder", no_walk)
+    monkeypatch.setattr("bc_jsonpath_ng.compiler._preorder", no_walk)
+
+    assert matches(expression.find(DOCUMENT)) == expected
+    assert expression.find_values(DOCUMENT) == [value for value, *_ in expected]
+
+
+def test_index():
+    document_index = index_document(DOCUMENT)
+
+    assert index_document(DOCUMENT) is document_index
+    assert get_index(DOCUMENT) is document_index
+    assert get_index(dict(DOCUMENT)) is None
+    assert len(document_index) == 10
+    assert [match.value for match in document_index.find("Key")] == ["top", "env", "team"]
+    assert [str(match.full_path) for match in document_index.find("Type")] == [
+        "Resources.Bucket.Type",
+        "Resources.Queue.Type",
+    ]
+
+
+def test_invalidate():
+    data = {"a": {"b": 1}}
+    expression = ExtendedJsonPathDescentParser().parse("$..b")
+    index_document(data)
+
+    # Values are read from the document, its structure from the index
+    data["a"]["b"] = 2
+    data["c"] = {"b": 3}
+    assert expression.find_values(data) == [2]
+
+    assert invalidate(data) == 1
+    assert invalidate(data) == 0
+    assert expression.find_values(data) == [2, 3]
+
+
+def test_oldest_indexes_are_dropped(monkeypatch):
+    monkeypatch.setattr(index, "MAX_INDEXES", 2)
+    documents = [{"a": i} for i in range(3)]
+    for document in documents:
+        index_document(document)
+
+    assert [get_index(document) is not None for document in documents] == [False, True, True]
+    assert invalidate() == 2
+
+
+def test_deep_documents():
+    data = leaf = {}
+    for i in range(10_000):
+        leaf["x"], leaf["a"] = i, {}
+        leaf = leaf["a"]
+
+    assert len(DocumentIndex(data).find("x")) == 10_000
@@ -48,6 +48,21 @@ class TestDatumInContext(unittest.TestCase):
             path=Fields("foo"), context=DatumInContext("whatever").in_context(path=Fields("baz"), context="whatever")
         )
 
+    def test_DatumInContext_is_slotted(self):  # noqa: N802
+        assert not hasattr(DatumInContext(3), "__dict__")
+        assert not hasattr(jsonpath.AutoIdForDatum(DatumInContext(3)), "__dict__")
+
+    def test_paths_are_shared_between_matches(self):
+        found = parse("$.foo[*].bar").find({"foo": [{"bar": 1}, {"bar": 2}]})
+        other = parse("$.foo[*].bar").find({"foo": [{"bar": 3}, {"bar": 4}]})
+
+        assert [match.path for match in found] == [Fields("bar"), Fields("bar")]
+        assert found[0].path is found[1].path
+        assert found[0].context.path is other[0].context.path
+        assert found[0].context.context.context.path is jsonpath.ROOT
+        assert str(jsonpath.field_path(1)) == "1"
+        assert str(jsonpath.field_path(True)) == "True"
+
     # def test_AutoIdForDatum_pseudopath(self):
     #     assert AutoIdForDatum(DatumInContext(value=3, path=Fields('foo')), id_field='id').pseudopath == Fields('foo')
     #     assert AutoIdForDatum(DatumInContext(value={'id': 'bizzle'}, path=Fields('foo')), id_field='id').pseudopath == Fields('bizzle')
@@ -384,6 +399,24 @@ class TestJsonPath(unittest.TestCase):
             ]
         )
 
+    def test_descendants_of_deep_documents(self):
+        depth = 10_000
+        data = leaf = {}
+        for i in range(depth):
+            # Alternate dicts and lists
+            child = {}
+            leaf["x"], leaf["a"] = i, [child] if i % 2 else child
+            leaf = child
+        expression = parse("$..x")
+
+        assert [match.value for match in expression.find(data)] == list(range(depth))
+        assert [match.value for match in expression.ifind(data)] == list(range(depth))
+        assert expression.find_values(data) == list(range(depth))
+        expression.filter(lambda x: x % 2, data)
+        assert expression.find_values(data) == list(range(0, depth, 2))
+        expression.update(data, 1)
+        assert expression.find_values(data) == [1] * (depth // 2)
+
     def test_update_index(self):
         self.check_update_cases([(["foo", "bar", "baz"], "[0]", "test", ["test", "bar", "baz"])])
 
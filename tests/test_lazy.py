@@ -0,0 +1,90 @@
+"""
+`ifind()` must yield the matches of `find()`, and `first()` and `exists()` agree with
+them, while only looking at the part of the document they need.
+"""
+import pytest
+
+from bc_jsonpath_ng.ext.descent import ExtendedJsonPathDescentParser
+from tests.test_backends import dump
+from tests.test_optimizer import CASES, auto_id_field  # noqa: F401
+
+
+def matches(found):
+    return [(match.value, str(match.full_path), dump(match.path), dump(match.context)) for match in found]
+
+
+def outcome(fn):
+    try:
+        return fn()
+    except Exception as e:
+        return type(e)
+
+
+def test_same_matches(auto_id_field):  # noqa: F811
+    checked = 0
+    for query, data in CASES:
+        try:
+            expression = ExtendedJsonPathDescentParser().parse(query)
+        except Exception:  # noqa: S112
+            continue
+        for expression in (expression, expression.optimize()):  # noqa: B020
+            expected = outcome(lambda: matches(expression.find(data)))  # noqa: B023
+            assert outcome(lambda: matches(expression.ifind(data))) == expected, query  # noqa: B023
+            if isinstance(expected, list):
+                assert expression.exists(data) is bool(expected), query
+                first = expression.first(data)
+                assert (matches([first]) if expected else first) == (expected[:1] or None), query
+            checked += 1
+    assert checked > 1000
+
+
+class Untouchable(dict):
+    def get(self, *args):
+        raise AssertionError("looked at")
+
+    def __iter__(self):
+        raise AssertionError("looked at")
+
+
+DOCUMENT = {
+    "Resources": {
+        "Bucket": {"Type": "AWS::S3::Bucket", "Properties": {"Tags": [{"Key": "env"}]}},
+        "Other": Untouchable(),
+    }
+}
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("$.Resources.*.Type", "AWS::S3::Bucket"),
+        ("$.Resources.*.Properties.Tags[*].Key", "env"),
+        ("$.Resources.*[?(@.Type == 'AWS::S3::Bucket')].Type", "AWS::S3::Bucket"),
+        ("$..Key", "env"),
+        ("$..Tags[0].Key", "env"),
+    ],
+)
+def test_first_stops_at_the_first_match(query, expected):
+    expression = ExtendedJsonPathDescentParser().parse(query)
+
+    assert expression.first(DOCUMENT).value == expected
+    assert expression.exists(DOCUMENT)
+    with pytest.raises(AssertionError, match="looked at"):
+        expression.find(DOCUMENT)
+
+
+def test_filters_stop_at_the_first_match():
+    # Only the first tag is needed to tell the bucket has tags
+    data = {"Resources": [{"Tags": [{"Key": "env"}, Untouchable()]}]}
+
+    found = ExtendedJsonPathDescentParser().parse("$.Resources[?(@.Tags[*].Key)]").find(data)
+
+    assert [match.value for match in found] == data["Resources"]
+
+
+def test_no_match():
+    expression = ExtendedJsonPathDescentParser().parse("$.foo[*].bar")
+
+    assert expression.first({"foo": []}) is None
+    assert not expression.exists({"foo": []})
+    assert list(expression.ifind({})) == []
@@ -1,8 +1,10 @@
 import logging
 import unittest
 
+import ply.lex
 from ply.lex import LexToken
 
+from bc_jsonpath_ng.ext.parser import ExtendedJsonPathLexer
 from bc_jsonpath_ng.lexer import JsonPathLexer, JsonPathLexerError
 
 
@@ -67,3 +69,38 @@ class TestLexer(unittest.TestCase):
         self.assertRaises(JsonPathLexerError, tokenize, "'`")
         self.assertRaises(JsonPathLexerError, tokenize, "?")
         self.assertRaises(JsonPathLexerError, tokenize, "$.foo.bar.#")
+
+    def test_reused_lexer_matches_fresh_lexer(self):
+        def fresh_tokens(lexer, s):
+            new_lexer = ply.lex.lex(module=lexer)
+            new_lexer.latest_newline = 0
+            new_lexer.string_value = None
+            new_lexer.input(s)
+            return [
+                (t.type, t.value, t.lineno, t.lexpos, t.lexpos - new_lexer.latest_newline)
+                for t in iter(new_lexer.token, None)
+            ]
+
+        cases = [
+            (JsonPathLexer, '$.foo..\'bar baz\'."qu\\"x"[0:2].`parent` where a'),
+            (JsonPathLexer, "foo\n  .bar\n.`this`"),
+            (ExtendedJsonPathLexer, "$.objects[?(@.cow>5 & @.cat=='x')][\\cow, /cat].`len`"),
+        ]
+        for lexer_class, s in cases:
+            lexer = lexer_class()
+            tokens = [(t.type, t.value, t.lineno, t.lexpos, t.col) for t in lexer.tokenize(s)]
+            assert tokens == fresh_tokens(lexer, s)
+            # and again, with the same instance
+            assert tokens == [(t.type, t.value, t.lineno, t.lexpos, t.col) for t in lexer.tokenize(s)]
+
+    def test_failed_tokenize_does_not_leak_state(self):
+        lexer = JsonPathLexer()
+        self.assertRaises(JsonPathLexerError, list, lexer.tokenize("'unterminated"))
+        self.assertRaises(JsonPathLexerError, list, lexer.tokenize("`this"))
+        assert [t.type for t in lexer.tokenize("foo.bar")] == ["ID", ".", "ID"]
+
+    def test_new_lexer_returns_independent_clones(self):
+        first, second = JsonPathLexer().new_lexer(), JsonPathLexer().new_lexer()
+        assert first is not second
+        assert first.lexre is second.lexre
+        assert first.lexstatestack is not second.lexstatestack
@@ -0,0 +1,123 @@
+"""
+The optimized AST must find the same matches as the parsed one: same values, same
+paths and same contexts. The queries are the (query, data) cases of `test_jsonpath_rw_ext`
+and every expression of the test suite run against a few documents.
+"""
+import ast
+import pathlib
+
+import pytest
+
+from bc_jsonpath_ng import jsonpath
+from bc_jsonpath_ng.ext.arithmetic import Constant, Operation
+from bc_jsonpath_ng.ext.descent import ExtendedJsonPathDescentParser
+from bc_jsonpath_ng.jsonpath import Child, Fields, FlatUnion, Index, Root, StaticPath, This
+from bc_jsonpath_ng.optimizer import optimize
+from tests.test_backends import GRAMMAR_CASES, dump, suite_literals
+
+
+def ext_cases():
+    cases = []
+    module = ast.parse(pathlib.Path(__file__).with_name("test_jsonpath_rw_ext.py").read_text())
+    for node in ast.walk(module):
+        if (
+            isinstance(node, ast.Call)
+            and node.args
+            and isinstance(node.args[0], ast.Constant)
+            and node.args[0].value == "query,data,expected"
+        ):
+            cases.extend((query, data) for query, data, _ in ast.literal_eval(node.args[1]))
+    return cases
+
+
+DOCUMENTS = [
+    {
+        "a": {"b": {"c": [{"d": 1}, {"d": 2, "id": "x"}]}, "id": "y"},
+        "foo": [{"baz": 1, "bar": {"bizzle": 3}}, {"baz": 2, "id": "z"}],
+        "objects": [{"cow": 2, "cat": "moo"}, {"cow": 1}],
+        "price": 2,
+        "quantity": [3, 4],
+    },
+    [1, [2, 3], {"foo": {"bar": 1}}],
+    "foo",
+    None,
+]
+
+CASES = ext_cases() + [
+    (query, document) for query in sorted(set(suite_literals() + GRAMMAR_CASES)) for document in DOCUMENTS
+]
+
+
+def outcome(expression, data):
+    try:
+        return [(match.value, str(match.full_path), dump(match.path)) for match in expression.find(data)]
+    except Exception as e:
+        return type(e)
+
+
+@pytest.fixture(params=[None, "id"], ids=["no-auto-id", "auto-id"])
+def auto_id_field(request):
+    jsonpath.auto_id_field = request.param
+    yield request.param
+    jsonpath.auto_id_field = None
+
+
+def test_same_matches(auto_id_field):
+    checked = 0
+    for query, data in CASES:
+        try:
+            expression = ExtendedJsonPathDescentParser().parse(query)
+        except Exception:  # noqa: S112
+            continue
+        before = dump(expression)
+        assert outcome(optimize(expression), data) == outcome(expression, data), query
+        # The parsed AST is left as it is
+        assert dump(expression) == before
+        checked += 1
+    assert checked > 500
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["@.`sorted`", "@[\\a]", "@[/a]", "@.`sorted`[1]", "@.@.`sorted`", "@.`len`", "@.a.`len`", "@.a[/b].`len`"],
+)
+@pytest.mark.parametrize("data", [[3, 1], [{"a": 2, "b": 1}, {"a": 1}], {"a": [{"b": 2}, {"b": 1}]}, "abc"])
+def test_same_matches_with_sorted_and_len(query, data):
+    # `SortedThis` reads `datum.value`, the leading `This` wraps the raw document for it
+    expression = ExtendedJsonPathDescentParser().parse(query)
+    assert outcome(optimize(expression), data) == outcome(expression, data)
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("$.a.b.c[0].d", Child(Root(), StaticPath(Fields("a"), Fields("b"), Fields("c"), Index(0), Fields("d")))),
+        ("a.b", StaticPath(Fields("a"), Fields("b"))),
+        ("a.*.b.c", Child(Child(Fields("a"), Fields("*")), StaticPath(Fields("b"), Fields("c")))),
+        ("@.a.`this`.b", StaticPath(Fields("a"), Fields("b"))),
+        ("a.`this`", Child(Fields("a"), This())),
+        ("a | b | c", FlatUnion(Fields("a"), Fields("b"), Fields("c"))),
+        ("1 + 2 * 3", Constant(7)),
+        ("'a' - 1", Constant()),
+    ],
+)
+def test_rewrites(query, expected):
+    assert optimize(ExtendedJsonPathDescentParser().parse(query)) == expected
+
+
+def test_division_by_zero_is_not_folded():
+    # `/` always lexes as a sort direction, the operation can only be built by hand
+    expression = optimize(Operation(1, "/", 0))
+
+    with pytest.raises(ZeroDivisionError):
+        expression.find({})
+
+
+def test_static_path_update_and_filter():
+    expression = optimize(ExtendedJsonPathDescentParser().parse("a.b[1].c"))
+    assert isinstance(expression, StaticPath)
+
+    assert expression.update({"a": {"b": [{}, {"c": 1}]}}, 2) == {"a": {"b": [{}, {"c": 2}]}}
+    assert expression.update_or_create({}, 3) == {"a": {"b": [{}, {"c": 3}]}}
+    assert expression.filter(lambda value: value == 1, {"a": {"b": [{}, {"c": 1}]}}) == {"a": {"b": [{}, {}]}}
+    assert str(expression) == "a.b.[1].c"
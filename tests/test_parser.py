@@ -1,11 +1,23 @@
+import importlib
 import logging
 import unittest
 
-from bc_jsonpath_ng.jsonpath import Child, Descendants, Fields, Index, Slice, Where
+import ply.yacc
+
+from bc_jsonpath_ng.ext.parser import ExtentedJsonPathParser
+from bc_jsonpath_ng.jsonpath import Child, Descendants, Fields, Index, Root, Slice, This, Where
 from bc_jsonpath_ng.lexer import JsonPathLexer
 from bc_jsonpath_ng.parser import JsonPathParser
 
 
+class RootIsThisParser(JsonPathParser):
+    """A grammar whose root production builds `This()` instead of `Root()`"""
+
+    def p_jsonpath_root(self, p):
+        "jsonpath : '$'"
+        p[0] = This()
+
+
 class TestParser(unittest.TestCase):
     # TODO: This will be much more effective with a few regression tests and `arbitrary` parse . pretty testing
 
@@ -47,3 +59,23 @@ class TestParser(unittest.TestCase):
                 ("foo..baz.bing", Descendants(Fields("foo"), Child(Fields("baz"), Fields("bing")))),
             ]
         )
+
+    def test_prebuilt_tables_are_current(self):
+        # Regenerate with `make tables` when this fails
+        for parser_class in (JsonPathParser, ExtentedJsonPathParser):
+            parser = parser_class()
+            pdict = {name: getattr(parser, name) for name in dir(parser)}
+            pdict["start"] = "jsonpath"
+            pinfo = ply.yacc.ParserReflect(pdict)
+            pinfo.get_all()
+
+            tables = importlib.import_module(parser_class.table_module())
+            assert tables._lr_signature == pinfo.signature()
+
+    def test_tables_are_keyed_by_class(self):
+        assert RootIsThisParser.table_module() != JsonPathParser.table_module()
+        assert RootIsThisParser().lr_parser() is not JsonPathParser().lr_parser()
+        assert RootIsThisParser().lr_parser() is RootIsThisParser().lr_parser()
+
+        assert RootIsThisParser().parse("$.foo") == Child(This(), Fields("foo"))
+        assert JsonPathParser().parse("$.foo") == Child(Root(), Fields("foo"))
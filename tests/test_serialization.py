@@ -0,0 +1,141 @@
+import copy
+import marshal
+import pickle
+
+import pytest
+
+from bc_jsonpath_ng.exceptions import JsonPathSerializationError
+from bc_jsonpath_ng.ext.descent import ExtendedJsonPathDescentParser
+from bc_jsonpath_ng.ext.filter import Expression, Filter
+from bc_jsonpath_ng.ext.parser import ExtentedJsonPathParser
+from bc_jsonpath_ng.jsonpath import Child, Fields, Index, JSONPath, Root
+from bc_jsonpath_ng.optimizer import optimize
+from bc_jsonpath_ng.serialization import FORMAT_VERSION, MAGIC, NODE_CLASSES, from_bytes, is_serializable, to_bytes
+from tests.test_backends import GRAMMAR_CASES, dump, suite_literals
+
+
+def parseable(strings):
+    expressions = []
+    for string in strings:
+        try:
+            expressions.append(ExtendedJsonPathDescentParser().parse(string))
+        except Exception:  # noqa: S112
+            continue
+    return expressions
+
+
+EXPRESSIONS = parseable(suite_literals() + GRAMMAR_CASES)
+EXPRESSIONS += [optimize(expression) for expression in EXPRESSIONS]
+
+
+class Custom(JSONPath):
+    def __init__(self, name):
+        self.name = name
+
+    def __eq__(self, other):
+        return isinstance(other, Custom) and self.name == other.name
+
+
+def test_every_node_class_is_covered():
+    seen = set()
+
+    def walk(node):
+        if isinstance(node, (list, tuple)):
+            for item in node:
+                walk(item)
+        elif isinstance(node, JSONPath):
+            seen.add(type(node))
+            for value in vars(node).values():
+                walk(value)
+
+    walk(EXPRESSIONS)
+    assert seen == set(NODE_CLASSES)
+
+
+@pytest.mark.parametrize("expression", EXPRESSIONS, ids=str)
+def test_round_trip(expression):
+    data = to_bytes(expression)
+
+    assert data.startswith(MAGIC + bytes([FORMAT_VERSION]))
+    assert dump(from_bytes(data)) == dump(expression)
+    assert dump(JSONPath.from_bytes(expression.to_bytes())) == dump(expression)
+    assert dump(pickle.loads(pickle.dumps(expression))) == dump(expression)  # noqa: S301
+    assert dump(copy.deepcopy(expression)) == dump(expression)
+
+
+def test_pickle_payload_is_compact():
+    expression = ExtentedJsonPathParser().parse("$.Resources[?(@.Type == 'AWS::S3::Bucket')].Properties[/name]")
+
+    payload = pickle.dumps(expression)
+
+    assert len(payload) < len(to_bytes(expression)) + 100
+    assert b"Operation" not in payload
+    assert b"Fields" not in payload
+
+
+@pytest.mark.parametrize(
+    "string,data,expected",
+    [
+        ("$.a * 2", {"a": 3}, [6]),
+        ("$.a - $.b", {"a": 3, "b": 1}, [2]),
+        ("$.b.`sub(/x+/, y)`", {"b": "axxb"}, ["ayb"]),
+        ("$.a[?(@.b =~ 'x+')].b", {"a": [{"b": "x"}, {"b": "y"}]}, ["x"]),
+    ],
+)
+def test_operations_and_regexes_are_rebuilt(string, data, expected):
+    expression = from_bytes(to_bytes(ExtentedJsonPathParser().parse(string)))
+
+    assert [match.value for match in expression.find(data)] == expected
+
+
+def test_unknown_nodes():
+    expression = Child(Root(), Custom("x"))
+
+    with pytest.raises(JsonPathSerializationError, match="Cannot serialize tests.test_serialization.Custom nodes"):
+        to_bytes(expression)
+    # Pickling falls back to the default protocol
+    assert pickle.loads(pickle.dumps(expression)) == expression  # noqa: S301
+    assert pickle.loads(pickle.dumps(Custom("y"))) == Custom("y")  # noqa: S301
+
+
+@pytest.mark.parametrize(
+    "data,error",
+    [
+        (b"nope", "Not a serialized JSONPath expression"),
+        (MAGIC + bytes([FORMAT_VERSION + 1]), "Unsupported serialization format version"),
+        (to_bytes(Fields("foo"))[:-3], "Corrupted serialized JSONPath expression"),
+        (MAGIC, "Corrupted serialized JSONPath expression: no format version"),
+        (MAGIC + bytes([FORMAT_VERSION]) + marshal.dumps((len(NODE_CLASSES),)), "unknown node"),
+        (MAGIC + bytes([FORMAT_VERSION]) + marshal.dumps((-1, 1)), "unknown node"),
+        (MAGIC + bytes([FORMAT_VERSION]) + marshal.dumps(()), "unknown node"),
+        (MAGIC + bytes([FORMAT_VERSION]) + marshal.dumps((NODE_CLASSES.index(Child), (0,))), "IndexError"),
+        (MAGIC + bytes([FORMAT_VERSION]) + marshal.dumps((NODE_CLASSES.index(Index),)), "IndexError"),
+    ],
+)
+def test_invalid_data(data, error):
+    with pytest.raises(JsonPathSerializationError, match=error):
+        from_bytes(data)
+
+
+def test_copies_do_not_serialize():
+    expression = ExtentedJsonPathParser().parse("$.a[?(@.b == 1)].c")
+    shallow = copy.copy(expression)
+
+    assert shallow == expression and shallow is not expression
+    assert shallow.left is expression.left
+    assert dump(copy.deepcopy(expression)) == dump(expression)
+    assert copy.deepcopy(expression).left is not expression.left
+
+
+def test_copies_of_unknown_nodes():
+    expression = Child(Root(), Custom("x"))
+
+    assert copy.copy(expression).right is expression.right
+    assert copy.deepcopy(expression) == expression
+
+
+def test_is_serializable():
+    assert is_serializable(ExtentedJsonPathParser().parse("$.a[?(@.b == 1)][/c]"))
+    assert not is_serializable(Custom("x"))
+    assert not is_serializable(Child(Root(), Custom("x")))
+    assert not is_serializable(Filter([Expression(Custom("x"), "==", 1)]))
@@ -0,0 +1,154 @@
+"""
+Sorting with the fields found once per item must give the order of comparing the
+items field by field.
+"""
+import functools
+import random
+
+import pytest
+
+from bc_jsonpath_ng.ext import iterable
+from bc_jsonpath_ng.ext.parser import ExtentedJsonPathParser
+from bc_jsonpath_ng.jsonpath import DatumInContext
+
+
+def reference(expressions, items):
+    # The comparison of the fields of each pair of items, as `SortedThis` did
+    def compare(left, right):
+        for field, reverse in expressions:
+            l_datum = field.find(DatumInContext.wrap(left))
+            r_datum = field.find(DatumInContext.wrap(right))
+            if (
+                not l_datum
+                or not r_datum
+                or len(l_datum) > 1
+                or len(r_datum) > 1
+                or l_datum[0].value == r_datum[0].value
+            ):
+                continue
+            elif l_datum[0].value < r_datum[0].value:
+                return 1 if reverse else -1
+            else:
+                return -1 if reverse else 1
+        return 0
+
+    return sorted(items, key=functools.cmp_to_key(compare))
+
+
+def outcome(fn):
+    try:
+        return fn()
+    except Exception as e:
+        return type(e)
+
+
+def items(seed, values):
+    rng = random.Random(seed)
+    found = []
+    for i in range(300):
+        item = {"id": i}
+        for key in ("a", "b"):
+            if rng.random() < 0.9:
+                item[key] = rng.choice(values)
+        if rng.random() < 0.05:
+            item["c"] = [{"d": 1}, {"d": 2}]
+        found.append(item)
+    return found
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [1, 2, 3, 2.5, True],
+        ["x", "y", "z", ""],
+        [1, "x"],
+        [1.0, float("nan"), 2],
+        [[1], [2], [0, 1]],
+    ],
+    ids=["numbers", "strings", "mixed", "nan", "lists"],
+)
+@pytest.mark.parametrize(
+    "query",
+    ["$[/a]", "$[\\a]", "$[/a,\\b]", "$[\\b,/a]", "$[/a,/b]", "$[/c[*].d,\\a]", "$[/x,/a]"],
+)
+@pytest.mark.parametrize("complete", [True, False])
+def test_same_order(query, values, complete):
+    data = items(f"{query} {complete}", values)
+    if complete:
+        data = [item for item in data if "a" in item and "b" in item]
+    expression = ExtentedJsonPathParser().parse(query)
+    sort = expression.right
+
+    expected = outcome(lambda: reference(sort.expressions, data))
+
+    assert outcome(lambda: expression.find(data)[0].value) == expected
+
+
+@pytest.mark.parametrize(
+    "values", [[1, 2, 3, 2.5, True], ["x", "y", "z", ""], [1, "x"]], ids=["numbers", "strings", "mixed"]
+)
+@pytest.mark.parametrize(
+    "query",
+    [
+        "$[/a][0:10]",
+        "$[\\a][0:10]",
+        "$[\\a][3]",
+        "$[/a,\\b][:5]",
+        "$[\\a,\\b][2:7]",
+        "$[/a,/b][1:20]",
+        "$[/x,/a][0]",
+        "$[\\a][-1]",
+        "$[\\a][5:]",
+        "$.`sorted`[0:3]",
+    ],
+)
+@pytest.mark.parametrize("complete", [True, False])
+def test_top_matches(monkeypatch, query, values, complete):
+    data = items(f"{query} {complete}", values)
+    if complete:
+        data = [item for item in data if "a" in item and "b" in item]
+    if "sorted" in query:
+        data = [item.get("a", 0) for item in data]
+    expression = ExtentedJsonPathParser().parse(query)
+
+    monkeypatch.setattr(iterable, "TOP_RATIO", 10**9)
+    expected = outcome(lambda: [(match.value, str(match.full_path)) for match in expression.find(data)])
+    monkeypatch.setattr(iterable, "TOP_RATIO", 1)
+
+    assert outcome(lambda: [(match.value, str(match.full_path)) for match in expression.find(data)]) == expected
+    assert outcome(lambda: [(match.value, str(match.full_path)) for match in expression.ifind(data)]) == expected
+
+
+def test_top_selects_the_first_items(monkeypatch):
+    monkeypatch.setattr(iterable, "TOP_RATIO", 1)
+    data = [{"a": i % 10, "b": i} for i in range(100)]
+
+    found = ExtentedJsonPathParser().parse("$[/a,\\b][0:3]").find(data)
+
+    assert [match.value["b"] for match in found] == [90, 80, 70]
+    # The context is still the whole sorted list
+    assert len(found[0].context.value) == 100
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "$.a[\\b][0].`parent`",
+        "$.a[/b][0:2]",
+        "$.a[/b][1]",
+        "$.a[\\b, /c][0]",
+    ],
+)
+def test_top_matches_have_the_sorted_list_as_context(monkeypatch, query):
+    data = {"a": [{"b": i % 10, "c": i} for i in range(100)]}
+    expression = ExtentedJsonPathParser().parse(query)
+
+    def contexts(matches):
+        return [(match.value, match.context and match.context.value, str(match.full_path)) for match in matches]
+
+    monkeypatch.setattr(iterable, "TOP_RATIO", 10**9)
+    expected = contexts(expression.find(data))
+    monkeypatch.setattr(iterable, "TOP_RATIO", 1)
+
+    assert contexts(expression.find(data)) == expected
+    assert contexts(expression.ifind(data)) == expected
@@ -0,0 +1,208 @@
+"""
+Streaming must find the matches of `find()` on the loaded document, with the paths of
+`find_paths()`, whatever the size of the chunks read.
+"""
+import io
+import json
+
+import pytest
+
+from bc_jsonpath_ng import jsonpath, stream
+from bc_jsonpath_ng.exceptions import JsonPathStreamError
+from bc_jsonpath_ng.ext.descent import ExtendedJsonPathDescentParser
+from bc_jsonpath_ng.ext.parser import ExtentedJsonPathParser
+from tests.test_optimizer import CASES
+
+DOCUMENT = {
+    "a": [{"b": 1, "c": 'xé\n"y"'}, {"b": 2.5e-3, "c": None}, {"b": -3, "d": [True, False, {}]}],
+    "e": {"f": {"b": {"b": 4}}, "g": []},
+    "h": "",
+}
+
+
+def matches(found):
+    # Paths may mix indices and keys at the same position, `$..*[?(@.a)]` wraps objects in lists
+    return sorted(((tuple(path), json.dumps(value, sort_keys=True)) for path, value in found), key=repr)
+
+
+def outcome(fn):
+    try:
+        return fn()
+    except Exception:
+        return Exception
+
+
+def loaded(expression, data):
+    return matches(zip(expression.find_paths(data), expression.find_values(data)))
+
+
+def streamed(expression, text, chunk_size=stream.CHUNK_SIZE):
+    return matches(stream.find(expression, io.StringIO(text), chunk_size))
+
+
+def test_same_matches():
+    checked = 0
+    for query, data in CASES:
+        try:
+            expression = ExtendedJsonPathDescentParser().parse(query)
+            text = json.dumps(data)
+            stream.find(expression, io.StringIO(text))
+        except Exception:  # noqa: S112
+            continue
+        data = json.loads(text)
+        expected = outcome(lambda: loaded(expression, data))  # noqa: B023
+        for chunk_size in (1, 7, stream.CHUNK_SIZE):
+            assert outcome(lambda: streamed(expression, text, chunk_size)) == expected, query  # noqa: B023
+        checked += 1
+    assert checked > 500
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "$",
+        "a",
+        "a,e",
+        "$.a[*].b",
+        "a[1]",
+        "a[1:]",
+        "a[0:3]",
+        "$..b",
+        "$..*",
+        "e..b",
+        "$.*[*].d[0]",
+        "a[?(@.b > 0)].c",
+        "a[?(!@.d)]",
+        "$..*[?(@.b)]",
+        "e[?(@.b)]",
+        "h[0]",
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 3, 64])
+@pytest.mark.parametrize("binary", [False, True], ids=["text", "binary"])
+def test_chunks(query, chunk_size, binary):
+    expression = ExtentedJsonPathParser().parse(query)
+    text = json.dumps(DOCUMENT, indent=1)
+    source = io.BytesIO(text.encode()) if binary else io.StringIO(text)
+
+    found = matches(stream.find(expression, source, chunk_size))
+
+    assert found == loaded(expression, DOCUMENT)
+
+
+def test_matches_in_the_order_they_end():
+    expression = ExtentedJsonPathParser().parse("$..b")
+    text = json.dumps(DOCUMENT)
+
+    assert [path for path, _ in stream.find(expression, io.StringIO(text))] == [
+        ("a", 0, "b"),
+        ("a", 1, "b"),
+        ("a", 2, "b"),
+        ("e", "f", "b", "b"),
+        ("e", "f", "b"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "query,data",
+    [
+        ("$.a[0]", {"a": {"b": 1}}),
+        # The outer `c` is tested before the inner one, which ends first
+        ("$..c[0]", {"c": {"c": 1, "a": {}}}),
+        ("$..c[0]", {"x": {"c": 1}, "c": {"a": 1}}),
+        ("$..c[0].a", {"x": {"c": {"b": 1}}, "c": 1}),
+        # All the items before the steps after them
+        ("$..c[*][0]", {"a": {"c": ["xy", {"c": 1, "a": {}}]}}),
+        ("$..a[?(@.b)].b[0]", {"a": [{"b": {"c": 1}, "a": [{"b": 1}]}]}),
+    ],
+)
+def test_same_errors(query, data):
+    expression = ExtentedJsonPathParser().parse(query)
+    with pytest.raises(Exception) as expected:
+        expression.find(data)
+
+    with pytest.raises(expected.type):
+        list(stream.find(expression, io.StringIO(json.dumps(data))))
+
+
+def test_values_and_literals():
+    text = '[1, -0, 1.5, 1E3, "\\u00e9\\\\", true, false, null, NaN, Infinity, -Infinity, {"a": [1]}]'
+    expected = json.loads(text)
+
+    for chunk_size in (1, 2, 1000):
+        values = list(stream.find_values(ExtentedJsonPathParser().parse("[*]"), io.StringIO(text), chunk_size))
+        assert json.dumps(values) == json.dumps(expected)
+        assert list(map(type, values)) == list(map(type, expected))
+
+
+def test_utf8_with_bom():
+    source = io.BytesIO('{"a": "é中"}'.encode("utf-8-sig"))
+
+    assert list(stream.find_values(ExtentedJsonPathParser().parse("a"), source, chunk_size=1)) == ["é中"]
+
+
+def test_deep_documents():
+    depth = 100_000
+    text = "[" * depth + '{"a": 1}' + "]" * depth
+
+    assert list(stream.find_values(ExtentedJsonPathParser().parse("$..a"), io.StringIO(text))) == [1]
+
+
+def test_repeated_keys():
+    text = '{"a": 1, "a": 2}'
+
+    assert list(stream.find(ExtentedJsonPathParser().parse("a"), io.StringIO(text))) == [(("a",), 1), (("a",), 2)]
+
+
+def test_skipped_values_are_not_built(monkeypatch):
+    built = []
+    monkeypatch.setattr(stream, "_add", lambda frame, value: built.append(value))
+    text = json.dumps({"a": [{"b": list(range(100))}], "c": 1})
+
+    assert list(stream.find_values(ExtentedJsonPathParser().parse("c"), io.StringIO(text))) == [1]
+    assert built == []
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "[1, 2",
+        "[1 2]",
+        '{"a": 1,}',
+        '{"a" 1}',
+        "{1: 2}",
+        '"abc',
+        '"a\\x"',
+        '"a\x01"',
+        "[01]",
+        "[1.]",
+        "tru",
+        "[] []",
+    ],
+)
+def test_invalid_json(text):
+    with pytest.raises(json.JSONDecodeError):
+        json.loads(text)
+    with pytest.raises(JsonPathStreamError, match="at character"):
+        list(stream.find(ExtentedJsonPathParser().parse("$..*"), io.StringIO(text), chunk_size=2))
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["a.`parent`", "a[-1]", "a[:-1]", "a|b", "a.$", "a.`len`", "$.a[\\name]", "a[?(@.b)].`parent`"],
+)
+def test_unsupported_expressions(query):
+    expression = ExtentedJsonPathParser().parse(query)
+
+    with pytest.raises(JsonPathStreamError, match="cannot be evaluated on a stream|can only start"):
+        stream.find(expression, io.StringIO("{}"))
+
+
+def test_auto_ids_are_rejected():
+    jsonpath.auto_id_field = "id"
+    try:
+        with pytest.raises(JsonPathStreamError):
+            stream.find(ExtentedJsonPathParser().parse("a"), io.StringIO("{}"))
+    finally:
+        jsonpath.auto_id_field = None
@@ -0,0 +1,103 @@
+"""
+`PathTable.find()` must find the same matches as `find()` on the document: same values,
+paths and contexts, in the same order.
+"""
+import pytest
+
+from bc_jsonpath_ng.ext.descent import ExtendedJsonPathDescentParser
+from bc_jsonpath_ng.table import ARRAY, OBJECT, SCALAR, PathTable
+from tests.test_backends import dump
+from tests.test_optimizer import CASES, auto_id_field  # noqa: F401
+
+
+def matches(found):
+    return [(match.value, str(match.full_path), dump(match.path), dump(match.context)) for match in found]
+
+
+def outcome(fn):
+    try:
+        return fn()
+    except Exception as e:
+        return type(e)
+
+
+def test_same_matches(auto_id_field):  # noqa: F811
+    checked = 0
+    tables = {}
+    for query, data in CASES:
+        try:
+            expression = ExtendedJsonPathDescentParser().parse(query)
+        except Exception:  # noqa: S112
+            continue
+        table = tables.setdefault(id(data), PathTable(data))
+        for expression in (expression, expression.optimize()):  # noqa: B020
+            expected = outcome(lambda: matches(expression.find(data)))  # noqa: B023
+            assert outcome(lambda: matches(table.find(expression))) == expected, query  # noqa: B023
+            expected = outcome(lambda: [match.value for match in expression.find(data)])  # noqa: B023
+            assert outcome(lambda: table.find_values(expression)) == expected, query  # noqa: B023
+            checked += 1
+    assert checked > 1000
+
+
+DOCUMENT = {"a": [{"b": 1}, {"b": 2, "c": {"b": 3}}], "d": "x"}
+
+
+def test_columns():
+    table = PathTable(DOCUMENT)
+
+    assert len(table) == 9
+    assert list(table.parents) == [-1, 0, 1, 2, 1, 4, 4, 6, 0]
+    assert table.keys == [None, "a", 0, "b", 1, "b", "c", "b", "d"]
+    assert list(table.tags) == [OBJECT, ARRAY, OBJECT, SCALAR, OBJECT, SCALAR, OBJECT, SCALAR, SCALAR]
+    assert list(table.ends) == [9, 8, 4, 4, 8, 6, 8, 8, 9]
+    assert table.values[7] == 3
+    assert table.path(7) == ("a", 1, "c", "b")
+    assert str(table.datum(7).full_path) == "a.[1].c.b"
+    assert table.children(1) == [2, 4]
+    assert table.child(4, "c") == 6
+    assert table.rows_by_key("b") == [3, 5, 7]
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("$.a[*].b", [1, 2]),
+        ("$..b", [1, 2, 3]),
+        ("$.a[1]..b", [2, 3]),
+        ("$.a[?(@.b > 1)]..b", [2, 3]),
+        ("$.a[1].c.`parent`.b", [2]),
+        ("d", ["x"]),
+    ],
+)
+def test_find(query, expected):
+    expression = ExtendedJsonPathDescentParser().parse(query)
+
+    assert PathTable(DOCUMENT).find_values(expression) == expected
+    assert matches(PathTable(DOCUMENT).find(expression)) == matches(expression.find(DOCUMENT))
+
+
+@pytest.mark.parametrize(
+    "query,data,expected",
+    [
+        ("$.`parent`.b[0]", [], []),
+        ("$.`parent`.a[\\b][0].*", True, []),
+        ("$.a.`parent`.`parent`.x", {"a": 1}, []),
+        ("$.`parent`", [], [None]),
+    ],
+)
+def test_parent_of_the_document(query, data, expected):
+    # `Parent.find()` of the document returns [None], which the next steps get as they are
+    expression = ExtendedJsonPathDescentParser().parse(query)
+
+    assert PathTable(data).find(expression) == expression.find(data) == expected
+
+
+def test_deep_documents():
+    data = leaf = {}
+    for i in range(10_000):
+        leaf["x"], leaf["a"] = i, [{}]
+        leaf = leaf["a"][0]
+    table = PathTable(data)
+
+    assert table.find_values(ExtendedJsonPathDescentParser().parse("$..x")) == list(range(10_000))
+    assert len(table.find(ExtendedJsonPathDescentParser().parse("$..x"))) == 10_000
@@ -0,0 +1,72 @@
+"""
+Concurrent parsing: every thread parses with its own parser instance and LR parser,
+and concurrent parses build the same ASTs as sequential ones.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from bc_jsonpath_ng.cache import ExpressionCache, parser_for_thread
+from bc_jsonpath_ng.descent import JsonPathDescentParser
+from bc_jsonpath_ng.ext.descent import ExtendedJsonPathDescentParser
+from bc_jsonpath_ng.ext.parser import ExtentedJsonPathParser
+from bc_jsonpath_ng.parser import JsonPathParser
+from tests.test_backends import dump
+
+GRAMMARS = [JsonPathParser, ExtentedJsonPathParser, JsonPathDescentParser, ExtendedJsonPathDescentParser]
+
+EXPRESSIONS = [
+    expression
+    for i in range(150)
+    for expression in [
+        f"$.resource[{i}].aws_s3_bucket.*.versioning[0].enabled",
+        f"$..Properties.Tags[{i}:].Key where name{i}",
+        f"foo{i}.`parent`.'quoted {i}' | bar[*]",
+        f"foo.bar{i}.",  # a parse error
+    ]
+]
+
+
+def outcome(parser, args):
+    try:
+        return "ok", dump(parser.parse(*args))
+    except Exception as e:
+        return "error", type(e), str(e)
+
+
+@pytest.mark.parametrize("grammar", GRAMMARS, ids=lambda grammar: grammar.__name__)
+def test_concurrent_parses_match_sequential_parses(grammar):
+    expected = [outcome(grammar(), (expression,)) for expression in EXPRESSIONS]
+
+    cache = ExpressionCache(maxsize=0)
+    for threads in (4, 16):
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            thread_local = executor.map(lambda string: outcome(parser_for_thread(grammar), (string,)), EXPRESSIONS)
+            assert list(thread_local) == expected
+            cached = executor.map(lambda string: outcome(cache, (grammar, string)), EXPRESSIONS)
+            assert list(cached) == expected
+
+
+def test_parsers_are_reused_per_thread():
+    instances = {}
+    barrier = threading.Barrier(4)
+
+    def worker():
+        barrier.wait()
+        parser = parser_for_thread(JsonPathParser)
+        assert parser_for_thread(JsonPathParser) is parser
+        parser.parse("foo.bar")
+        instances[threading.get_ident()] = parser, parser.lr_parser()
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(instances) == 4
+    assert len({id(parser) for parser, _ in instances.values()}) == 4
+    assert len({id(lr_parser) for _, lr_parser in instances.values()}) == 4
+    # The tables are shared between the threads
+    assert len({id(lr_parser.action) for _, lr_parser in instances.values()}) == 1